@@ -0,0 +1,2 @@
+# [CONDUIT_INIT]
+from .broadcast_encoder import encode_for, encode_bytes, TARGETS
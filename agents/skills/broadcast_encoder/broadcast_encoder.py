@@ -0,0 +1,177 @@
+# [FILE_ID]: skills/BROADCAST_ENCODER // VERSION: 1.0 // STATUS: STABLE
+# [NARRATIVE]: Fits a Specimen image under a social channel's byte budget in as
+# few encodes as possible, and remembers the result per (image, target).
+
+import hashlib
+import io
+import json
+import math
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from PIL import Image, features
+
+CACHE_DIR = Path(__file__).resolve().parent.parent.parent.parent / "artifacts" / ".cache" / "broadcast"
+
+# Per-channel limits. `formats` is in preference order; formats the local
+# Pillow build cannot write (e.g. AVIF) are skipped.
+TARGETS: Dict[str, Dict] = {
+    # Blob limit is 1,000,000 bytes; leave headroom. Link-card thumbs must be JPEG/PNG.
+    "bluesky": {"max_bytes": 950_000, "max_edge": 2000, "formats": ("JPEG",)},
+    # Media uploads accept JPEG/PNG/WEBP up to 20 MB.
+    "pinterest": {"max_bytes": 10_000_000, "max_edge": 3000, "formats": ("WEBP", "JPEG")},
+    # Source frame for the still-image video; 1080p-class frames keep ffmpeg fast.
+    "tiktok": {"max_bytes": 5_000_000, "max_edge": 1920, "formats": ("JPEG",)},
+}
+
+MIN_QUALITY = 40
+MAX_QUALITY = 92
+PROBE_EDGE = 512
+MAX_SCALE_STEPS = 4
+EXTENSIONS = {"JPEG": "jpg", "WEBP": "webp", "AVIF": "avif", "PNG": "png"}
+_SUPPORTED = {"JPEG": True, "PNG": True, "WEBP": features.check("webp"), "AVIF": features.check("avif")}
+
+
+def _encode(img: Image.Image, fmt: str, quality: int, final: bool = False) -> bytes:
+    buf = io.BytesIO()
+    if fmt == "JPEG":
+        img.save(buf, format="JPEG", quality=quality, optimize=final, progressive=final)
+    elif fmt == "WEBP":
+        img.save(buf, format="WEBP", quality=quality, method=6 if final else 2)
+    elif fmt == "AVIF":
+        img.save(buf, format="AVIF", quality=quality, speed=6 if final else 9)
+    else:
+        img.save(buf, format=fmt)
+    return buf.getvalue()
+
+
+def _prepare(img: Image.Image, fmt: str) -> Image.Image:
+    if fmt == "JPEG":
+        if img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGBA")
+            flat = Image.new("RGB", img.size, (0, 0, 0))
+            flat.paste(img, mask=img.split()[-1])
+            return flat
+        return img.convert("RGB") if img.mode != "RGB" else img
+    return img.convert("RGBA") if img.mode not in ("RGB", "RGBA") else img
+
+
+def _scaled(img: Image.Image, scale: float) -> Image.Image:
+    if scale >= 0.999:
+        return img
+    size = (max(1, int(img.width * scale)), max(1, int(img.height * scale)))
+    return img.resize(size, Image.LANCZOS)
+
+
+def _probe_quality(img: Image.Image, fmt: str, budget: int) -> int:
+    """
+    Binary-search quality on a small probe, extrapolating bytes by pixel count.
+    Returns the highest quality whose estimate fits (MIN_QUALITY if none does).
+    """
+    ratio = min(1.0, PROBE_EDGE / max(img.size))
+    probe = _scaled(img, ratio)
+    area_factor = (img.width * img.height) / max(1, probe.width * probe.height)
+    lo, hi, best = MIN_QUALITY, MAX_QUALITY, MIN_QUALITY
+    while lo <= hi:
+        q = (lo + hi) // 2
+        if len(_encode(probe, fmt, q)) * area_factor <= budget:
+            best, lo = q, q + 1
+        else:
+            hi = q - 1
+    return best
+
+
+def _fit(img: Image.Image, fmt: str, budget: int) -> Optional[Tuple[bytes, int, float]]:
+    """Find (data, quality, scale) under budget: quality first, then resolution."""
+    scale = 1.0
+    for _ in range(MAX_SCALE_STEPS):
+        frame = _scaled(img, scale)
+        guess = _probe_quality(frame, fmt, budget)
+
+        # Verify on the full frame; bisect downward from the probe's guess.
+        lo, hi, found = MIN_QUALITY, guess, None
+        data = _encode(frame, fmt, guess)
+        if len(data) <= budget:
+            found = (data, guess)
+        else:
+            hi = guess - 1
+            while lo <= hi:
+                q = (lo + hi) // 2
+                data = _encode(frame, fmt, q)
+                if len(data) <= budget:
+                    found, lo = (data, q), q + 1
+                else:
+                    hi = q - 1
+        if found:
+            final = _encode(frame, fmt, found[1], final=True)
+            return (final if len(final) <= budget else found[0]), found[1], scale
+
+        # Even MIN_QUALITY overflows: shrink area in proportion to the overshoot.
+        overshoot = len(_encode(frame, fmt, MIN_QUALITY)) / budget
+        scale *= min(0.9, 0.95 / math.sqrt(overshoot))
+    return None
+
+
+def _cache_key(source: Path, target_name: str, target: Dict) -> str:
+    h = hashlib.sha256()
+    with open(source, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    h.update(json.dumps([target_name, target], sort_keys=True, default=list).encode())
+    return h.hexdigest()[:32]
+
+
+def encode_for(image_path: Union[str, Path], target: Union[str, Dict] = "bluesky",
+               use_cache: bool = True) -> Path:
+    """
+    Return a path to image_path encoded under the target's byte budget and
+    edge limit. The source itself is returned when it already complies.
+    Encoded variants are cached under artifacts/.cache/broadcast/.
+    """
+    source = Path(image_path)
+    target_name = target if isinstance(target, str) else "custom"
+    spec = TARGETS[target] if isinstance(target, str) else target
+    budget, max_edge = spec["max_bytes"], spec.get("max_edge")
+    formats = [f for f in spec["formats"] if _SUPPORTED.get(f)]
+
+    with Image.open(source) as probe:
+        src_format, src_size = probe.format, probe.size
+    size_ok = source.stat().st_size <= budget
+    edge_ok = not max_edge or max(src_size) <= max_edge
+    if size_ok and edge_ok and (src_format in spec["formats"] or src_format == "PNG"):
+        return source
+
+    key = _cache_key(source, target_name, spec)
+    if use_cache:
+        for fmt in formats:
+            hit = CACHE_DIR / f"{key}.{EXTENSIONS[fmt]}"
+            if hit.exists():
+                return hit
+
+    with Image.open(source) as src:
+        src.load()
+        base = src
+        if max_edge and max(base.size) > max_edge:
+            base = base.copy()
+            base.thumbnail((max_edge, max_edge), Image.LANCZOS)
+
+        for fmt in formats:
+            result = _fit(_prepare(base, fmt), fmt, budget)
+            if not result:
+                continue
+            data, quality, scale = result
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            out = CACHE_DIR / f"{key}.{EXTENSIONS[fmt]}"
+            tmp = out.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            tmp.replace(out)
+            print(f"[SYSTEM_LOG]: Encoded {source.name} for {target_name}: {len(data)} bytes "
+                  f"({fmt} q{quality}, scale {scale:.2f})")
+            return out
+
+    raise ValueError(f"Could not fit {source.name} under {budget} bytes for {target_name}")
+
+
+def encode_bytes(image_path: Union[str, Path], target: Union[str, Dict] = "bluesky") -> bytes:
+    """encode_for(), returning the bytes."""
+    return encode_for(image_path, target).read_bytes()
@@ -0,0 +1,226 @@
+"""
+/* [FILE_ID]: CATALOG_MIRROR // VERSION: 1.0 // STATUS: STABLE */
+Local mirror of the Printify catalog (/catalog/*): blueprints, print providers,
+variants and the placeholder positions derived from them. Persisted to
+artifacts/.printify_catalog.json and refreshed per entry once older than a TTL.
+The catalog changes rarely, so every catalog read in the repo goes through here.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterable
+
+import requests
+
+from .printify_limiter import PrintifySession
+
+BASE_URL = "https://api.printify.com/v1"
+MIRROR_FILE = Path(__file__).resolve().parent.parent.parent.parent / "artifacts" / ".printify_catalog.json"
+MIRROR_VERSION = 1
+DEFAULT_TTL = timedelta(days=7)
+MAX_WORKERS = 4
+
+DEFAULT_POSITIONS = ["front", "back", "all"]
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def is_aop(blueprint: Dict[str, Any]) -> bool:
+    title = blueprint.get("title", "")
+    return "AOP" in title or "All Over" in title
+
+
+class CatalogMirror:
+    """
+    Usage:
+        catalog = CatalogMirror.shared()
+        catalog.aop_blueprints()
+        catalog.blueprint(281)["title"]
+        catalog.providers(281)
+        catalog.variants(281, 10)
+        catalog.positions(281)            # first provider when none given
+        catalog.warm()                    # bulk-refresh every AOP blueprint
+    """
+
+    _shared: Optional["CatalogMirror"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, token: Optional[str] = None, path: Path = MIRROR_FILE, ttl: timedelta = DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._token = token
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.RLock()
+        self.blueprint_list: Optional[Dict[str, Any]] = None     # {"fetched_at", "data": [...]}
+        self.details: Dict[str, Dict[str, Any]] = {}              # bp_id -> entry
+        self.provider_lists: Dict[str, Dict[str, Any]] = {}       # bp_id -> entry
+        self.variant_lists: Dict[str, Dict[str, Any]] = {}        # "bp_id:provider_id" -> entry
+        self.load()
+
+    @classmethod
+    def shared(cls, token: Optional[str] = None) -> "CatalogMirror":
+        """Process-wide mirror; the token is only needed once a miss goes to the network."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(token=token)
+            elif token and not cls._shared._token:
+                cls._shared._token = token
+            return cls._shared
+
+    # ── persistence ─────────────────────────────────────────────
+
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return
+        if data.get("version") != MIRROR_VERSION:
+            return
+        self.blueprint_list = data.get("blueprint_list")
+        self.details = data.get("details", {})
+        self.provider_lists = data.get("provider_lists", {})
+        self.variant_lists = data.get("variant_lists", {})
+
+    def save(self) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({
+                "version": MIRROR_VERSION,
+                "blueprint_list": self.blueprint_list,
+                "details": self.details,
+                "provider_lists": self.provider_lists,
+                "variant_lists": self.variant_lists,
+            }), encoding="utf-8")
+            tmp.replace(self.path)
+
+    # ── transport ───────────────────────────────────────────────
+
+    def _http(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                token = self._token or os.getenv("PRINTIFY_API_KEY") or os.getenv("printify_api_key")
+                if not token:
+                    raise RuntimeError("PRINTIFY_API_KEY is not set — catalog mirror cannot refresh.")
+                self._session = PrintifySession()
+                self._session.headers.update({"Authorization": f"Bearer {token}"})
+            return self._session
+
+    def _fetch(self, path: str) -> Any:
+        resp = self._http().get(f"{BASE_URL}{path}", timeout=30)
+        resp.raise_for_status()
+        return resp.json()
+
+    def _fresh(self, entry: Optional[Dict[str, Any]]) -> bool:
+        if not entry or "fetched_at" not in entry:
+            return False
+        return _now() - datetime.fromisoformat(entry["fetched_at"]) <= self.ttl
+
+    def _entry(self, table: Dict[str, Dict], key: str, path: str, extract=lambda d: d,
+               force: bool = False, persist: bool = True) -> Any:
+        """Serve table[key] while fresh, otherwise fetch path and store it."""
+        entry = table.get(key)
+        if not force and self._fresh(entry):
+            return entry["data"]
+        data = extract(self._fetch(path))
+        with self._lock:
+            table[key] = {"fetched_at": _now().isoformat(), "data": data}
+        if persist:
+            self.save()
+        return data
+
+    # ── lookups ─────────────────────────────────────────────────
+
+    def blueprints(self, force: bool = False) -> List[Dict[str, Any]]:
+        """Every catalog blueprint (the /catalog/blueprints.json listing)."""
+        if force or not self._fresh(self.blueprint_list):
+            data = self._fetch("/catalog/blueprints.json")
+            with self._lock:
+                self.blueprint_list = {"fetched_at": _now().isoformat(), "data": data}
+            self.save()
+        return self.blueprint_list["data"]
+
+    def aop_blueprints(self, force: bool = False) -> List[Dict[str, Any]]:
+        return [b for b in self.blueprints(force=force) if is_aop(b)]
+
+    def blueprint(self, blueprint_id: int, force: bool = False, persist: bool = True) -> Dict[str, Any]:
+        # The listing carries the same fields as the detail endpoint.
+        if not force and self._fresh(self.blueprint_list):
+            for b in self.blueprint_list["data"]:
+                if b.get("id") == int(blueprint_id):
+                    return b
+        return self._entry(self.details, str(blueprint_id),
+                           f"/catalog/blueprints/{blueprint_id}.json", force=force, persist=persist)
+
+    def providers(self, blueprint_id: int, force: bool = False, persist: bool = True) -> List[Dict[str, Any]]:
+        return self._entry(self.provider_lists, str(blueprint_id),
+                           f"/catalog/blueprints/{blueprint_id}/print_providers.json",
+                           force=force, persist=persist)
+
+    def variants(self, blueprint_id: int, provider_id: int, force: bool = False,
+                 persist: bool = True) -> List[Dict[str, Any]]:
+        return self._entry(self.variant_lists, f"{blueprint_id}:{provider_id}",
+                           f"/catalog/blueprints/{blueprint_id}/print_providers/{provider_id}/variants.json",
+                           extract=lambda d: d.get("variants", []), force=force, persist=persist)
+
+    def positions(self, blueprint_id: int, provider_id: Optional[int] = None) -> List[str]:
+        """
+        Unique placeholder positions across a blueprint/provider's variants,
+        in first-seen order. With no provider, the blueprint's first provider.
+        """
+        if provider_id is None:
+            providers = self.providers(blueprint_id)
+            if not providers:
+                return []
+            provider_id = providers[0]["id"]
+        seen: Dict[str, None] = {}
+        for v in self.variants(blueprint_id, provider_id):
+            for ph in v.get("placeholders", []):
+                if ph.get("position"):
+                    seen.setdefault(ph["position"], None)
+        return list(seen)
+
+    # ── bulk warm-up ────────────────────────────────────────────
+
+    def warm(self, blueprint_ids: Optional[Iterable[int]] = None, max_workers: int = MAX_WORKERS,
+             force: bool = False) -> Dict[str, int]:
+        """
+        Refresh detail, providers and variants for every AOP blueprint (or the
+        given ids) concurrently; fresh entries are skipped unless force.
+        Saves once at the end. Returns counts per table.
+        """
+        if blueprint_ids is None:
+            blueprint_ids = [b["id"] for b in self.aop_blueprints(force=force)]
+        blueprint_ids = list(blueprint_ids)
+
+        def _warm_blueprint(bp_id):
+            try:
+                self.blueprint(bp_id, force=force, persist=False)
+                return [(bp_id, p["id"]) for p in self.providers(bp_id, force=force, persist=False)]
+            except requests.HTTPError as e:
+                print(f"!! [SYSTEM_WARNING]: Catalog warm-up skipped blueprint {bp_id}: {e}")
+                return []
+
+        def _warm_variants(pair):
+            try:
+                self.variants(*pair, force=force, persist=False)
+            except requests.HTTPError as e:
+                print(f"!! [SYSTEM_WARNING]: Catalog warm-up skipped variants {pair}: {e}")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            pairs = [pair for pairs in pool.map(_warm_blueprint, blueprint_ids) for pair in pairs]
+            list(pool.map(_warm_variants, pairs))
+        self.save()
+
+        counts = {"blueprints": len(blueprint_ids), "providers": len(pairs)}
+        print(f"// CATALOG_MIRROR_WARMED: {counts['blueprints']} blueprint(s), "
+              f"{counts['providers']} provider combo(s)")
+        return counts
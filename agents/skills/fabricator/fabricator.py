@@ -7,9 +7,13 @@ import os
 import json
 import re
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
+from .printify_limiter import PrintifySession
 
 
 def parse_blueprint_metadata(title: str) -> Dict[str, Any]:
@@ -90,7 +94,20 @@ class Fabricator:
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json"
         }
-        self.last_upload_src = None
+        # One pooled session per Fabricator; safe to share across worker threads.
+        # Throttled by the process-wide Printify buckets (see printify_limiter).
+        self.session = PrintifySession()
+        self.session.headers.update(self.headers)
+        self._local = threading.local()
+
+    @property
+    def last_upload_src(self) -> Optional[str]:
+        """CDN src of the most recent upload made by the *calling thread*."""
+        return getattr(self._local, "last_upload_src", None)
+
+    @last_upload_src.setter
+    def last_upload_src(self, value: Optional[str]) -> None:
+        self._local.last_upload_src = value
 
     def _load_token(self) -> str:
         """Loads the Printify API token from the environment file or environment variables."""
@@ -126,11 +143,11 @@ class Fabricator:
         url = f"{self.BASE_URL}/shops/{self.shop_id}/products/{product_id}.json"
         
         # [SIGNAL_RECOVERY]: Handle potential transient 500s or out-of-sync template refs
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers)
         if response.status_code == 500:
             print(f"!! [SYSTEM_WARPING]: 500 Server Error for Product {product_id}. Retrying handshake...")
             time.sleep(2)
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers)
             
         response.raise_for_status()
         return response.json()
@@ -163,7 +180,7 @@ class Fabricator:
         # [SIGNAL_RECOVERY]: Handle transient 500/502/504 during file upload
         max_retries = 3
         for attempt in range(max_retries):
-            response = requests.post(url, json=payload, headers=self.headers)
+            response = self.session.post(url, json=payload, headers=self.headers)
             if response.status_code in [500, 502, 503, 504]:
                 print(f"!! [SIGNAL_WARPING]: {response.status_code} Error. Attempt {attempt+1}/{max_retries}. Retrying in 5s...")
                 time.sleep(5)
@@ -181,40 +198,40 @@ class Fabricator:
         
         return data['id']
 
-    def get_templates(self) -> list:
-        """Retrieves all products that are marked as templates (paginated)."""
-        all_products = []
-        page = 1
+    def get_products_page(self, page: int = 1, limit: int = 50) -> Dict[str, Any]:
+        """Fetches one page of the shop's product listing (Printify caps limit at 50)."""
+        url = f"{self.BASE_URL}/shops/{self.shop_id}/products.json"
         
-        while True:
-            url = f"{self.BASE_URL}/shops/{self.shop_id}/products.json?page={page}"
-            
-            # [SIGNAL_RECOVERY]: Handle transient 500/502/504
-            for attempt in range(3):
-                response = requests.get(url, headers=self.headers)
-                if response.status_code >= 500:
-                    print(f"!! [SIGNAL_WARPING]: {response.status_code} Error on Template Fetch (page {page}). Retrying...")
-                    time.sleep(5)
-                    continue
-                break
-                
-            response.raise_for_status()
-            data = response.json()
-            products = data.get('data', [])
-            
-            if not products:
-                break
-                
-            all_products.extend(products)
-            
-            # Check if we've reached the last page
-            current_page = data.get('current_page', page)
-            last_page = data.get('last_page', page)
-            if current_page >= last_page:
-                break
+        # [SIGNAL_RECOVERY]: Handle transient 500/502/504
+        for attempt in range(3):
+            response = self.session.get(url, params={"page": page, "limit": limit})
+            if response.status_code >= 500:
+                print(f"!! [SIGNAL_WARPING]: {response.status_code} Error on Product Fetch (page {page}). Retrying...")
+                time.sleep(5)
+                continue
+            break
             
-            page += 1
+        response.raise_for_status()
+        return response.json()
+
+    def get_all_products(self, max_workers: int = 4) -> List[Dict[str, Any]]:
+        """
+        Retrieves every product in the shop. Page 1 reveals last_page; the
+        remaining pages are then fetched concurrently and stitched in order.
+        """
+        first = self.get_products_page(1)
+        products = list(first.get('data', []))
+        last_page = first.get('last_page', 1) or 1
         
+        if last_page > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for data in pool.map(self.get_products_page, range(2, last_page + 1)):
+                    products.extend(data.get('data', []))
+        return products
+
+    def get_templates(self) -> list:
+        """Retrieves all products that are marked as templates (paginated)."""
+        all_products = self.get_all_products()
         templates = [p for p in all_products if p.get('title', '').startswith('[TEMPLATE]:')]
         print(f"// TEMPLATES_LOADED: {len(templates)} (from {len(all_products)} total products)")
         return templates
@@ -460,7 +477,7 @@ class Fabricator:
         # 5. Create Product
         print("// INJECTING_SCHEMATIC...")
         create_url = f"{self.BASE_URL}/shops/{self.shop_id}/products.json"
-        response = requests.post(create_url, json=payload, headers=self.headers)
+        response = self.session.post(create_url, json=payload, headers=self.headers)
         
         try:
             response.raise_for_status()
@@ -532,6 +549,7 @@ class Fabricator:
         """
         try:
             from agents.skills.shopify_skill.shopify_skill import ShopifyConduit
+            from agents.skills.shopify_skill.article_index import ArticleLinkIndex
             conduit = ShopifyConduit()
 
             # Resolve title & description from product if not provided
@@ -540,18 +558,8 @@ class Fabricator:
             if description is None:
                 description = ""
 
-            # Find (or create) the UNVERIFIED blog
-            blogs = conduit.list_blogs()
-            blog_id = None
-            for b in blogs:
-                if b.get('title', '').strip() == '[STATUS: UNVERIFIED]':
-                    blog_id = b['id']
-                    break
-
-            if not blog_id:
-                result = conduit._post('blogs.json', {'blog': {'title': '[STATUS: UNVERIFIED]'}})
-                blog_id = result.get('blog', {}).get('id')
-                print(f"// BLOG_CREATED: [STATUS: UNVERIFIED] (ID {blog_id})")
+            # Find (or create) the UNVERIFIED blog — served from the conduit's metadata cache
+            blog_id = conduit.get_or_create_blog('[STATUS: UNVERIFIED]').get('id')
 
             # Use provided image_url if available, otherwise search for lifestyle mockup
             if image_url:
@@ -570,7 +578,7 @@ class Fabricator:
 
             body_html = f"<p>{description}</p>" if description else ""
 
-            conduit.create_article(
+            article = conduit.create_article(
                 blog_id=blog_id,
                 title=title,
                 body_html=body_html,
@@ -579,13 +587,15 @@ class Fabricator:
                 published=True,
             )
             print(f"// BLOG_ENTRY_POSTED: '{title}'")
+            # Record the product link locally (no refresh; the next audit applies its own delta)
+            ArticleLinkIndex.local(conduit, blog_id).record(article, product_id)
         except Exception as e:
             print(f"!! [WARNING]: Blog post failed: {e}. Fabrication still succeeded.")
 
     def update_product(self, product_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Updates an existing product's metadata or configuration."""
         url = f"{self.BASE_URL}/shops/{self.shop_id}/products/{product_id}.json"
-        response = requests.put(url, json=payload, headers=self.headers)
+        response = self.session.put(url, json=payload, headers=self.headers)
         response.raise_for_status()
         return response.json()
 
@@ -786,7 +796,7 @@ class Fabricator:
         # 4. Create Product
         print("// INJECTING_SCHEMATIC...")
         create_url = f"{self.BASE_URL}/shops/{self.shop_id}/products.json"
-        response = requests.post(create_url, json=payload, headers=self.headers)
+        response = self.session.post(create_url, json=payload, headers=self.headers)
         
         try:
             response.raise_for_status()
@@ -809,7 +819,7 @@ class Fabricator:
         """Updates the description of an existing product."""
         url = f"{self.BASE_URL}/shops/{self.shop_id}/products/{product_id}.json"
         payload = {"description": description}
-        response = requests.put(url, json=payload, headers=self.headers)
+        response = self.session.put(url, json=payload, headers=self.headers)
         response.raise_for_status()
         return response.json()
 
@@ -823,7 +833,7 @@ class Fabricator:
             # Priority 2: Direct single-image endpoint
             try:
                 single_url = f"{self.BASE_URL}/uploads/{image_id}.json"
-                resp = requests.get(single_url, headers=self.headers)
+                resp = self.session.get(single_url, headers=self.headers)
                 if resp.ok:
                     data = resp.json()
                     src = data.get('preview_url') or data.get('src')
@@ -835,7 +845,7 @@ class Fabricator:
             # Priority 3: Media library listing scan
             try:
                 media_url = f"{self.BASE_URL}/uploads.json"
-                media_resp = requests.get(media_url, headers=self.headers)
+                media_resp = self.session.get(media_url, headers=self.headers)
                 if media_resp.ok:
                     for item in media_resp.json().get('data', []):
                         if item.get('id') == image_id:
@@ -897,7 +907,7 @@ class Fabricator:
         payload = {"images": new_images_payload}
         
         print(f"// INJECTING_TO_GALLERY: {image_src[:60]}... (Total: {len(new_images_payload)})")
-        response = requests.put(url, json=payload, headers=self.headers)
+        response = self.session.put(url, json=payload, headers=self.headers)
         
         if not response.ok:
             print(f"!! [CONDUIT_REJECTION]: {response.status_code} - {response.text[:200]}")
@@ -0,0 +1,195 @@
+"""
+/* [FILE_ID]: MOCKUP_CACHE // VERSION: 1.1 // STATUS: STABLE */
+Content-addressed local cache for Printify mockup bytes.
+
+Blobs live in artifacts/.cache/mockups/blobs/<sha256>.<ext>; urls.json maps
+each source URL to its blob. Identical renders served from different URLs
+share one blob. veo_gen, transpose and every lifestyle-synthesis path read
+through here, so retries and reruns never re-download a product's mockups.
+
+- Size-bounded: blobs beyond MAX_BYTES are evicted least-recently-used first.
+- Revalidated: an entry older than REVALIDATE_AFTER is re-checked with
+  If-None-Match / If-Modified-Since; a 304 costs no body.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Dict, Iterable
+
+import requests
+
+CACHE_DIR = Path(__file__).resolve().parent.parent.parent.parent / "artifacts" / ".cache" / "mockups"
+BLOB_DIR = CACHE_DIR / "blobs"
+URL_INDEX = CACHE_DIR / "urls.json"
+MAX_WORKERS = 4
+MAX_BYTES = int(os.getenv("MOCKUP_CACHE_MAX_MB", "1024")) * 1024 * 1024
+REVALIDATE_AFTER = 6 * 3600      # seconds
+
+_lock = threading.Lock()
+_session = requests.Session()
+_index: Optional[Dict[str, Dict]] = None
+
+
+def _sniff_ext(data: bytes) -> str:
+    if data.startswith(b"\x89PNG"):
+        return "png"
+    if data.startswith(b"\xff\xd8"):
+        return "jpg"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp"
+    return "bin"
+
+
+def mime_for(path: Path) -> str:
+    return {
+        ".png": "image/png",
+        ".jpg": "image/jpeg",
+        ".webp": "image/webp",
+    }.get(path.suffix, "application/octet-stream")
+
+
+def _load_index() -> Dict[str, Dict]:
+    global _index
+    if _index is None:
+        try:
+            _index = json.loads(URL_INDEX.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            _index = {}
+    return _index
+
+
+def _save_index() -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = URL_INDEX.with_suffix(".tmp")
+    tmp.write_text(json.dumps(_index, indent=1, sort_keys=True), encoding="utf-8")
+    tmp.replace(URL_INDEX)
+
+
+def _evict() -> None:
+    """Drop least-recently-used blobs (and the URLs pointing at them) until under MAX_BYTES. Caller holds _lock."""
+    index = _load_index()
+    blobs: Dict[str, Dict] = {}
+    for url, entry in index.items():
+        b = blobs.setdefault(entry["blob"], {"bytes": entry.get("bytes", 0), "used": 0.0, "urls": []})
+        b["used"] = max(b["used"], entry.get("last_used", 0.0))
+        b["urls"].append(url)
+
+    total = sum(b["bytes"] for b in blobs.values())
+    for blob, b in sorted(blobs.items(), key=lambda kv: kv[1]["used"]):
+        if total <= MAX_BYTES:
+            break
+        (BLOB_DIR / blob).unlink(missing_ok=True)
+        for url in b["urls"]:
+            index.pop(url, None)
+        total -= b["bytes"]
+
+
+def cached_path(url: str) -> Optional[Path]:
+    """Return the blob path for url if it is already cached, else None (no network)."""
+    with _lock:
+        entry = _load_index().get(url)
+    if entry:
+        path = BLOB_DIR / entry["blob"]
+        if path.exists():
+            return path
+    return None
+
+
+def _store(url: str, resp: requests.Response) -> Path:
+    data = resp.content
+    digest = hashlib.sha256(data).hexdigest()
+    blob = f"{digest}.{_sniff_ext(data)}"
+    path = BLOB_DIR / blob
+
+    BLOB_DIR.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        tmp = path.with_name(f".{blob}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+
+    now = time.time()
+    with _lock:
+        index = _load_index()
+        previous = index.get(url, {}).get("blob")
+        index[url] = {
+            "blob": blob,
+            "bytes": len(data),
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "validated": now,
+            "last_used": now,
+        }
+        # A revalidation that returned new bytes orphans the old blob; _evict
+        # only sees blobs the index references, so drop it here.
+        if previous and previous != blob and not any(e["blob"] == previous for e in index.values()):
+            (BLOB_DIR / previous).unlink(missing_ok=True)
+        _evict()
+        _save_index()
+    return path
+
+
+def fetch_path(url: str, timeout: int = 30, revalidate: Optional[bool] = None) -> Path:
+    """
+    Return a local path holding url's bytes. Fresh hits cost no network; hits
+    older than REVALIDATE_AFTER (or revalidate=True) send a conditional GET;
+    misses download.
+    """
+    with _lock:
+        entry = dict(_load_index().get(url) or {})
+    path = BLOB_DIR / entry["blob"] if entry else None
+    if path is None or not path.exists():
+        resp = _session.get(url, timeout=timeout)
+        resp.raise_for_status()
+        return _store(url, resp)
+
+    now = time.time()
+    if revalidate is None:
+        revalidate = now - entry.get("validated", 0) > REVALIDATE_AFTER
+    if revalidate and (entry.get("etag") or entry.get("last_modified")):
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        try:
+            resp = _session.get(url, headers=headers, timeout=timeout)
+        except requests.RequestException as e:
+            print(f"[SYSTEM_WARNING]: Mockup revalidation failed, serving cached copy — {e}")
+            resp = None
+        if resp is not None and resp.status_code == 200:
+            return _store(url, resp)
+        if resp is not None and resp.status_code == 304:
+            entry["validated"] = now
+
+    with _lock:
+        live = _load_index().get(url)
+        if live:
+            live["last_used"] = now
+            live["validated"] = entry.get("validated", live.get("validated"))
+            _save_index()
+    return path
+
+
+def fetch_bytes(url: str, timeout: int = 30) -> bytes:
+    """Cached replacement for requests.get(url).content."""
+    return fetch_path(url, timeout=timeout).read_bytes()
+
+
+def fetch_many(urls: Iterable[Optional[str]], max_workers: int = MAX_WORKERS) -> Dict[str, Path]:
+    """
+    Resolve several URLs concurrently (None entries are skipped).
+    Returns {url: path}; failures raise after all downloads settle.
+    """
+    unique = list(dict.fromkeys(u for u in urls if u))
+    if not unique:
+        return {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        paths = list(pool.map(fetch_path, unique))
+    return dict(zip(unique, paths))
@@ -0,0 +1,281 @@
+"""
+/* [FILE_ID]: PRICING_ENGINE // VERSION: 1.0 // STATUS: STABLE */
+Bulk margin pricing and publishing for Printify products.
+
+Target prices are computed for every variant of every product in one pass
+from cached variant costs (artifacts/.printify_variant_costs.json). A product
+is PUT only when at least one of its prices differs from its target, and the
+PUT response refreshes the cache, so no follow-up GET is needed. Updates and
+publishes run per product on a bounded pool that shares the Printify buckets.
+A shop-wide reprice costs the listing pages plus one request per changed product.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterable
+
+import requests
+
+from .printify_limiter import PrintifySession
+
+BASE_URL = "https://api.printify.com/v1"
+COST_FILE = Path(__file__).resolve().parent.parent.parent.parent / "artifacts" / ".printify_variant_costs.json"
+COST_VERSION = 1
+DEFAULT_MARGIN = 0.3
+MAX_WORKERS = 4
+
+# Cached prices are trusted without a GET for this long; costs never expire
+# (they only move with the blueprint/provider, which a PUT response re-records).
+PRICE_TRUST = timedelta(minutes=10)
+
+PUBLISH_PAYLOAD = {
+    "title": True,
+    "description": True,
+    "images": True,
+    "variants": True,
+    "tags": True,
+    "publish": {"shop": "shopify"},
+}
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def margin_price(cost: float, margin: float = DEFAULT_MARGIN) -> int:
+    """Price in cents giving `margin` profit on `cost`: price = cost / (1 - margin)."""
+    return int(round(float(cost) / (1 - margin)))
+
+
+class VariantCostCache:
+    """
+    product id -> {"seen_at", "variants": {variant id: {"cost", "price"}}},
+    recorded from any full product payload (listing rows, GETs, PUT responses).
+    """
+
+    _lock = threading.RLock()
+
+    def __init__(self, path: Path = COST_FILE):
+        self.path = path
+        self.products: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    def load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return
+        if data.get("version") == COST_VERSION:
+            self.products = data.get("products", {})
+
+    def save(self) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": COST_VERSION, "products": self.products}), encoding="utf-8")
+            tmp.replace(self.path)
+
+    def ingest(self, product: Dict[str, Any]) -> None:
+        """Record the costs and prices of a full product payload."""
+        variants = product.get("variants")
+        if not product.get("id") or not variants:
+            return
+        with self._lock:
+            old = (self.products.get(product["id"]) or {}).get("variants", {})
+            rows = {}
+            for v in variants:
+                vid = str(v["id"])
+                cost = v.get("cost")
+                if cost is None:
+                    cost = (old.get(vid) or {}).get("cost")
+                rows[vid] = {"cost": cost, "price": v.get("price")}
+            self.products[product["id"]] = {"seen_at": _now().isoformat(), "variants": rows}
+
+    def record_prices(self, product_id: str, variants: List[Dict[str, Any]]) -> None:
+        """Apply prices this process just wrote, when the write response carried no variants."""
+        with self._lock:
+            entry = self.products.get(product_id)
+            if not entry:
+                return
+            for v in variants:
+                row = entry["variants"].get(str(v["id"]))
+                if row:
+                    row["price"] = v["price"]
+            entry["seen_at"] = _now().isoformat()
+
+    def fresh(self, product_id: str, max_age: timedelta = PRICE_TRUST) -> Optional[Dict[str, Any]]:
+        entry = self.products.get(product_id)
+        if not entry or _now() - datetime.fromisoformat(entry["seen_at"]) > max_age:
+            return None
+        return entry
+
+
+class PricingEngine:
+    """
+    Usage:
+        engine = PricingEngine()
+        engine.set_margin_and_publish("6a899e0008e606de3c09f80b")      # one product
+        engine.reprice_shop(margin=0.3, publish=False)                 # whole shop
+    """
+
+    _shared: Optional["PricingEngine"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, shop_id: Optional[str] = None, token: Optional[str] = None,
+                 margin: float = DEFAULT_MARGIN, max_workers: int = MAX_WORKERS,
+                 cache: Optional[VariantCostCache] = None):
+        self.shop_id = shop_id or os.getenv("PRINTIFY_SHOP_ID") or os.getenv("printify_shop_id")
+        token = token or os.getenv("PRINTIFY_API_KEY") or os.getenv("printify_api_key")
+        if not self.shop_id or not token:
+            raise ValueError("[SYSTEM_DISSONANCE]: PRINTIFY_SHOP_ID and PRINTIFY_API_KEY must be set.")
+        self.margin = margin
+        self.max_workers = max_workers
+        self.cache = cache or VariantCostCache()
+        self.session = PrintifySession()
+        self.session.headers.update({"Authorization": f"Bearer {token}", "Content-Type": "application/json"})
+
+    @classmethod
+    def shared(cls, shop_id: Optional[str] = None) -> "PricingEngine":
+        """Process-wide engine, so repeated calls in one run reuse the session and the cache."""
+        with cls._shared_lock:
+            if cls._shared is None or (shop_id and str(shop_id) != str(cls._shared.shop_id)):
+                cls._shared = cls(shop_id=shop_id)
+            return cls._shared
+
+    def _url(self, suffix: str = "") -> str:
+        return f"{BASE_URL}/shops/{self.shop_id}/products{suffix}"
+
+    # ── pricing plan ────────────────────────────────────────────
+
+    def plan(self, product_ids: Iterable[str], margin: Optional[float] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Variant price updates for every cached product whose prices are off
+        target: {product_id: [{"id", "price"}, ...]} (all variants of a changed
+        product, so the PUT is complete). Products already on target are absent.
+        Variants without a known cost keep their current price: marking up from
+        the price itself would compound on every pass.
+        """
+        margin = self.margin if margin is None else margin
+        rows = [
+            (pid, int(vid), v.get("cost"), v.get("price"))
+            for pid in product_ids
+            for vid, v in (self.cache.products.get(pid) or {}).get("variants", {}).items()
+        ]
+        no_cost = sorted({pid for pid, _, cost, _ in rows if cost is None})
+        if no_cost:
+            print(f"[SYSTEM_WARNING] No variant cost for {len(no_cost)} product(s); "
+                  f"those variants keep their price: {', '.join(no_cost[:5])}{' ...' if len(no_cost) > 5 else ''}")
+        targets = [(pid, vid, price if cost is None else margin_price(cost, margin), price)
+                   for pid, vid, cost, price in rows if cost is not None or price is not None]
+        changed = {pid for pid, _, target, price in targets if price != target}
+        updates: Dict[str, List[Dict[str, Any]]] = {}
+        for pid, vid, target, _ in targets:
+            if pid in changed:
+                updates.setdefault(pid, []).append({"id": vid, "price": target})
+        return updates
+
+    # ── network ─────────────────────────────────────────────────
+
+    def _fetch(self, product_id: str) -> Dict[str, Any]:
+        resp = self.session.get(self._url(f"/{product_id}.json"))
+        resp.raise_for_status()
+        product = resp.json()
+        self.cache.ingest(product)
+        return product
+
+    def _put_prices(self, product_id: str, variants: List[Dict[str, Any]]) -> None:
+        resp = self.session.put(self._url(f"/{product_id}.json"), json={"variants": variants})
+        resp.raise_for_status()
+        product = resp.json()
+        if product.get("variants"):
+            self.cache.ingest(product)
+        else:
+            self.cache.record_prices(product_id, variants)
+
+    def _publish(self, product_id: str) -> None:
+        resp = self.session.post(self._url(f"/{product_id}/publish.json"), json=PUBLISH_PAYLOAD)
+        resp.raise_for_status()
+
+    def _settle(self, product_id: str, variants: Optional[List[Dict[str, Any]]], publish: bool) -> Dict[str, Any]:
+        if variants:
+            self._put_prices(product_id, variants)
+        if publish:
+            self._publish(product_id)
+        return {"repriced": bool(variants), "published": publish}
+
+    def apply(self, product_ids: List[str], margin: Optional[float] = None,
+              publish: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Reprice (when off target) and optionally publish each product on a
+        bounded pool. Costs must already be cached. Returns per-product results;
+        failures carry an "error" instead of raising.
+        """
+        updates = self.plan(product_ids, margin)
+        work = [pid for pid in product_ids if pid in updates or publish]
+        results: Dict[str, Dict[str, Any]] = {pid: {"repriced": False, "published": False} for pid in product_ids}
+        try:
+            if work:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(work))) as pool:
+                    futures = {pool.submit(self._settle, pid, updates.get(pid), publish): pid for pid in work}
+                    for f in as_completed(futures):
+                        pid = futures[f]
+                        try:
+                            results[pid] = f.result()
+                        except requests.HTTPError as e:
+                            results[pid] = {"repriced": False, "published": False,
+                                            "error": f"{e.response.status_code} {e.response.text[:200]}"}
+                            print(f"[PRINTIFY ERROR] {pid}: {results[pid]['error']}")
+                        except requests.RequestException as e:
+                            results[pid] = {"repriced": False, "published": False,
+                                            "error": f"{e.__class__.__name__}: {e}"}
+                            print(f"[PRINTIFY ERROR] {pid}: {results[pid]['error']}")
+        finally:
+            # Prices already settled stay trusted even if the pass is cut short
+            self.cache.save()
+        print(f"[SYSTEM_LOG] Pricing pass: {len(updates)} repriced, "
+              f"{sum(1 for r in results.values() if r['published'])} published, "
+              f"{sum(1 for r in results.values() if 'error' in r)} failed "
+              f"({len(product_ids)} product(s)).")
+        return results
+
+    def set_margin_and_publish(self, product_id: str, margin: Optional[float] = None,
+                               publish: bool = True) -> Dict[str, Any]:
+        """
+        Single-product entry point. Uses the cached prices when they were seen
+        within PRICE_TRUST (e.g. a republish right after the first publish), so
+        an unchanged product costs just the publish POST. Raises on HTTP errors.
+        """
+        if not self.cache.fresh(product_id):
+            self._fetch(product_id)
+        variants = self.plan([product_id], margin).get(product_id)
+        result = self._settle(product_id, variants, publish)
+        self.cache.save()
+        return result
+
+    def reprice_shop(self, margin: Optional[float] = None, publish: bool = False,
+                     product_filter=None) -> Dict[str, Dict[str, Any]]:
+        """
+        Whole-shop pass: list every product (listing rows carry full variants,
+        so costs are refreshed for free), then PUT only the off-target ones.
+        """
+        first = self._listing_page(1)
+        pages = [first] + self._listing_pages(range(2, (first.get("last_page") or 1) + 1))
+        products = [p for page in pages for p in page.get("data", [])]
+        if product_filter:
+            products = [p for p in products if product_filter(p)]
+        for p in products:
+            self.cache.ingest(p)
+        return self.apply([p["id"] for p in products], margin=margin, publish=publish)
+
+    def _listing_page(self, page: int) -> Dict[str, Any]:
+        resp = self.session.get(self._url(".json"), params={"page": page, "limit": 50})
+        resp.raise_for_status()
+        return resp.json()
+
+    def _listing_pages(self, pages: Iterable[int]) -> List[Dict[str, Any]]:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(self._listing_page, pages))
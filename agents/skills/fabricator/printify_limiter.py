@@ -0,0 +1,62 @@
+"""
+/* [FILE_ID]: PRINTIFY_LIMITER // VERSION: 1.0 // STATUS: STABLE */
+Process-wide client-side throttle for the Printify API.
+
+Printify allows 600 requests/minute per account, 100/minute on /catalog/*,
+and 200 publishes per 30 minutes (PRINTIFY_PUBLISH_PER_30MIN overrides the
+last). Every PrintifySession in the process draws from the same buckets, so
+Fabricator, BlueprintExplorer and the catalog mirror can fan out across worker
+threads without tripping 429s. A 429 that slips through is retried after
+Retry-After.
+"""
+
+import os
+import time
+
+import requests
+
+from agents.skills.leaky_bucket import LeakyBucket
+
+GLOBAL_PER_MINUTE = 600
+CATALOG_PER_MINUTE = 100
+PUBLISH_PER_30MIN = int(os.getenv("PRINTIFY_PUBLISH_PER_30MIN", "200"))
+BURST = 20
+MAX_RETRIES = 5
+
+GLOBAL_BUCKET = LeakyBucket(BURST, GLOBAL_PER_MINUTE / 60)
+CATALOG_BUCKET = LeakyBucket(BURST // 2, CATALOG_PER_MINUTE / 60)
+# No burst for publishes: 20 up front plus 200/30min sustained would exceed the window.
+PUBLISH_BUCKET = LeakyBucket(1, PUBLISH_PER_30MIN / 1800)
+
+
+def budget_per_minute(url: str) -> float:
+    """Sustained requests/minute the buckets allow for calls to `url`."""
+    rates = [GLOBAL_BUCKET.leak_rate]
+    if "/catalog/" in url:
+        rates.append(CATALOG_BUCKET.leak_rate)
+    if url.endswith("/publish.json"):
+        rates.append(PUBLISH_BUCKET.leak_rate)
+    return min(rates) * 60
+
+
+class PrintifySession(requests.Session):
+    """
+    Drop-in requests.Session whose every request passes through the shared
+    Printify buckets. Non-429 responses are returned untouched, so callers
+    keep their own raise_for_status / 5xx handling.
+    """
+
+    def request(self, method, url, *args, **kwargs):
+        for attempt in range(MAX_RETRIES):
+            GLOBAL_BUCKET.acquire()
+            if "/catalog/" in str(url):
+                CATALOG_BUCKET.acquire()
+            elif str(url).endswith("/publish.json"):
+                PUBLISH_BUCKET.acquire()
+            resp = super().request(method, url, *args, **kwargs)
+            if resp.status_code != 429:
+                return resp
+            wait = float(resp.headers.get("Retry-After") or 2 ** attempt)
+            print(f"[SYSTEM_WARNING]: Printify 429 — throttled, retrying in {wait:.1f}s ({attempt + 1}/{MAX_RETRIES})")
+            time.sleep(wait)
+        return resp
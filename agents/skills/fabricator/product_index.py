@@ -0,0 +1,180 @@
+"""
+/* [FILE_ID]: PRODUCT_INDEX // VERSION: 1.0 // STATUS: STABLE */
+Local index of the Printify shop's products, built from the paginated listing
+and persisted to artifacts/.printify_product_index.json. Scripts query it for
+candidate sets (unverified specimens, drafts, templates) instead of re-walking
+the shop on every run.
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable
+
+INDEX_FILE = Path(__file__).resolve().parent.parent.parent.parent / "artifacts" / ".printify_product_index.json"
+INDEX_VERSION = 1
+DEFAULT_MAX_AGE = timedelta(minutes=30)
+
+# Listing fields worth keeping — the full payloads (print_areas, variants) stay remote.
+SUMMARY_FIELDS = (
+    "id", "title", "blueprint_id", "print_provider_id", "visible", "is_locked",
+    "is_deleted", "created_at", "updated_at", "tags",
+)
+
+# Fields the blueprint scan reads. The listing normally carries them (deleted
+# products are not listed, so a missing is_deleted means "no"); when
+# blueprint_id or visible is absent, one detail GET fills all three in and is
+# remembered until updated_at moves.
+DETAIL_FIELDS = ("blueprint_id", "visible", "is_deleted")
+REQUIRED_DETAIL_FIELDS = ("blueprint_id", "visible")
+
+
+def summarize_product(product: Dict[str, Any]) -> Dict[str, Any]:
+    """Trim a Printify product payload down to the indexed summary row."""
+    row = {k: product.get(k) for k in SUMMARY_FIELDS}
+    external = product.get("external") or {}
+    row["external_id"] = external.get("id")
+    row["external_handle"] = external.get("handle")
+    return row
+
+
+class ProductIndex:
+    """
+    Usage:
+        index = ProductIndex()
+        index.refresh(fab)                 # re-list only when older than max_age
+        index.unverified()                 # UNVERIFIED SPECIMEN rows
+        index.get("6a899e0008e606de3c09f80b")
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, path: Path = INDEX_FILE):
+        self.path = path
+        self.products: Dict[str, Dict[str, Any]] = {}
+        self.synced_at: Optional[str] = None
+        self.load()
+
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self.products = data.get("products", {})
+        self.synced_at = data.get("synced_at")
+
+    def save(self) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({
+                "version": INDEX_VERSION,
+                "synced_at": self.synced_at,
+                "products": self.products,
+            }), encoding="utf-8")
+            tmp.replace(self.path)
+
+    def is_stale(self, max_age: timedelta = DEFAULT_MAX_AGE) -> bool:
+        if not self.synced_at:
+            return True
+        return datetime.now(timezone.utc) - datetime.fromisoformat(self.synced_at) > max_age
+
+    def rebuild(self, fab) -> List[Dict[str, Any]]:
+        """
+        Re-list the whole shop via fab.get_all_products() and replace the index.
+        Returns the raw listing payloads so callers can reuse them this run.
+        """
+        raw = fab.get_all_products()
+        previous = self.products
+        self.products = {}
+        for p in raw:
+            row = summarize_product(p)
+            old = previous.get(row["id"])
+            if old and old.get("detail_updated_at") == row["updated_at"]:
+                for field in DETAIL_FIELDS:
+                    if row.get(field) is None:
+                        row[field] = old.get(field)
+                row["detail_updated_at"] = old["detail_updated_at"]
+            self.products[row["id"]] = row
+        self.synced_at = datetime.now(timezone.utc).isoformat()
+        self.save()
+        print(f"// PRODUCT_INDEX_SYNCED: {len(self.products)} product(s)")
+        return raw
+
+    def refresh(self, fab, max_age: timedelta = DEFAULT_MAX_AGE, force: bool = False) -> None:
+        if force or self.is_stale(max_age):
+            self.rebuild(fab)
+
+    def upsert(self, product: Dict[str, Any]) -> None:
+        """Record a product payload created or modified in this process."""
+        with self._lock:
+            self.products[product["id"]] = summarize_product(product)
+        self.save()
+
+    def fill_details(self, fab, rows: List[Dict[str, Any]], max_workers: int = 4) -> int:
+        """
+        Fetch full payloads, concurrently, for rows missing a required field
+        whose updated_at has moved since their last detail fetch.
+        Returns the number of detail GETs made.
+        """
+        stale = [
+            r for r in rows
+            if any(r.get(f) is None for f in REQUIRED_DETAIL_FIELDS)
+            and r.get("detail_updated_at") != r.get("updated_at")
+        ]
+        if not stale:
+            return 0
+
+        def _fetch(row):
+            try:
+                return fab.get_product(row["id"])
+            except Exception as e:
+                print(f"!! [SYSTEM_WARNING]: Detail fetch failed for {row['id']}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for row, product in zip(stale, pool.map(_fetch, stale)):
+                if product is None:
+                    continue
+                for field in DETAIL_FIELDS:
+                    row[field] = product.get(field)
+                row["detail_updated_at"] = row.get("updated_at")
+        self.save()
+        return len(stale)
+
+    # ── queries ─────────────────────────────────────────────────
+
+    def get(self, product_id: str) -> Optional[Dict[str, Any]]:
+        return self.products.get(product_id)
+
+    def where(self, predicate: Callable[[Dict[str, Any]], bool]) -> List[Dict[str, Any]]:
+        return [p for p in self.products.values() if predicate(p)]
+
+    def by_title_prefix(self, prefix: str) -> List[Dict[str, Any]]:
+        return self.where(lambda p: (p.get("title") or "").upper().startswith(prefix.upper()))
+
+    def used_blueprint_ids(self, fab, markers=("[DRAFT]", "[TEMPLATE]")) -> set:
+        """
+        Blueprint ids held by visible, non-deleted products whose title carries
+        one of `markers`. Derived from the listing rows; detail GETs only for
+        rows the listing left incomplete (see fill_details).
+        """
+        rows = self.where(lambda p: any(m in (p.get("title") or "") for m in markers))
+        fetched = self.fill_details(fab, rows)
+        if fetched:
+            print(f"// DETAIL_FETCHED: {fetched} product(s)")
+        return {
+            r["blueprint_id"] for r in rows
+            if r.get("blueprint_id")
+            and not r.get("is_deleted")
+            and r.get("visible") is not False
+        }
+
+    def unverified(self) -> List[Dict[str, Any]]:
+        return self.by_title_prefix("UNVERIFIED SPECIMEN")
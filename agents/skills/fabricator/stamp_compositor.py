@@ -0,0 +1,137 @@
+"""
+/* [FILE_ID]: STAMP_COMPOSITOR // VERSION: 1.0 // STATUS: STABLE */
+Shared QR / goose stamp compositing for lifestyle mockups.
+
+The stamp sits in the bottom-right corner at ~12% of the image width with 3%
+padding. Resized stamp variants are cached per (stamp file, size). Only the
+stamp's box is converted and alpha-composited, and the result is encoded once
+via a temp file. stamp_directory() fans a whole folder out across processes.
+
+Usage:
+    from agents.skills.fabricator.stamp_compositor import composite_stamp
+    composite_stamp("artifacts/graphics/mockups/.../lifestyle.png", QR_PATH)
+
+    python3 -m agents.skills.fabricator.stamp_compositor artifacts/graphics/mockups \
+        --stamp artifacts/graphics/logos/green_goose.png --pattern "*lifestyle*.png"
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple, List
+
+from PIL import Image
+
+STAMP_RATIO = 0.12
+MIN_STAMP_PX = 48
+PADDING_RATIO = 0.03
+# zlib level 3 is ~3x faster than Pillow's default 6 for a few % larger files.
+PNG_COMPRESS_LEVEL = 3
+JPEG_QUALITY = 95
+
+
+def stamp_geometry(width: int, height: int) -> Tuple[int, int, int]:
+    """(stamp_size, x, y) for an image of the given dimensions."""
+    size = max(int(width * STAMP_RATIO), MIN_STAMP_PX)
+    padding = int(width * PADDING_RATIO)
+    return size, width - size - padding, height - size - padding
+
+
+@lru_cache(maxsize=32)
+def _stamp_variant(stamp_path: str, mtime_ns: int, size: int) -> Image.Image:
+    stamp = Image.open(stamp_path).convert("RGBA")
+    return stamp.resize((size, size), Image.LANCZOS)
+
+
+def stamp_variant(stamp_path, size: int) -> Image.Image:
+    """The stamp as RGBA at size×size, cached until the stamp file changes."""
+    stamp_path = str(stamp_path)
+    return _stamp_variant(stamp_path, os.stat(stamp_path).st_mtime_ns, size)
+
+
+def _save(img: Image.Image, path: Path, fmt: Optional[str]) -> None:
+    fmt = (fmt or Image.registered_extensions().get(path.suffix.lower()) or "PNG").upper()
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    if fmt == "JPEG":
+        img.save(tmp, format="JPEG", quality=JPEG_QUALITY, optimize=False)
+    elif fmt == "PNG":
+        img.save(tmp, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+    else:
+        img.save(tmp, format=fmt)
+    tmp.replace(path)
+
+
+def composite_stamp(image_path, stamp_path, output_path=None) -> Tuple[int, int, int]:
+    """
+    Composite stamp_path onto image_path (in place unless output_path).
+    Returns (x, y, stamp_size). Raises on unreadable inputs.
+    """
+    image_path = Path(image_path)
+    with Image.open(image_path) as src:
+        fmt = src.format
+        base = src.copy()
+
+    size, x, y = stamp_geometry(base.width, base.height)
+    stamp = stamp_variant(stamp_path, size)
+
+    box = (max(x, 0), max(y, 0), min(x + size, base.width), min(y + size, base.height))
+    region = base.crop(box).convert("RGBA")
+    region.alpha_composite(stamp, source=(box[0] - x, box[1] - y))
+    if base.mode in ("RGB", "RGBA", "L", "LA"):
+        base.paste(region.convert(base.mode), box)
+    else:
+        base = base.convert("RGBA")
+        base.paste(region, box)
+
+    _save(base, Path(output_path) if output_path else image_path, fmt)
+    return x, y, size
+
+
+def _stamp_one(job: Tuple[str, str, Optional[str]]) -> Tuple[str, Optional[str]]:
+    image_path, stamp_path, output_path = job
+    try:
+        composite_stamp(image_path, stamp_path, output_path)
+        return image_path, None
+    except Exception as e:
+        return image_path, str(e)
+
+
+def stamp_directory(directory, stamp_path, pattern: str = "*.png", output_dir=None,
+                    processes: Optional[int] = None, recursive: bool = True) -> List[Tuple[str, Optional[str]]]:
+    """
+    Stamp every image matching pattern under directory across a process pool.
+    Returns [(image_path, error_or_None)].
+    """
+    directory = Path(directory)
+    paths = sorted(directory.rglob(pattern) if recursive else directory.glob(pattern))
+    jobs = []
+    for p in paths:
+        out = None
+        if output_dir:
+            out = Path(output_dir) / p.relative_to(directory)
+            out.parent.mkdir(parents=True, exist_ok=True)
+            out = str(out)
+        jobs.append((str(p), str(stamp_path), out))
+    if not jobs:
+        return []
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        results = list(pool.map(_stamp_one, jobs, chunksize=max(1, len(jobs) // 64)))
+    failed = [r for r in results if r[1]]
+    print(f"// STAMP_BATCH: {len(results) - len(failed)} stamped, {len(failed)} failed")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stamp a directory of mockups")
+    parser.add_argument("directory")
+    parser.add_argument("--stamp", required=True, help="Stamp PNG (QR code or goose logo)")
+    parser.add_argument("--pattern", default="*.png")
+    parser.add_argument("--output-dir", help="Write stamped copies here instead of in place")
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+    for path, err in stamp_directory(args.directory, args.stamp, args.pattern, args.output_dir, args.processes):
+        if err:
+            print(f"!! [WARNING]: {path}: {err}")
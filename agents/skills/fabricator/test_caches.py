@@ -0,0 +1,282 @@
+"""
+/* [FILE_ID]: TEST_FABRICATOR_CACHES // VERSION: 1.0 // STATUS: TESTING */
+Exercises the fabricator's local caches with in-memory transports: the mockup
+blob cache, the Printify upload pool, the catalog mirror and the variant cost
+cache behind PricingEngine.plan. No Printify credentials or network access needed.
+
+Run with pytest, or directly:
+    python3 agents/skills/fabricator/test_caches.py
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+
+import requests
+
+# Ensure we can import the module
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from agents.skills.fabricator import mockup_cache
+from agents.skills.fabricator.catalog_mirror import CatalogMirror
+from agents.skills.fabricator.pricing_engine import PricingEngine, VariantCostCache
+from agents.skills.fabricator.upload_pool import UploadPool
+
+PNG = b"\x89PNG\r\n\x1a\n"
+
+
+def workdir() -> Path:
+    return Path(tempfile.mkdtemp(prefix="fabricator_cache_test_"))
+
+
+# ── mockup_cache ────────────────────────────────────────────────
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """Serves self.bodies[url]; answers 304 when If-None-Match matches self.etags[url]."""
+
+    def __init__(self):
+        self.bodies = {}
+        self.etags = {}
+        self.calls = []
+        self.fail = False
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls.append((url, dict(headers or {})))
+        if self.fail:
+            raise requests.ConnectionError("offline")
+        etag = self.etags.get(url)
+        if etag and (headers or {}).get("If-None-Match") == etag:
+            return FakeResponse(304)
+        return FakeResponse(200, self.bodies[url], {"ETag": etag} if etag else {})
+
+
+@contextmanager
+def mockups(max_bytes=1 << 30):
+    root = workdir()
+    saved = (mockup_cache.CACHE_DIR, mockup_cache.BLOB_DIR, mockup_cache.URL_INDEX,
+             mockup_cache.MAX_BYTES, mockup_cache._session, mockup_cache._index)
+    session = FakeSession()
+    mockup_cache.CACHE_DIR = root
+    mockup_cache.BLOB_DIR = root / "blobs"
+    mockup_cache.URL_INDEX = root / "urls.json"
+    mockup_cache.MAX_BYTES = max_bytes
+    mockup_cache._session = session
+    mockup_cache._index = None
+    try:
+        yield session
+    finally:
+        (mockup_cache.CACHE_DIR, mockup_cache.BLOB_DIR, mockup_cache.URL_INDEX,
+         mockup_cache.MAX_BYTES, mockup_cache._session, mockup_cache._index) = saved
+
+
+def blobs():
+    return sorted(p.name for p in mockup_cache.BLOB_DIR.iterdir())
+
+
+def test_mockup_hits_cost_no_network():
+    with mockups() as session:
+        session.bodies["u1"] = PNG + b"one"
+        assert mockup_cache.fetch_bytes("u1") == PNG + b"one"
+        assert mockup_cache.fetch_bytes("u1") == PNG + b"one"
+        assert len(session.calls) == 1
+        assert mockup_cache.cached_path("u1").suffix == ".png"
+        assert mockup_cache.cached_path("u2") is None
+
+
+def test_mockup_identical_bytes_share_a_blob():
+    with mockups() as session:
+        session.bodies["u1"] = session.bodies["u2"] = PNG + b"same"
+        assert mockup_cache.fetch_path("u1") == mockup_cache.fetch_path("u2")
+        assert len(blobs()) == 1
+
+
+def test_mockup_revalidation():
+    with mockups() as session:
+        session.bodies["u1"], session.etags["u1"] = PNG + b"v1", '"v1"'
+        first = mockup_cache.fetch_path("u1")
+
+        # 304: same blob, conditional headers sent
+        assert mockup_cache.fetch_path("u1", revalidate=True) == first
+        assert session.calls[-1][1] == {"If-None-Match": '"v1"'}
+
+        # 200 with new bytes: the URL moves to a new blob and the orphan is removed
+        session.bodies["u1"], session.etags["u1"] = PNG + b"v2", '"v2"'
+        second = mockup_cache.fetch_path("u1", revalidate=True)
+        assert second != first and second.read_bytes() == PNG + b"v2"
+        assert blobs() == [second.name]
+
+        # Unreachable origin: the cached copy is served
+        session.fail = True
+        assert mockup_cache.fetch_path("u1", revalidate=True) == second
+
+
+def test_mockup_replaced_blob_kept_while_shared():
+    with mockups() as session:
+        session.bodies["u1"] = session.bodies["u2"] = PNG + b"shared"
+        session.etags["u1"] = '"v1"'
+        shared = mockup_cache.fetch_path("u1")
+        mockup_cache.fetch_path("u2")
+        session.bodies["u1"], session.etags["u1"] = PNG + b"fresh", '"v2"'
+        mockup_cache.fetch_path("u1", revalidate=True)
+        assert shared.exists()
+        assert len(blobs()) == 2
+
+
+def test_mockup_eviction_is_lru():
+    with mockups(max_bytes=2 * (len(PNG) + 4)) as session:
+        for name in ("u1", "u2", "u3"):
+            session.bodies[name] = PNG + name.encode() + b"__"
+        mockup_cache.fetch_path("u1")
+        time.sleep(0.01)
+        mockup_cache.fetch_path("u2")
+        time.sleep(0.01)
+        mockup_cache.fetch_path("u1")     # u1 is now the most recently used
+        time.sleep(0.01)
+        mockup_cache.fetch_path("u3")
+        assert mockup_cache.cached_path("u2") is None
+        assert mockup_cache.cached_path("u1") and mockup_cache.cached_path("u3")
+        assert len(blobs()) == 2
+
+
+# ── UploadPool ──────────────────────────────────────────────────
+
+def test_upload_pool_dedupes_by_content():
+    root = workdir()
+    a, b, c = root / "a.png", root / "b.png", root / "c.png"
+    a.write_bytes(PNG + b"tile")
+    b.write_bytes(PNG + b"tile")
+    c.write_bytes(PNG + b"texture")
+    uploads = []
+    gate = threading.Event()
+
+    def uploader(local_path, file_name):
+        gate.wait(5)
+        uploads.append(file_name)
+        return f"img-{len(uploads)}"
+
+    pool = UploadPool(uploader, path=root / "uploads.json")
+    results = {}
+    threads = [threading.Thread(target=lambda p=p: results.__setitem__(p.name, pool.ensure(p))) for p in (a, b, c)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    gate.set()
+    for t in threads:
+        t.join()
+
+    assert len(uploads) == 2
+    assert results["a.png"] == results["b.png"] != results["c.png"]
+
+    # Persisted: a new pool resolves the same content without uploading
+    reloaded = UploadPool(lambda *args: "never", path=root / "uploads.json")
+    assert reloaded.image_id(b) == results["a.png"]
+    assert reloaded.ensure(c) == results["c.png"]
+
+
+# ── CatalogMirror ───────────────────────────────────────────────
+
+class CountingMirror(CatalogMirror):
+    """CatalogMirror whose network is a dict of canned payloads."""
+
+    def __init__(self, payloads, **kwargs):
+        self.payloads = payloads
+        self.fetched = []
+        super().__init__(**kwargs)
+
+    def _fetch(self, path):
+        self.fetched.append(path)
+        return self.payloads[path]
+
+
+def catalog_payloads():
+    return {
+        "/catalog/blueprints.json": [{"id": 281, "title": "AOP Hoodie"}, {"id": 5, "title": "Mug"}],
+        "/catalog/blueprints/281/print_providers.json": [{"id": 10}, {"id": 11}],
+        "/catalog/blueprints/281/print_providers/10/variants.json": {"variants": [
+            {"id": 1, "placeholders": [{"position": "front"}, {"position": "back"}]},
+            {"id": 2, "placeholders": [{"position": "front"}, {"position": "left_sleeve"}]},
+        ]},
+    }
+
+
+def test_catalog_mirror_serves_fresh_entries_locally():
+    path = workdir() / "catalog.json"
+    mirror = CountingMirror(catalog_payloads(), path=path)
+    assert [b["id"] for b in mirror.aop_blueprints()] == [281]
+    assert mirror.blueprint(281)["title"] == "AOP Hoodie"
+    assert mirror.positions(281) == ["front", "back", "left_sleeve"]
+    assert mirror.positions(281) == ["front", "back", "left_sleeve"]
+    assert len(mirror.fetched) == 3
+
+    reloaded = CountingMirror(catalog_payloads(), path=path)
+    assert reloaded.positions(281) == ["front", "back", "left_sleeve"]
+    assert reloaded.fetched == []
+
+
+def test_catalog_mirror_refetches_stale_entries():
+    path = workdir() / "catalog.json"
+    CountingMirror(catalog_payloads(), path=path).providers(281)
+    stale = CountingMirror(catalog_payloads(), path=path, ttl=timedelta(seconds=-1))
+    stale.providers(281)
+    assert stale.fetched == ["/catalog/blueprints/281/print_providers.json"]
+
+
+# ── VariantCostCache / PricingEngine.plan ───────────────────────
+
+def engine_with(cache: VariantCostCache, margin=0.3) -> PricingEngine:
+    engine = PricingEngine.__new__(PricingEngine)
+    engine.margin = margin
+    engine.cache = cache
+    return engine
+
+
+def test_cost_cache_keeps_costs_across_price_only_payloads():
+    cache = VariantCostCache(path=workdir() / "costs.json")
+    cache.ingest({"id": "p1", "variants": [{"id": 1, "cost": 700, "price": 1000}]})
+    cache.ingest({"id": "p1", "variants": [{"id": 1, "price": 1200}]})
+    assert cache.products["p1"]["variants"]["1"] == {"cost": 700, "price": 1200}
+    assert cache.fresh("p1")
+    assert cache.fresh("p1", max_age=timedelta(seconds=-1)) is None
+
+    cache.save()
+    assert VariantCostCache(path=cache.path).products == cache.products
+
+
+def test_plan_reprices_from_cost_only():
+    cache = VariantCostCache(path=workdir() / "costs.json")
+    cache.ingest({"id": "on_target", "variants": [{"id": 1, "cost": 700, "price": 1000}]})
+    cache.ingest({"id": "off_target", "variants": [{"id": 2, "cost": 700, "price": 900},
+                                                   {"id": 3, "cost": None, "price": 2500}]})
+    cache.ingest({"id": "no_cost", "variants": [{"id": 4, "cost": None, "price": 999}]})
+    updates = engine_with(cache).plan(["on_target", "off_target", "no_cost"])
+    # Variants without a cost keep their price instead of compounding a markup
+    assert updates == {"off_target": [{"id": 2, "price": 1000}, {"id": 3, "price": 2500}]}
+
+
+if __name__ == "__main__":
+    print("--- [TEST_INIT]: FABRICATOR_CACHES ---")
+    failed = 0
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            try:
+                fn()
+                print(f"[TEST_PASS] {name}")
+            except Exception as e:
+                failed += 1
+                print(f"[TEST_FAIL] {name}: {e!r}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,93 @@
+"""
+/* [FILE_ID]: UPLOAD_POOL // VERSION: 1.0 // STATUS: STABLE */
+Content-addressed registry of images already in the Printify media library.
+
+Local files are keyed by the sha256 of their bytes. A file that was uploaded
+before (by any run) maps straight to its Printify image id, and concurrent
+requests for the same content share one upload. Persisted to
+artifacts/.printify_uploads.json.
+"""
+
+import hashlib
+import json
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+POOL_FILE = Path(__file__).resolve().parent.parent.parent.parent / "artifacts" / ".printify_uploads.json"
+
+
+def file_digest(path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class UploadPool:
+    """
+    Usage:
+        pool = UploadPool(explorer.upload_image)       # uploader(local_path, file_name) -> id
+        pool.ensure(path)                             # thread-safe, deduped by content
+        pool.image_id("artifacts/graphics/tiles/x.png")
+    """
+
+    def __init__(self, uploader: Callable[[str, str], str], path: Path = POOL_FILE):
+        self.uploader = uploader
+        self.path = path
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, threading.Event] = {}
+        self.images: Dict[str, Dict] = {}
+        self.load()
+
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            self.images = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            self.images = {}
+
+    def save(self) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.images, indent=1, sort_keys=True), encoding="utf-8")
+            tmp.replace(self.path)
+
+    def image_id(self, local_path) -> Optional[str]:
+        """Printify id for local_path's content, if it has been uploaded."""
+        entry = self.images.get(file_digest(local_path))
+        return entry["id"] if entry else None
+
+    def ensure(self, local_path, file_name: Optional[str] = None) -> str:
+        """Return the Printify image id for local_path, uploading only unseen content."""
+        digest = file_digest(local_path)
+        while True:
+            with self._lock:
+                entry = self.images.get(digest)
+                if entry:
+                    return entry["id"]
+                pending = self._inflight.get(digest)
+                if pending is None:
+                    self._inflight[digest] = threading.Event()
+                    break
+            pending.wait()
+
+        try:
+            name = file_name or Path(local_path).name
+            print(f"// UPLOADING: {Path(local_path).name}")
+            image_id = self.uploader(str(local_path), name)
+            with self._lock:
+                self.images[digest] = {
+                    "id": image_id,
+                    "file_name": name,
+                    "uploaded_at": datetime.now(timezone.utc).isoformat(),
+                }
+            self.save()
+            return image_id
+        finally:
+            with self._lock:
+                self._inflight.pop(digest).set()
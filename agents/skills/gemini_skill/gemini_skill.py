@@ -10,6 +10,8 @@ from google import genai
 from google.genai import types
 from dotenv import load_dotenv
 
+from .inline_image import save_inline_image, native_extension
+
 # Ollama fallback imports
 try:
     from agents.skills.ollama_skill.ollama_skill import (
@@ -86,12 +88,11 @@ def generate_specimen_image(model_name: str, prompt: str):
             for i, part in enumerate(response.candidates[0].content.parts):
                 if part.inline_data:
                     if 'image' in part.inline_data.mime_type:
-                        img = part.as_image()
+                        # Saved in the format Gemini returned; no decode/re-encode
                         output_dir = os.path.join("artifacts", "graphics", "specimens")
-                        os.makedirs(output_dir, exist_ok=True)
-                        filename = f"gemini_specimen_{int(time.time())}_{i}.png"
+                        filename = f"gemini_specimen_{int(time.time())}_{i}{native_extension(part.inline_data)}"
                         file_path = os.path.join(output_dir, filename)
-                        img.save(file_path)
+                        save_inline_image(part.inline_data, file_path)
                         saved_paths.append(file_path)
                         image_saved = True
         
@@ -0,0 +1,132 @@
+# [FILE_ID]: skills/GEMINI_SKILL/IMAGE_CONTEXT // VERSION: 1.0 // STATUS: STABLE
+# [NARRATIVE]: Reference images for multimodal calls, prepared once. A source
+# (mockup URL, file path, raw bytes or PIL image) is downscaled to the model's
+# effective input edge and encoded a single time. The result is cached on disk
+# under artifacts/.cache/context/ (keyed by source content + edge) and in a small
+# in-process LRU. Retries, lifestyle variants of one product and the
+# verification path all send the same prepared bytes.
+
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from .inline_image import sniff_format, header_size
+
+CONTEXT_DIR = Path(__file__).resolve().parent.parent.parent.parent / "artifacts" / ".cache" / "context"
+
+# Gemini tiles image input at 768px; past two tiles per side adds tokens, not detail.
+GEMINI_EDGE = int(os.getenv("GEMINI_CONTEXT_EDGE", "1536"))
+# Veo reference images feed a 720p/1080p generator.
+VEO_EDGE = int(os.getenv("VEO_CONTEXT_EDGE", "1280"))
+JPEG_QUALITY = 90
+MEMORY_SLOTS = 16
+
+_lock = threading.Lock()
+_memory: "OrderedDict[str, PreparedImage]" = OrderedDict()
+
+
+class PreparedImage:
+    """Encoded reference bytes plus the SDK Part built from them (built once, reused)."""
+
+    def __init__(self, data: bytes, mime_type: str, size: Optional[Tuple[int, int]], key: str):
+        self.data = data
+        self.mime_type = mime_type
+        self.size = size
+        self.key = key
+        self._part = None
+
+    def part(self):
+        """google.genai Part for generate_content contents."""
+        if self._part is None:
+            from google.genai import types
+            self._part = types.Part.from_bytes(data=self.data, mime_type=self.mime_type)
+        return self._part
+
+    def image(self):
+        """google.genai Image (e.g. for Veo reference images)."""
+        from google.genai import types
+        return types.Image(image_bytes=self.data, mime_type=self.mime_type)
+
+    def __repr__(self) -> str:
+        return f"PreparedImage({self.mime_type}, {self.size}, {len(self.data)} bytes)"
+
+
+def _source_bytes(source) -> bytes:
+    """Raw encoded bytes for a URL, path or bytes source; PIL images are encoded losslessly once."""
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    if isinstance(source, Path) or (isinstance(source, str) and not source.startswith(("http://", "https://"))):
+        return Path(source).read_bytes()
+    if isinstance(source, str):
+        from agents.skills.fabricator import mockup_cache
+        return mockup_cache.fetch_bytes(source)
+    buf = io.BytesIO()
+    source.save(buf, format="PNG", compress_level=1)
+    return buf.getvalue()
+
+
+def _encode(raw: bytes, max_edge: int) -> Tuple[bytes, str, Optional[Tuple[int, int]]]:
+    """Downscale to max_edge and encode; JPEG/PNG already within bounds pass through untouched."""
+    fmt, size = sniff_format(raw), header_size(raw)
+    if fmt in ("JPEG", "PNG") and size and max(size) <= max_edge and (fmt == "JPEG" or len(raw) < 1 << 20):
+        return raw, "image/jpeg" if fmt == "JPEG" else "image/png", size
+
+    from PIL import Image
+    with Image.open(io.BytesIO(raw)) as img:
+        img.draft("RGB", (max_edge, max_edge))   # JPEG: decode at reduced scale
+        img = img.copy()
+    img.thumbnail((max_edge, max_edge), Image.LANCZOS)
+    out = io.BytesIO()
+    if "A" in img.getbands() or "transparency" in img.info:
+        img.save(out, format="PNG", optimize=False, compress_level=6)
+        return out.getvalue(), "image/png", img.size
+    img.convert("RGB").save(out, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+    return out.getvalue(), "image/jpeg", img.size
+
+
+def prepare_reference(source: Union[str, Path, bytes, "object", "PreparedImage"],
+                      max_edge: int = GEMINI_EDGE) -> PreparedImage:
+    """
+    Prepared, cached reference image for `source`. Accepts a mockup URL (read
+    through mockup_cache), a local path, encoded bytes, a PIL image, or an
+    already prepared image (returned as-is).
+    """
+    if isinstance(source, PreparedImage):
+        return source
+    raw = _source_bytes(source)
+    key = f"{hashlib.sha256(raw).hexdigest()[:32]}_{max_edge}"
+
+    with _lock:
+        hit = _memory.get(key)
+        if hit is not None:
+            _memory.move_to_end(key)
+            return hit
+
+    prepared = None
+    for ext, mime in ((".jpg", "image/jpeg"), (".png", "image/png")):
+        path = CONTEXT_DIR / f"{key}{ext}"
+        if path.exists():
+            data = path.read_bytes()
+            prepared = PreparedImage(data, mime, header_size(data), key)
+            break
+    if prepared is None:
+        data, mime, size = _encode(raw, max_edge)
+        prepared = PreparedImage(data, mime, size, key)
+        if data is not raw:   # pass-throughs already live in their source (e.g. the mockup cache)
+            CONTEXT_DIR.mkdir(parents=True, exist_ok=True)
+            path = CONTEXT_DIR / f"{key}{'.jpg' if mime == 'image/jpeg' else '.png'}"
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        dims = f"{size[0]}x{size[1]}" if size else "unknown size"
+        print(f"[SYSTEM_LOG]: Reference context prepared — {len(raw) // 1024} KB → {len(data) // 1024} KB ({dims}, {mime})")
+
+    with _lock:
+        _memory[key] = prepared
+        while len(_memory) > MEMORY_SLOTS:
+            _memory.popitem(last=False)
+    return prepared
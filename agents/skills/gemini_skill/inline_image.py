@@ -0,0 +1,111 @@
+# [FILE_ID]: skills/GEMINI_SKILL/INLINE_IMAGE // VERSION: 1.0 // STATUS: STABLE
+# [NARRATIVE]: Gemini returns images already encoded (inline_data.data + mime_type).
+# These helpers write those bytes to disk as-is and read format and dimensions
+# from the header alone. Pixels are decoded only when the destination asks for
+# a different format than the one Gemini sent.
+
+import io
+import os
+import struct
+from pathlib import Path
+from typing import Optional, Tuple
+
+MIME_EXTENSIONS = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+}
+SUFFIX_FORMATS = {".png": "PNG", ".jpg": "JPEG", ".jpeg": "JPEG", ".webp": "WEBP", ".gif": "GIF"}
+
+
+def sniff_format(data: bytes) -> Optional[str]:
+    """PIL-style format name from the magic bytes, or None."""
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        return "PNG"
+    if data[:3] == b"\xff\xd8\xff":
+        return "JPEG"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "WEBP"
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return "GIF"
+    return None
+
+
+def header_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """(width, height) parsed from the encoded header without decoding pixels."""
+    fmt = sniff_format(data)
+    try:
+        if fmt == "PNG":
+            return struct.unpack(">II", data[16:24])
+        if fmt == "GIF":
+            return struct.unpack("<HH", data[6:10])
+        if fmt == "WEBP":
+            chunk = data[12:16]
+            if chunk == b"VP8 ":
+                w, h = struct.unpack("<HH", data[26:30])
+                return w & 0x3FFF, h & 0x3FFF
+            if chunk == b"VP8L":
+                bits = int.from_bytes(data[21:25], "little")
+                return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            if chunk == b"VP8X":
+                return int.from_bytes(data[24:27], "little") + 1, int.from_bytes(data[27:30], "little") + 1
+        if fmt == "JPEG":
+            i = 2
+            while i + 9 < len(data):
+                if data[i] != 0xFF:
+                    i += 1
+                    continue
+                marker = data[i + 1]
+                if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+                    i += 2
+                    continue
+                length = struct.unpack(">H", data[i + 2:i + 4])[0]
+                # SOF0..SOF15, excluding DHT (C4), JPG (C8) and DAC (CC)
+                if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                    h, w = struct.unpack(">HH", data[i + 5:i + 9])
+                    return w, h
+                i += 2 + length
+    except struct.error:
+        pass
+    return None
+
+
+def native_extension(inline_data) -> str:
+    """File extension matching the bytes Gemini sent."""
+    ext = MIME_EXTENSIONS.get((inline_data.mime_type or "").lower())
+    if ext:
+        return ext
+    fmt = sniff_format(inline_data.data)
+    return {"PNG": ".png", "JPEG": ".jpg", "WEBP": ".webp", "GIF": ".gif"}.get(fmt, ".png")
+
+
+def save_inline_image(inline_data, path) -> Tuple[Path, Optional[Tuple[int, int]]]:
+    """
+    Write a Gemini inline image to `path`. When the suffix names the format
+    the bytes are already in (or names no known format), the bytes are written
+    verbatim; otherwise they are decoded once and re-encoded to that format.
+    The write is atomic (tmp file + replace). Returns (path, (width, height)).
+    """
+    path = Path(path)
+    data = inline_data.data
+    native = sniff_format(data)
+    wanted = SUFFIX_FORMATS.get(path.suffix.lower())
+
+    if wanted and native and wanted != native:
+        from PIL import Image
+        with Image.open(io.BytesIO(data)) as img:
+            if wanted == "JPEG" and img.mode not in ("RGB", "L"):
+                img = img.convert("RGB")
+            out = io.BytesIO()
+            img.save(out, format=wanted)
+            size = img.size
+        data = out.getvalue()
+    else:
+        size = header_size(data)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return path, size
@@ -0,0 +1,45 @@
+"""
+/* [FILE_ID]: LEAKY_BUCKET // VERSION: 1.0 // STATUS: STABLE */
+Thread-safe client-side leaky bucket shared by the API throttles
+(shopify_skill's REST bucket, fabricator/printify_limiter's Printify buckets).
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class LeakyBucket:
+    """`size` requests of burst, draining at leak_rate requests/s."""
+
+    def __init__(self, size: int, leak_rate: float):
+        self.size = size
+        self.leak_rate = leak_rate
+        self.level = 0.0
+        self.stamp = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.level = max(0.0, self.level - (now - self.stamp) * self.leak_rate)
+                self.stamp = now
+                if self.level + 1 <= self.size:
+                    self.level += 1
+                    return
+                wait = (self.level + 1 - self.size) / self.leak_rate
+            time.sleep(wait)
+
+    def sync(self, header: Optional[str]) -> None:
+        """Align with a server-reported 'used/size' header (e.g. X-Shopify-Shop-Api-Call-Limit)."""
+        if not header or "/" not in header:
+            return
+        try:
+            used, size = (int(x) for x in header.split("/", 1))
+        except ValueError:
+            return
+        with self.lock:
+            self.size = size
+            self.level = max(self.level, float(used))
+            self.stamp = time.monotonic()
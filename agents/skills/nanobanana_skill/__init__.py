@@ -1 +1,2 @@
 from .nanobanana_skill import generate_nano_banana_image
+from .batch import ImageBatch, generate_batch
@@ -0,0 +1,253 @@
+# [FILE_ID]: skills/NANOBANANA_SKILL/ASSET_POOL // VERSION: 1.0 // STATUS: STABLE
+# [NARRATIVE]: Speculative tiles and textures, synthesized ahead of need. A
+# background worker (scripts/prefill_asset_pool.py) fills the pool for the lore
+# themes and remix pairs fabrication is likely to pick next; fabrication claims
+# a ready image instead of waiting on Gemini.
+#
+# Layout under artifacts/.asset_pool/:
+#   staging/<role>/<run>/   synthesis in progress (wiped when a worker starts)
+#   ready/<role>/<run>/     specimen + prompt.txt + pool.json (themes, signature, created_at)
+#   claimed/<run>/          transient: a claim renames ready -> claimed (atomic, one winner),
+#                           then moves the run folder into artifacts/graphics/<role>/
+# Entries are evicted by age, by stale signature (lore or recommendation
+# modifiers changed), and by theme when an on-plan entry needs the room.
+#
+# Idle detection: a fabrication process holds a shared flock on busy.lock for
+# its lifetime (mark_busy); the worker only synthesizes while it can take the
+# lock exclusively. One worker runs at a time (flock on worker.lock).
+
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+POOL_DIR = REPO_ROOT / "artifacts" / ".asset_pool"
+STAGING_DIR = POOL_DIR / "staging"
+READY_DIR = POOL_DIR / "ready"
+CLAIMED_DIR = POOL_DIR / "claimed"
+GRAPHICS_DIR = REPO_ROOT / "artifacts" / "graphics"
+BUSY_LOCK = POOL_DIR / "busy.lock"
+WORKER_LOCK = POOL_DIR / "worker.lock"
+WORKER_LOG = POOL_DIR / "worker.log"
+META_NAME = "pool.json"
+
+ROLES = ("tiles", "textures")
+ENABLED = os.getenv("ASSET_POOL", "1") != "0"
+MAX_ENTRIES = int(os.getenv("ASSET_POOL_MAX", "16"))
+MAX_AGE = timedelta(hours=int(os.getenv("ASSET_POOL_MAX_AGE_HOURS", "72")))
+
+_busy_handle = None
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def signature(*parts) -> str:
+    """Fingerprint of everything a prompt is derived from (lore text, modifiers, role)."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+
+# ── entries ─────────────────────────────────────────────────────
+
+class PoolEntry:
+    """One ready run folder: ready/<role>/<run>/ with its pool.json."""
+
+    def __init__(self, path: Path, meta: dict):
+        self.path = path
+        self.meta = meta
+
+    @property
+    def themes(self) -> Tuple[str, ...]:
+        return tuple(self.meta["themes"])
+
+    @property
+    def role(self) -> str:
+        return self.meta["role"]
+
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromisoformat(self.meta["created_at"])
+
+    def age(self) -> timedelta:
+        return _now() - self.created_at
+
+    def image_name(self) -> str:
+        return self.meta["image"]
+
+
+def entries(role: Optional[str] = None) -> List[PoolEntry]:
+    """Ready entries, oldest first."""
+    found = []
+    for r in ([role] if role else ROLES):
+        for meta_path in (READY_DIR / r).glob(f"*/{META_NAME}"):
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                continue
+            if (meta_path.parent / meta.get("image", "")).is_file():
+                found.append(PoolEntry(meta_path.parent, meta))
+    found.sort(key=lambda e: e.meta["created_at"])
+    return found
+
+
+def ready_themes() -> set:
+    """Theme tuples ((theme,) or (base, breach)) with at least one ready entry."""
+    return {e.themes for e in entries()}
+
+
+def add(image_path, themes: Sequence[str], role: str, sig: str, prompt: str) -> Path:
+    """
+    Publish a synthesized run folder (staging/<role>/<run>/) into ready/.
+    pool.json is written before the rename, so ready/ never holds a partial entry.
+    """
+    image_path = Path(image_path)
+    run_dir = image_path.parent
+    meta = {
+        "themes": list(themes),
+        "role": role,
+        "signature": sig,
+        "prompt": prompt,
+        "image": image_path.name,
+        "created_at": _now().isoformat(),
+    }
+    tmp = run_dir / f".{META_NAME}.tmp"
+    tmp.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    tmp.replace(run_dir / META_NAME)
+    target = READY_DIR / role / run_dir.name
+    target.parent.mkdir(parents=True, exist_ok=True)
+    run_dir.rename(target)
+    return target
+
+
+def evict(entry: PoolEntry, reason: str) -> None:
+    shutil.rmtree(entry.path, ignore_errors=True)
+    print(f"[SYSTEM_LOG]: Asset pool evicted {entry.role} for {' x '.join(entry.themes)} ({reason})")
+
+
+def claim(themes: Sequence[str], role: str, sig: str) -> Optional[str]:
+    """
+    Take the oldest ready `role` image for `themes` whose signature matches.
+    The rename into claimed/ is the claim: concurrent pipelines never get the
+    same entry. The run folder then lands in artifacts/graphics/<role>/, exactly
+    where a live synthesis would have written it. Returns the image path or None.
+    """
+    if not ENABLED:
+        return None
+    themes = tuple(themes)
+    for entry in entries(role):
+        if entry.themes != themes:
+            continue
+        if entry.meta.get("signature") != sig:
+            evict(entry, "stale prompt context")
+            continue
+        if entry.age() > MAX_AGE:
+            evict(entry, "expired")
+            continue
+        CLAIMED_DIR.mkdir(parents=True, exist_ok=True)
+        claimed = CLAIMED_DIR / entry.path.name
+        try:
+            entry.path.rename(claimed)
+        except OSError:
+            continue   # another pipeline won this one
+        (claimed / META_NAME).unlink(missing_ok=True)
+        dest = GRAPHICS_DIR / role / claimed.name
+        n = 2
+        while dest.exists():
+            dest = GRAPHICS_DIR / role / f"{claimed.name}-{n}"
+            n += 1
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(claimed), str(dest))
+        return str(dest / entry.image_name())
+    return None
+
+
+def prune(keep: Iterable[Tuple[str, ...]] = (), current_sig=None, room_for: int = 0) -> int:
+    """
+    Evict expired entries, entries whose signature no longer matches
+    current_sig(themes, role), and, when more than MAX_ENTRIES - room_for remain,
+    the oldest entries for themes outside `keep`. Returns the number left.
+    """
+    keep = set(keep)
+    live = []
+    for entry in entries():
+        if entry.age() > MAX_AGE:
+            evict(entry, "expired")
+        elif current_sig and entry.meta.get("signature") != current_sig(entry.themes, entry.role):
+            evict(entry, "stale prompt context")
+        else:
+            live.append(entry)
+    overflow = len(live) - max(0, MAX_ENTRIES - room_for)
+    for entry in [e for e in live if e.themes not in keep]:
+        if overflow <= 0:
+            break
+        evict(entry, "theme off the plan")
+        live.remove(entry)
+        overflow -= 1
+    return len(live)
+
+
+# ── idle detection and worker ──────────────────────────────────
+
+def mark_busy() -> None:
+    """Hold a shared lock on busy.lock until this process exits; the worker waits it out."""
+    global _busy_handle
+    if _busy_handle is not None or not ENABLED:
+        return
+    POOL_DIR.mkdir(parents=True, exist_ok=True)
+    handle = open(BUSY_LOCK, "a")
+    fcntl.flock(handle, fcntl.LOCK_SH)
+    _busy_handle = handle
+
+
+def is_idle() -> bool:
+    """True when no fabrication process holds busy.lock."""
+    POOL_DIR.mkdir(parents=True, exist_ok=True)
+    with open(BUSY_LOCK, "a") as handle:
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        fcntl.flock(handle, fcntl.LOCK_UN)
+    return True
+
+
+def wait_idle(poll: int = 10) -> None:
+    while not is_idle():
+        time.sleep(poll)
+
+
+def acquire_worker_lock():
+    POOL_DIR.mkdir(parents=True, exist_ok=True)
+    handle = open(WORKER_LOCK, "w")
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        handle.close()
+        return None
+    return handle
+
+
+def spawn_worker() -> None:
+    """Start a detached fill worker. A worker already running keeps the lock, so the new one just exits."""
+    if not ENABLED:
+        return
+    POOL_DIR.mkdir(parents=True, exist_ok=True)
+    with open(WORKER_LOG, "a") as log:
+        subprocess.Popen(
+            [sys.executable, str(REPO_ROOT / "scripts" / "prefill_asset_pool.py"), "--fill"],
+            cwd=str(REPO_ROOT), stdout=log, stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL, start_new_session=True,
+        )
@@ -0,0 +1,361 @@
+# [FILE_ID]: skills/NANOBANANA_SKILL/BATCH // VERSION: 1.0 // STATUS: STABLE
+# [NARRATIVE]: Batch-mode Nanobanana synthesis for non-urgent bulk work (asset
+# pool fills, lifestyle backfills). Prompt jobs are collected, submitted as one
+# asynchronous batch (Gemini Batch API: higher throughput, lower cost per
+# image, results within hours), and collected later. Each finished image is
+# routed exactly like generate_nano_banana_image: <root>/<role>/<stamp>__<slug>/
+# with prompt.txt.
+#
+# Batches are tracked in artifacts/.nanobanana_batches/<batch_id>.json (written
+# atomically), so a later process can collect them: submit and walk away, then
+# run --collect. Requests are sent inline; a batch larger than MAX_INLINE_BYTES
+# is split into several remote jobs under one local batch id.
+#
+# Backends: "gemini" (client.batches) and "stub", a local stand-in that needs no
+# API key and completes after NANOBANANA_STUB_DELAY seconds with a generated PNG
+# per job (every NANOBANANA_STUB_FAIL_EVERY-th job fails). Pick one with
+# NANOBANANA_BATCH_BACKEND (default gemini).
+#
+# Usage:
+#   python3 -m agents.skills.nanobanana_skill.batch --status
+#   python3 -m agents.skills.nanobanana_skill.batch --collect          # poll once
+#   python3 -m agents.skills.nanobanana_skill.batch --collect --wait   # until every batch settles
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import time
+import uuid
+import zlib
+from collections import namedtuple
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from agents.skills.gemini_skill.inline_image import native_extension, save_inline_image
+from agents.skills.gemini_skill.image_context import prepare_reference
+from . import nanobanana_skill as nb
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+BATCH_DIR = REPO_ROOT / "artifacts" / ".nanobanana_batches"
+STUB_DIR = BATCH_DIR / "stub"
+MAX_INLINE_BYTES = 16 * 1024 * 1024     # the Batch API caps inline requests at 20 MB
+POLL_INTERVAL = 60
+TERMINAL = {"JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+
+InlineImage = namedtuple("InlineImage", "data mime_type")
+# One per request, in submission order: image (InlineImage-like or None), model text, error.
+JobResult = namedtuple("JobResult", "image text error")
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+# ── backends ────────────────────────────────────────────────────
+
+class GeminiBatchBackend:
+    """client.batches with inline requests."""
+
+    name = "gemini"
+
+    def submit(self, model: str, requests: List[dict], display_name: str) -> str:
+        inlined = []
+        for req in requests:
+            parts = [{"text": req["prompt"]}]
+            if req.get("context") is not None:
+                parts.append({"inline_data": {"mime_type": req["context"].mime_type, "data": req["context"].data}})
+            inlined.append({
+                "contents": [{"role": "user", "parts": parts}],
+                "config": {"response_modalities": ["IMAGE", "TEXT"], "image_config": {"aspect_ratio": "1:1"}},
+            })
+        job = nb.get_client().batches.create(model=model, src=inlined, config={"display_name": display_name})
+        return job.name
+
+    def poll(self, remote: str):
+        """(state, [JobResult] when succeeded else None)."""
+        job = nb.get_client().batches.get(name=remote)
+        state = job.state.name if hasattr(job.state, "name") else str(job.state)
+        if state != "JOB_STATE_SUCCEEDED":
+            return state, None
+        results = []
+        for item in (job.dest.inlined_responses or []):
+            if item.error:
+                results.append(JobResult(None, "", str(item.error)))
+                continue
+            image, text = None, []
+            candidates = item.response.candidates if item.response else None
+            for part in (candidates[0].content.parts if candidates else []):
+                if part.inline_data and image is None:
+                    image = part.inline_data
+                elif part.text:
+                    text.append(part.text)
+            results.append(JobResult(image, " ".join(text), None if image else "No image data returned"))
+        return state, results
+
+
+class StubBatchBackend:
+    """Local stand-in: no network, deterministic PNGs, configurable latency and failures."""
+
+    name = "stub"
+
+    def __init__(self, delay: Optional[float] = None, fail_every: Optional[int] = None):
+        self.delay = float(os.getenv("NANOBANANA_STUB_DELAY", "2") if delay is None else delay)
+        self.fail_every = int(os.getenv("NANOBANANA_STUB_FAIL_EVERY", "0") if fail_every is None else fail_every)
+
+    def submit(self, model: str, requests: List[dict], display_name: str) -> str:
+        remote = f"batches/stub-{uuid.uuid4().hex[:12]}"
+        STUB_DIR.mkdir(parents=True, exist_ok=True)
+        record = {
+            "model": model,
+            "display_name": display_name,
+            "ready_at": time.time() + self.delay,
+            "fail_every": self.fail_every,
+            "prompts": [r["prompt"] for r in requests],
+            "context_bytes": [len(r["context"].data) if r.get("context") is not None else 0 for r in requests],
+        }
+        _write_json(STUB_DIR / f"{remote.rsplit('/', 1)[-1]}.json", record)
+        return remote
+
+    def poll(self, remote: str):
+        record = json.loads((STUB_DIR / f"{remote.rsplit('/', 1)[-1]}.json").read_text(encoding="utf-8"))
+        if time.time() < record["ready_at"]:
+            return "JOB_STATE_RUNNING", None
+        results = []
+        for i, prompt in enumerate(record["prompts"], 1):
+            if record["fail_every"] and i % record["fail_every"] == 0:
+                results.append(JobResult(None, "", "stub: injected failure"))
+            else:
+                results.append(JobResult(InlineImage(_stub_png(prompt), "image/png"), "stub render", None))
+        return "JOB_STATE_SUCCEEDED", results
+
+
+BACKENDS = {"gemini": GeminiBatchBackend, "stub": StubBatchBackend}
+
+
+def get_backend(name: Optional[str] = None):
+    name = name or os.getenv("NANOBANANA_BATCH_BACKEND", "gemini")
+    if name not in BACKENDS:
+        raise ValueError(f"[SYSTEM_DISSONANCE]: Unknown batch backend '{name}' (expected {', '.join(BACKENDS)}).")
+    return BACKENDS[name]()
+
+
+def _stub_png(prompt: str, edge: int = 64) -> bytes:
+    """A solid-color PNG whose color is derived from the prompt."""
+    rgb = hashlib.sha256(prompt.encode("utf-8")).digest()[:3]
+    raw = b"".join(b"\x00" + rgb * edge for _ in range(edge))
+
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", edge, edge, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw))
+            + chunk(b"IEND", b""))
+
+
+def _write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    tmp.replace(path)
+
+
+# ── batches ─────────────────────────────────────────────────────
+
+class ImageBatch:
+    """
+    Usage:
+        batch = ImageBatch("asset-pool")
+        key = batch.add(prompt, graphic_type_override="tiles")
+        batch.submit()                      # returns at once
+        paths = batch.collect(wait=True)    # {key: image path or None}
+
+        ImageBatch.load(batch_id).collect() # from a later process
+    """
+
+    def __init__(self, display_name: str = "nanobanana", backend=None, model: str = None):
+        self.backend = backend or get_backend()
+        self.id = f"{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        self.display_name = display_name
+        self.model = model or nb.IMAGE_MODEL
+        self.created_at = _now()
+        self.jobs: Dict[str, dict] = {}
+        self.chunks: List[dict] = []
+        self._contexts: Dict[str, object] = {}
+
+    @property
+    def path(self) -> Path:
+        return BATCH_DIR / f"{self.id}.json"
+
+    def add(self, prompt: str, graphic_type_override: str = None, image_context=None,
+            output_root=None, key: str = None) -> str:
+        """Queue one prompt job; routing follows generate_nano_banana_image. Returns the job key."""
+        if self.chunks:
+            raise RuntimeError("[SYSTEM_DISSONANCE]: Batch already submitted.")
+        key = key or f"job-{len(self.jobs)}"
+        self.jobs[key] = {
+            "prompt": prompt,
+            "role": graphic_type_override or nb._classify_graphic_type(prompt),
+            "output_root": str(Path(output_root or "artifacts/graphics").resolve()),
+            "state": "queued",
+            "path": None,
+            "error": None,
+        }
+        if image_context is not None:
+            self._contexts[key] = prepare_reference(image_context)
+        return key
+
+    def save(self) -> None:
+        _write_json(self.path, {
+            "id": self.id,
+            "backend": self.backend.name,
+            "model": self.model,
+            "display_name": self.display_name,
+            "created_at": self.created_at,
+            "chunks": self.chunks,
+            "jobs": self.jobs,
+        })
+
+    @classmethod
+    def load(cls, batch_id: str) -> "ImageBatch":
+        data = json.loads((BATCH_DIR / f"{batch_id}.json").read_text(encoding="utf-8"))
+        batch = cls(data["display_name"], backend=get_backend(data["backend"]), model=data["model"])
+        batch.id, batch.created_at = data["id"], data["created_at"]
+        batch.chunks, batch.jobs = data["chunks"], data["jobs"]
+        return batch
+
+    @classmethod
+    def pending(cls) -> List["ImageBatch"]:
+        batches = []
+        for path in sorted(BATCH_DIR.glob("*.json")):
+            try:
+                batch = cls.load(path.stem)
+            except (OSError, json.JSONDecodeError, KeyError, ValueError):
+                continue
+            if not batch.settled():
+                batches.append(batch)
+        return batches
+
+    def settled(self) -> bool:
+        return all(job["state"] in ("done", "failed") for job in self.jobs.values())
+
+    def submit(self) -> str:
+        """Send every queued job as one asynchronous batch (split under the inline cap). Returns the batch id."""
+        if not self.jobs:
+            raise ValueError("[SYSTEM_DISSONANCE]: Empty batch.")
+        groups, size = [[]], 0
+        for key, job in self.jobs.items():
+            ctx = self._contexts.get(key)
+            weight = len(job["prompt"]) + (len(ctx.data) * 4 // 3 if ctx is not None else 0)
+            if groups[-1] and size + weight > MAX_INLINE_BYTES:
+                groups.append([])
+                size = 0
+            groups[-1].append(key)
+            size += weight
+
+        for n, keys in enumerate(groups, 1):
+            requests = [{"prompt": self.jobs[k]["prompt"], "context": self._contexts.get(k)} for k in keys]
+            name = f"{self.display_name}-{self.id}" + (f"-{n}" if len(groups) > 1 else "")
+            remote = self.backend.submit(self.model, requests, name)
+            self.chunks.append({"remote": remote, "keys": keys, "state": "JOB_STATE_PENDING"})
+            for k in keys:
+                self.jobs[k]["state"] = "submitted"
+        self._contexts.clear()
+        self.save()
+        nb._log(f"🎨 [SIGNAL_BROADCAST]: Batch {self.id} submitted to {self.backend.name}: "
+                f"{len(self.jobs)} job(s) in {len(self.chunks)} remote job(s).")
+        return self.id
+
+    def _route_result(self, job: dict, result: JobResult) -> None:
+        if result.error or result.image is None:
+            job["state"], job["error"] = "failed", result.error or "No image data returned"
+            return
+        run_dir, stamp = nb._route(job["prompt"], job["role"], job["output_root"])
+        # Saved in the format Gemini sent; no decode on the way to disk
+        path, size = save_inline_image(result.image, run_dir / f"specimen{native_extension(result.image)}")
+        nb._write_prompt_meta(run_dir, job["prompt"], stamp, f"{size[0]}x{size[1]}" if size else "unknown")
+        job["state"], job["path"] = "done", str(path)
+        if result.text:
+            nb._log(f"📝 [NANO_BANANA_LOG]: {result.text}")
+
+    def poll(self) -> bool:
+        """Poll every unsettled remote job once and route finished images. Returns True when settled."""
+        for chunk in self.chunks:
+            if chunk["state"] in TERMINAL:
+                continue
+            state, results = self.backend.poll(chunk["remote"])
+            chunk["state"] = state
+            if state == "JOB_STATE_SUCCEEDED":
+                for i, key in enumerate(chunk["keys"]):
+                    result = results[i] if i < len(results) else JobResult(None, "", "missing from batch output")
+                    self._route_result(self.jobs[key], result)
+            elif state in TERMINAL:
+                for key in chunk["keys"]:
+                    self.jobs[key]["state"], self.jobs[key]["error"] = "failed", state
+        self.save()
+        return self.settled()
+
+    def collect(self, wait: bool = False, poll_interval: int = POLL_INTERVAL,
+                timeout: Optional[float] = None) -> Dict[str, Optional[str]]:
+        """
+        Route finished results into the artifact tree. With wait, poll until
+        every job settles (or timeout). Returns {key: path} for done jobs and
+        {key: None} for failed ones; jobs still running are absent.
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        while not self.poll() and wait:
+            if deadline and time.monotonic() + poll_interval > deadline:
+                break
+            time.sleep(poll_interval)
+        done = sum(1 for j in self.jobs.values() if j["state"] == "done")
+        failed = sum(1 for j in self.jobs.values() if j["state"] == "failed")
+        nb._log(f"[SYSTEM_LOG]: Batch {self.id}: {done} done, {failed} failed, "
+                f"{len(self.jobs) - done - failed} running.")
+        return {k: j["path"] for k, j in self.jobs.items() if j["state"] in ("done", "failed")}
+
+
+def generate_batch(jobs: List[dict], display_name: str = "nanobanana", wait: bool = True,
+                   poll_interval: int = POLL_INTERVAL, backend=None) -> Dict[str, Optional[str]]:
+    """
+    One-call form: jobs are dicts of ImageBatch.add keyword arguments (prompt,
+    graphic_type_override, image_context, output_root, key).
+    """
+    batch = ImageBatch(display_name, backend=backend)
+    for job in jobs:
+        batch.add(**job)
+    batch.submit()
+    return batch.collect(wait=wait, poll_interval=poll_interval)
+
+
+def print_status() -> None:
+    batches = ImageBatch.pending()
+    print(f"[SYSTEM_LOG]: {len(batches)} unsettled batch(es) in {BATCH_DIR}")
+    for batch in batches:
+        states = {}
+        for job in batch.jobs.values():
+            states[job["state"]] = states.get(job["state"], 0) + 1
+        summary = ", ".join(f"{k}={v}" for k, v in sorted(states.items()))
+        print(f"  {batch.id}  {batch.display_name:<20} {batch.backend.name:<7} {summary}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Nanobanana batch jobs")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--status", action="store_true", help="List unsettled batches (default)")
+    mode.add_argument("--collect", action="store_true", help="Poll unsettled batches and route finished images")
+    parser.add_argument("--wait", action="store_true", help="With --collect, poll until every batch settles")
+    parser.add_argument("--poll", type=int, default=POLL_INTERVAL, help="Seconds between polls")
+    args = parser.parse_args()
+
+    if not args.collect:
+        print_status()
+        return
+    for batch in ImageBatch.pending():
+        batch.collect(wait=args.wait, poll_interval=args.poll)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,17 +9,29 @@ from datetime import datetime
 from pathlib import Path
 from google import genai
 from google.genai import types
-from PIL import Image
-import io
 from dotenv import load_dotenv
 
+from agents.skills.gemini_skill.inline_image import save_inline_image
+from agents.skills.gemini_skill.image_context import prepare_reference
+
 # Load environment variables
 load_dotenv()
 
 # 1. Setup Client
-# Ensure your API key is in your environment variables
+# Ensure your API key is in your environment variables. The client is created on
+# first use, so importing this module (e.g. for the stub batch backend) needs no key.
 api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY") or os.getenv("gemini_api_key")
-client = genai.Client(api_key=api_key)
+_client = None
+
+
+def get_client() -> genai.Client:
+    global _client
+    if _client is None:
+        _client = genai.Client(api_key=api_key)
+    return _client
+
+
+IMAGE_MODEL = "gemini-3.1-flash-image-preview"
 
 
 def _ts() -> str:
@@ -91,7 +103,33 @@ def _classify_graphic_type(prompt: str) -> str:
     
     return list(definitions.keys())[0] if definitions else "standalone"
 
-def generate_nano_banana_image(prompt, output_path=None, graphic_type_override=None, image_context=None, max_retries=3, retry_delay=5):
+def _claim_run_dir(type_dir: Path, name: str) -> Path:
+    """Atomically create a fresh run folder; parallel runs in the same second get a -N suffix."""
+    candidate = type_dir / name
+    n = 2
+    while True:
+        try:
+            candidate.mkdir(parents=True)
+            return candidate
+        except FileExistsError:
+            candidate = type_dir / f"{name}-{n}"
+            n += 1
+
+def _route(prompt, graphic_type_override=None, output_root=None):
+    """Claim <root>/<graphic type>/<stamp>__<slug>/ for a new specimen. Returns (run_dir, stamp)."""
+    graphic_type = graphic_type_override if graphic_type_override else _classify_graphic_type(prompt)
+    root = Path(output_root) if output_root else Path("artifacts/graphics")
+    type_dir = root / graphic_type
+    type_dir.mkdir(parents=True, exist_ok=True)
+
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return _claim_run_dir(type_dir, f"{stamp}__{_slugify_prompt(prompt)}"), stamp
+
+def _write_prompt_meta(run_dir: Path, prompt: str, stamp: str, dims: str) -> None:
+    prompt_file = run_dir / "prompt.txt"
+    prompt_file.write_text(f"prompt: {prompt}\nmodel: {IMAGE_MODEL}\ntimestamp: {stamp}\nsize: {dims}", encoding="utf-8")
+
+def generate_nano_banana_image(prompt, output_path=None, graphic_type_override=None, image_context=None, max_retries=3, retry_delay=5, output_root=None):
     """
     Synthesizes visual specimens via the Nanobanana (Gemini 3.1 Flash Image) protocol.
     Directs output to the appropriate artifact routing directory.
@@ -100,35 +138,31 @@ def generate_nano_banana_image(prompt, output_path=None, graphic_type_override=N
         prompt (str): The synthesis directive.
         output_path (str, optional): Manual output path override.
         graphic_type_override (str, optional): Role-based routing override (tiles/textures/mockups).
-        image_context (PIL.Image.Image, optional): Reference image to guide synthesis.
+        image_context (optional): Reference image to guide synthesis — a PreparedImage from
+            prepare_reference(), or a mockup URL, path, bytes or PIL image (prepared here).
         max_retries (int): Maximum retry attempts for transient errors (default: 3).
         retry_delay (int): Base delay in seconds between retries (exponential backoff).
+        output_root (optional): Routing root instead of artifacts/graphics (e.g. the asset pool's staging area).
     """
     _log(f"🎨 [SIGNAL_BROADCAST]: Sending prompt to Nanobanana: {prompt}")
     
     # Artifact Routing
-    graphic_type = graphic_type_override if graphic_type_override else _classify_graphic_type(prompt)
-    root = Path("artifacts/graphics")
-    type_dir = root / graphic_type
-    type_dir.mkdir(parents=True, exist_ok=True)
-
-    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    slug = _slugify_prompt(prompt)
-    run_dir = type_dir / f"{stamp}__{slug}"
-    run_dir.mkdir(parents=True, exist_ok=True)
+    run_dir, stamp = _route(prompt, graphic_type_override, output_root)
 
     final_output_path = Path(output_path) if output_path else run_dir / "specimen.png"
     
     # Build request contents
+    # The reference is downscaled and encoded once; every retry sends the same Part.
     contents = [prompt]
-    if image_context:
-        contents.append(image_context)
+    if image_context is not None:
+        contents.append(prepare_reference(image_context).part())
     
+    client = get_client()
     last_error = None
     for attempt in range(1, max_retries + 1):
         try:
             response = client.models.generate_content(
-                model="gemini-3.1-flash-image-preview",
+                model=IMAGE_MODEL,
                 contents=contents,
                 config=types.GenerateContentConfig(
                     response_modalities=["IMAGE", "TEXT"],
@@ -142,13 +176,13 @@ def generate_nano_banana_image(prompt, output_path=None, graphic_type_override=N
             image_saved = False
             for part in response.candidates[0].content.parts:
                 if part.inline_data:
-                    img = part.as_image()
-                    img.save(final_output_path)
-                    _log(f"✅ [SYSTEM_LOG]: Specimen stabilized at: {final_output_path}")
+                    # Gemini's encoded bytes go to disk as-is; decoded only if the path asks for another format
+                    _, size = save_inline_image(part.inline_data, final_output_path)
+                    dims = f"{size[0]}x{size[1]}" if size else "unknown"
+                    _log(f"✅ [SYSTEM_LOG]: Specimen stabilized at: {final_output_path} ({dims})")
                     
                     # Write prompt metadata
-                    prompt_file = run_dir / "prompt.txt"
-                    prompt_file.write_text(f"prompt: {prompt}\nmodel: gemini-3.1-flash-image-preview\ntimestamp: {stamp}", encoding="utf-8")
+                    _write_prompt_meta(run_dir, prompt, stamp, dims)
                     image_saved = True
                     break
                 
@@ -8,6 +8,11 @@ import json
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    from agents.skills.broadcast_encoder import encode_for
+except ImportError:
+    encode_for = None
+
 load_dotenv()
 
 class PinterestConduit:
@@ -176,7 +181,9 @@ class PinterestConduit:
                 
                 print(f"[SYSTEM_LOG]: Media registered. ID: {media_id}")
                 
-                # Step 2: Upload the file to the provided URL
+                # Step 2: Upload the file to the provided URL (fitted to Pinterest's size limit)
+                if encode_for:
+                    image_path = encode_for(image_path, "pinterest")
                 with open(image_path, "rb") as f:
                     files = {"file": (image_path.name, f)}
                     upload_response = requests.post(
@@ -1,30 +1,92 @@
 import json
 import os
-import shutil
 import requests
 import urllib.parse
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+PAGE_LIMIT = 50
+MAX_WORKERS = 8
+CHUNK_SIZE = 1 << 16
+MANIFEST_NAME = '.sync_manifest.json'
+
+
+def fetch_all_products(session, shop_id):
+    """Fetch every page of /products.json; pages after the first are fetched concurrently."""
+    url = f"https://api.printify.com/v1/shops/{shop_id}/products.json"
+
+    def page(n):
+        res = session.get(url, params={"page": n, "limit": PAGE_LIMIT}, timeout=60)
+        res.raise_for_status()
+        return res.json()
+
+    first = page(1)
+    products = list(first.get('data', []))
+    last_page = first.get('last_page', 1) or 1
+    if last_page > 1:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            for data in pool.map(page, range(2, last_page + 1)):
+                products.extend(data.get('data', []))
+    return products
+
+
+def load_json(path, default):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def download_image(session, url, path):
+    """Stream url to path via a temp file. Returns True on success."""
+    tmp = f"{path}.part"
+    try:
+        with session.get(url, stream=True, timeout=60) as img_res:
+            if img_res.status_code != 200:
+                return False
+            with open(tmp, 'wb') as f_img:
+                for chunk in img_res.iter_content(CHUNK_SIZE):
+                    f_img.write(chunk)
+        os.replace(tmp, path)
+        return True
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return False
+
+
+def write_if_changed(path, content):
+    """Write content unless the file already holds exactly it. Returns True if written."""
+    try:
+        with open(path, 'r') as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    with open(path, 'w') as f:
+        f.write(content)
+    return True
+
 
 def sync(shop_id, token_path, output_dir):
+    """
+    Incremental sync: products are diffed against the previous products.json
+    by updated_at, images against the manifest by src. Only new/changed images
+    are downloaded (concurrently), only changed pages rewritten, and files for
+    products that disappeared are pruned.
+    """
     # Setup paths
     img_dir = os.path.join(output_dir, 'Product images')
     md_dir = os.path.join(output_dir, 'products_md')
     catalog_path = os.path.join(output_dir, 'catalog.md')
     products_json_path = os.path.join(output_dir, 'products.json')
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
 
-    # 1. Cleanup old version (including images)
-    print("Cleaning up old catalog and images...")
-    if os.path.exists(img_dir):
-        shutil.rmtree(img_dir)
-    if os.path.exists(md_dir):
-        shutil.rmtree(md_dir)
-    if os.path.exists(catalog_path):
-        os.remove(catalog_path)
-    
     os.makedirs(img_dir, exist_ok=True)
     os.makedirs(md_dir, exist_ok=True)
 
-    # 2. Fetch products
+    # 1. Fetch products
     print(f"Fetching products for shop {shop_id}...")
     try:
         with open(token_path, 'r') as f:
@@ -33,24 +95,36 @@ def sync(shop_id, token_path, output_dir):
         print(f"Error reading token from {token_path}: {e}")
         return
 
-    headers = {"Authorization": f"Bearer {token}"}
-    url = f"https://api.printify.com/v1/shops/{shop_id}/products.json"
-    
+    session = requests.Session()
+    session.headers.update({"Authorization": f"Bearer {token}"})
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=MAX_WORKERS)
+    session.mount("https://", adapter)
+
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        data = response.json()
-        # Save products.json for reference
-        with open(products_json_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        products = fetch_all_products(session, shop_id)
     except Exception as e:
         print(f"Error fetching products: {e}")
         return
 
-    products = data.get('data', [])
-    print(f"Syncing {len(products)} products...")
+    # 2. Diff against the previous sync
+    previous = load_json(products_json_path, {})
+    previous = previous.get('data', []) if isinstance(previous, dict) else previous
+    previous_updated = {p.get('id'): p.get('updated_at') for p in previous}
+    have_manifest = os.path.exists(manifest_path)
+    manifest = load_json(manifest_path, {})
+    image_srcs = manifest.get('images', {})
+
+    changed_ids = {
+        p.get('id') for p in products
+        if previous_updated.get(p.get('id')) != p.get('updated_at')
+    }
+    print(f"Syncing {len(products)} products ({len(changed_ids)} new or changed)...")
 
     catalog_rows = []
+    downloads = []
+    wanted_images = {}
+    wanted_pages = set()
+    pages_written = 0
 
     for p in products:
         title = p.get('title', 'Unknown')
@@ -58,18 +132,19 @@ def sync(shop_id, token_path, output_dir):
         tags = p.get('tags', [])
         product_id = p.get('id', 'N/A')
         blueprint_id = p.get('blueprint_id', 'N/A')
-        
+
         # Sanitize for filename
         clean_filename = "".join([c if c.isalnum() else "_" for c in title])[:50]
         md_filename = f"{clean_filename}.md"
-        
+        wanted_pages.add(md_filename)
+
         # Price
         price = "N/A"
         if p.get('variants'):
             price = f"${p['variants'][0].get('price', 0) / 100:.2f}"
 
         # Build product page
-        md_content = [f"# {title}", 
+        md_content = [f"# {title}",
                       f"**Price:** {price}",
                       f"**Product ID:** `{product_id}`",
                       f"**Blueprint ID:** `{blueprint_id}`",
@@ -82,47 +157,80 @@ def sync(shop_id, token_path, output_dir):
         for i, img_obj in enumerate(p.get('images', [])):
             img_url = img_obj.get('src')
             if not img_url: continue
-            
+
             img_filename = f"{clean_filename}_{i}.jpg"
             img_path = os.path.join(img_dir, img_filename)
-            
-            # Download image
-            try:
-                img_res = requests.get(img_url, stream=True)
-                if img_res.status_code == 200:
-                    with open(img_path, 'wb') as f_img:
-                        for chunk in img_res.iter_content(1024):
-                            f_img.write(chunk)
-            except:
-                pass
-            
+            wanted_images[img_filename] = img_url
+
+            # Queue download only for new or changed images. On the first run
+            # with a manifest, files from the older sync are trusted while
+            # updated_at holds; after that an untracked file is re-fetched.
+            have_file = os.path.exists(img_path)
+            if have_file and not have_manifest and product_id not in changed_ids:
+                image_srcs[img_filename] = img_url
+            if image_srcs.get(img_filename) != img_url or not have_file:
+                downloads.append((img_filename, img_url, img_path))
+
             # Link for individual MD (relative)
             indiv_rel_img = urllib.parse.quote(f"../Product images/{img_filename}")
             md_content.append(f"![{title} {i}]({indiv_rel_img})\n")
-            
+
             # For catalog preview (first 2 images)
             if i < 2:
                 cat_rel_img = urllib.parse.quote(f"Product images/{img_filename}")
                 image_previews.append(f"![{title.replace('|', '&#124;')}]({cat_rel_img})")
 
-        # Write individual MD
-        with open(os.path.join(md_dir, md_filename), 'w') as f_md:
-            f_md.write("\n".join(md_content))
-            
+        # Write individual MD (only when its content changed)
+        if write_if_changed(os.path.join(md_dir, md_filename), "\n".join(md_content)):
+            pages_written += 1
+
         # Catalog Row
         title_for_table = title.replace('|', '&#124;')
         catalog_link = urllib.parse.quote(f"products_md/{md_filename}")
         catalog_rows.append(f"| [{title_for_table}]({catalog_link}) | `{product_id}` | `{blueprint_id}` | {price} | {' '.join(image_previews)} |")
 
+    # 3. Download new/changed images concurrently
+    if downloads:
+        print(f"Downloading {len(downloads)} new or changed image(s)...")
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            results = pool.map(lambda d: download_image(session, d[1], d[2]), downloads)
+            for (img_filename, img_url, img_path), ok in zip(downloads, results):
+                if ok:
+                    image_srcs[img_filename] = img_url
+                else:
+                    # Drop the stale copy too, so the next sync retries it
+                    image_srcs.pop(img_filename, None)
+                    if os.path.exists(img_path):
+                        os.remove(img_path)
+                    print(f"Warning: failed to download {img_filename}")
+
+    # 4. Prune files belonging to products that disappeared or were renamed
+    pruned = 0
+    for name in os.listdir(img_dir):
+        if name not in wanted_images:
+            os.remove(os.path.join(img_dir, name))
+            image_srcs.pop(name, None)
+            pruned += 1
+    for name in os.listdir(md_dir):
+        if name not in wanted_pages:
+            os.remove(os.path.join(md_dir, name))
+            pruned += 1
+
     # Write catalog.md
-    with open(catalog_path, 'w') as f_cat:
-        f_cat.write("### Product Catalog\n\n")
-        f_cat.write("| Product Name | Product ID | Blueprint ID | Price (MSRP) | Image Previews |\n")
-        f_cat.write("| :--- | :--- | :--- | :--- | :--- |\n")
-        for row in catalog_rows:
-            f_cat.write(f"{row}\n")
-
-    print(f"Success: Catalog updated with {len(products)} products.")
+    lines = ["### Product Catalog\n\n",
+             "| Product Name | Product ID | Blueprint ID | Price (MSRP) | Image Previews |\n",
+             "| :--- | :--- | :--- | :--- | :--- |\n"]
+    lines.extend(f"{row}\n" for row in catalog_rows)
+    write_if_changed(catalog_path, "".join(lines))
+
+    # Save products.json for reference (and as the next sync's baseline)
+    with open(products_json_path, 'w') as f:
+        json.dump({"data": products, "total": len(products)}, f, indent=2)
+    with open(manifest_path, 'w') as f:
+        json.dump({"images": {k: v for k, v in image_srcs.items() if k in wanted_images}}, f, indent=1, sort_keys=True)
+
+    print(f"Success: Catalog updated with {len(products)} products "
+          f"({len(downloads)} image download(s), {pages_written} page(s) rewritten, {pruned} file(s) pruned).")
 
 if __name__ == "__main__":
     if len(sys.argv) < 4:
@@ -1,2 +1,4 @@
 # [FILE_ID]: shopify_skill/__init__ // VERSION: 1.0 // STATUS: STABLE
 from .shopify_skill import ShopifyConduit
+from .store_index import StoreIndex
+from .article_index import ArticleLinkIndex
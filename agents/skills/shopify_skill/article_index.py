@@ -0,0 +1,199 @@
+# [FILE_ID]: skills/SHOPIFY_ARTICLE_INDEX // VERSION: 1.0 // STATUS: STABLE
+# [NARRATIVE]: Local map of which Printify products already have a blog article.
+# Seeded by one paginated pass over a blog, then kept current with updated_at
+# deltas and in-place records from article creation, so "which products are
+# missing a post" is a set difference instead of a scan of every body.
+
+import json
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, Dict, Iterable, List, Set
+
+from .shopify_skill import ShopifyConduit
+
+INDEX_FILE = Path(__file__).resolve().parent.parent.parent.parent / "artifacts" / ".shopify_article_links.json"
+INDEX_VERSION = 1
+
+# Deltas cannot observe deletions — a count mismatch or this age forces a full pass.
+FULL_REBUILD_AGE = timedelta(hours=24)
+SHARED_STALENESS = timedelta(minutes=10)
+
+ARTICLE_FIELDS = ["id", "title", "body_html", "updated_at"]
+TITLE_ID_RE = re.compile(r"[0-9a-f]{24}")
+BODY_ID_RE = re.compile(r"products/([0-9a-f]{24})")
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def extract_product_ids(article: Dict) -> List[str]:
+    """Printify product ids referenced by an article's title or product links in its body."""
+    ids = set(TITLE_ID_RE.findall((article.get("title") or "").lower()))
+    body = (article.get("body_html") or "").lower()
+    if "products/" in body:
+        ids.update(BODY_ID_RE.findall(body))
+    return sorted(ids)
+
+
+class ArticleLinkIndex:
+    """
+    Article id -> Printify product ids for one blog, persisted to
+    artifacts/.shopify_article_links.json. Links recorded explicitly at
+    creation time (record(article, product_id)) survive rebuilds even when the
+    article text does not mention the id.
+
+    Usage:
+        index = ArticleLinkIndex.shared(conduit, blog_id)
+        missing = index.missing(product_ids)
+        index.record(conduit.create_article(...), product_id)
+    """
+
+    _lock = threading.RLock()
+    _shared: Dict[int, "ArticleLinkIndex"] = {}
+    _shared_checked: Dict[int, datetime] = {}
+
+    def __init__(self, conduit: Optional[ShopifyConduit], blog_id: int, path: Path = INDEX_FILE):
+        self.conduit = conduit
+        self.blog_id = int(blog_id)
+        self.path = path
+        self.links: Dict[str, List[str]] = {}
+        self.explicit: Dict[str, str] = {}
+        self.built_at: Optional[str] = None
+        self.synced_through: Optional[str] = None
+        self.load()
+
+    @classmethod
+    def local(cls, conduit: Optional[ShopifyConduit], blog_id: int) -> "ArticleLinkIndex":
+        """The process-wide instance for a blog, as loaded from disk (no network)."""
+        blog_id = int(blog_id)
+        with cls._lock:
+            if blog_id not in cls._shared:
+                cls._shared[blog_id] = cls(conduit, blog_id)
+            index = cls._shared[blog_id]
+            index.conduit = index.conduit or conduit
+            return index
+
+    @classmethod
+    def shared(cls, conduit: ShopifyConduit, blog_id: int,
+               max_staleness: timedelta = SHARED_STALENESS) -> "ArticleLinkIndex":
+        """Process-wide index per blog, refreshed at most once per max_staleness."""
+        blog_id = int(blog_id)
+        with cls._lock:
+            now = _now()
+            index = cls.local(conduit, blog_id)
+            checked = cls._shared_checked.get(blog_id)
+            if checked is None or now - checked > max_staleness:
+                index.refresh()
+                cls._shared_checked[blog_id] = now
+            return index
+
+    # ── persistence ─────────────────────────────────────────────
+
+    def load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return
+        blog = data.get("blogs", {}).get(str(self.blog_id))
+        if data.get("version") != INDEX_VERSION or not blog:
+            return
+        self.links = blog.get("links", {})
+        self.explicit = blog.get("explicit", {})
+        self.built_at = blog.get("built_at")
+        self.synced_through = blog.get("synced_through")
+
+    def save(self) -> None:
+        with self._lock:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("version") != INDEX_VERSION:
+                    data = {}
+            except (FileNotFoundError, json.JSONDecodeError, OSError):
+                data = {}
+            data["version"] = INDEX_VERSION
+            data.setdefault("blogs", {})[str(self.blog_id)] = {
+                "built_at": self.built_at,
+                "synced_through": self.synced_through,
+                "links": self.links,
+                "explicit": self.explicit,
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            tmp.replace(self.path)
+
+    # ── synchronisation ─────────────────────────────────────────
+
+    def _ingest(self, article: Dict, advance: bool = True) -> None:
+        aid = str(article["id"])
+        ids = set(extract_product_ids(article))
+        if aid in self.explicit:
+            ids.add(self.explicit[aid])
+        self.links[aid] = sorted(ids)
+        if not advance:
+            return
+        stamp = article.get("updated_at")
+        if stamp and (not self.synced_through or stamp > self.synced_through):
+            self.synced_through = stamp
+
+    def rebuild(self) -> None:
+        """One paginated pass over every article in the blog."""
+        started = _now().isoformat()
+        with self._lock:
+            self.links, self.synced_through = {}, None
+            for article in self.conduit.iter_articles(self.blog_id, fields=ARTICLE_FIELDS):
+                self._ingest(article)
+            self.explicit = {a: p for a, p in self.explicit.items() if a in self.links}
+            self.built_at = started
+        self.save()
+        print(f"[SYSTEM_ECHO]: Article index rebuilt — {len(self.links)} article(s), "
+              f"{len(self.linked_product_ids())} linked product(s).")
+
+    def sync(self) -> int:
+        """Re-read articles updated since the newest one seen. Returns articles touched."""
+        touched = 0
+        params = {"updated_at_min": self.synced_through} if self.synced_through else None
+        with self._lock:
+            for article in self.conduit.iter_articles(self.blog_id, fields=ARTICLE_FIELDS, params=params):
+                self._ingest(article)
+                touched += 1
+        self.save()
+        return touched
+
+    def refresh(self, max_age: timedelta = FULL_REBUILD_AGE) -> None:
+        """Full pass when missing, stale, or when the article count shows a deletion; else a delta."""
+        stale = not self.built_at or _now() - datetime.fromisoformat(self.built_at) > max_age
+        if not stale:
+            count = self.conduit._get(f"blogs/{self.blog_id}/articles/count.json").get("count", 0)
+            touched = self.sync()
+            if count == len(self.links):
+                print(f"[SYSTEM_ECHO]: Article index synced — {touched} change(s).")
+                return
+        self.rebuild()
+
+    # ── lookups & in-place updates ──────────────────────────────
+
+    def record(self, article: Dict, product_id: Optional[str] = None) -> None:
+        """
+        Register a just-created (or edited) article, optionally pinning its
+        product id. The sync watermark is left alone: only sync()/rebuild() have
+        seen every article up to it, so records never hide unsynced edits.
+        """
+        if not article or not article.get("id"):
+            return
+        with self._lock:
+            if product_id:
+                self.explicit[str(article["id"])] = product_id.lower()
+            self._ingest(article, advance=False)
+        self.save()
+
+    def linked_product_ids(self) -> Set[str]:
+        with self._lock:
+            return {pid for ids in self.links.values() for pid in ids}
+
+    def missing(self, product_ids: Iterable[str]) -> Set[str]:
+        """The given product ids that no article links to."""
+        return {p.lower() for p in product_ids} - self.linked_product_ids()
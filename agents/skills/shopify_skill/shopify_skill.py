@@ -3,17 +3,90 @@
 # and Collection orchestration via the Admin REST API (2024-01).
 
 import os
+import re
+import io
 import json
+import time
+import uuid
+import hashlib
+import mimetypes
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator, Iterable, Tuple
 from dotenv import load_dotenv
 
+from agents.skills.leaky_bucket import LeakyBucket
+
 load_dotenv()
 
 # ─── API version pinned for stability ──────────────────────────
 API_VERSION = "2024-01"
 
+# ─── Pagination checkpoints (resumable syncs) ──────────────────
+CURSOR_FILE = Path(__file__).resolve().parent.parent.parent.parent / "artifacts" / ".shopify_cursors.json"
+# Per-run progress journals for bulk article rewrites
+REWRITE_JOURNAL_DIR = CURSOR_FILE.parent / ".shopify_rewrites"
+
+# ─── Store metadata cache (blogs, publications, shop info) ─────
+META_CACHE_FILE = CURSOR_FILE.parent / ".shopify_meta.json"
+META_TTL = 24 * 3600  # seconds
+
+# ─── Staged media uploads ──────────────────────────────────────
+STAGE_RETRIES = 3
+MEDIA_BATCH = 25        # productCreateMedia calls aliased into one GraphQL document
+
+# ─── REST leaky bucket (standard plan: 40 burst, 2 req/s leak) ─
+BUCKET_SIZE = 40
+LEAK_RATE = 2.0
+MAX_WORKERS = 4
+
+
+class _MultipartStream:
+    """
+    multipart/form-data body for a staged upload target, read lazily: the form
+    fields and part headers are small in-memory segments, the file itself is
+    read from disk block by block as the connection sends it. __len__ gives requests
+    an exact Content-Length, so the body is not sent chunked.
+    """
+
+    def __init__(self, fields: List[Tuple[str, str]], path: Path, mime_type: str):
+        self.boundary = f"loom-{uuid.uuid4().hex}"
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        head = b"".join(
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+            for name, value in fields
+        )
+        head += (f'--{self.boundary}\r\nContent-Disposition: form-data; name="file"; '
+                 f'filename="{path.name}"\r\nContent-Type: {mime_type}\r\n\r\n').encode()
+        tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self._file = open(path, "rb")
+        self._parts = [io.BytesIO(head), self._file, io.BytesIO(tail)]
+        self._length = len(head) + path.stat().st_size + len(tail)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        out = b""
+        while self._parts and (size < 0 or len(out) < size):
+            chunk = self._parts[0].read(-1 if size < 0 else size - len(out))
+            if not chunk:
+                self._parts.pop(0)
+                continue
+            out += chunk
+        return out
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def body_hash(body_html: Optional[str]) -> str:
+    """Hash of an article body with whitespace runs collapsed, so formatting-only diffs compare equal."""
+    normalized = re.sub(r"\s+", " ", body_html or "").strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
 
 class ShopifyConduit:
     """
@@ -35,55 +108,253 @@ class ShopifyConduit:
                 "must be set in your .env file. See agents/skills/shopify_skill/README.md."
             )
 
-        self.base_url = f"https://{self.store_url}/admin/api/{API_VERSION}"
+        # SHOPIFY_API_BASE points the conduit at a stand-in server (see standin_server.py)
+        self.base_url = os.getenv("SHOPIFY_API_BASE") or f"https://{self.store_url}/admin/api/{API_VERSION}"
         self.headers = {
             "X-Shopify-Access-Token": self.access_token,
             "Content-Type": "application/json",
         }
+        # Pooled session shared by every caller (and worker thread) of this conduit.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.bucket = LeakyBucket(BUCKET_SIZE, LEAK_RATE)
+        self._cursor_lock = threading.Lock()
+
+    # Metadata shared by every conduit in the process, keyed by store.
+    _meta: Dict[str, Dict[str, Dict]] = {}
+    _meta_lock = threading.RLock()
 
     # ── helpers ─────────────────────────────────────────────────
 
+    def _request(self, method: str, url: str, max_retries: int = 5, **kwargs) -> requests.Response:
+        """Issue a request through the shared bucket, backing off on 429 via Retry-After."""
+        for attempt in range(max_retries):
+            self.bucket.acquire()
+            r = self.session.request(method, url, **kwargs)
+            self.bucket.sync(r.headers.get("X-Shopify-Shop-Api-Call-Limit"))
+            if r.status_code != 429:
+                break
+            wait = float(r.headers.get("Retry-After") or 2 ** attempt)
+            print(f"[SYSTEM_WARNING]: Shopify 429 — throttled, retrying in {wait:.1f}s ({attempt + 1}/{max_retries})")
+            time.sleep(wait)
+        r.raise_for_status()
+        return r
+
     def _get(self, path: str, params: Optional[Dict] = None) -> Dict:
         url = f"{self.base_url}/{path}"
-        r = requests.get(url, headers=self.headers, params=params)
-        r.raise_for_status()
-        return r.json()
+        return self._request("GET", url, params=params).json()
 
     def _post(self, path: str, payload: Dict) -> Dict:
         url = f"{self.base_url}/{path}"
-        r = requests.post(url, headers=self.headers, json=payload)
-        r.raise_for_status()
-        return r.json()
+        return self._request("POST", url, json=payload).json()
 
     def _put(self, path: str, payload: Dict) -> Dict:
         url = f"{self.base_url}/{path}"
-        r = requests.put(url, headers=self.headers, json=payload)
-        r.raise_for_status()
-        return r.json()
+        return self._request("PUT", url, json=payload).json()
 
     def _delete(self, path: str) -> int:
         url = f"{self.base_url}/{path}"
-        r = requests.delete(url, headers=self.headers)
-        r.raise_for_status()
-        return r.status_code
+        return self._request("DELETE", url).status_code
 
     def _graphql(self, query: str, variables: Optional[Dict] = None) -> Dict:
         """Execute a Shopify Admin GraphQL query/mutation."""
-        url = f"https://{self.store_url}/admin/api/{API_VERSION}/graphql.json"
+        url = f"{self.base_url}/graphql.json"
         payload: Dict[str, Any] = {"query": query}
         if variables:
             payload["variables"] = variables
-        r = requests.post(url, headers=self.headers, json=payload)
+        r = self.session.post(url, json=payload)
         r.raise_for_status()
         return r.json()
 
+    # ── store metadata cache ────────────────────────────────────
+
+    def _meta_store(self) -> Dict[str, Dict]:
+        """This store's cache entries, loaded from disk on first use. Caller holds _meta_lock."""
+        if self.store_url not in self._meta:
+            try:
+                disk = json.loads(META_CACHE_FILE.read_text(encoding="utf-8"))
+            except (FileNotFoundError, json.JSONDecodeError, OSError):
+                disk = {}
+            self._meta[self.store_url] = disk.get(self.store_url, {})
+        return self._meta[self.store_url]
+
+    def _save_meta(self) -> None:
+        with self._meta_lock:
+            try:
+                disk = json.loads(META_CACHE_FILE.read_text(encoding="utf-8"))
+            except (FileNotFoundError, json.JSONDecodeError, OSError):
+                disk = {}
+            disk[self.store_url] = self._meta.get(self.store_url, {})
+            META_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = META_CACHE_FILE.with_suffix(".tmp")
+            tmp.write_text(json.dumps(disk, indent=1, sort_keys=True), encoding="utf-8")
+            tmp.replace(META_CACHE_FILE)
+
+    def _cached_meta(self, kind: str, loader, refresh: bool = False) -> Any:
+        """Serve `kind` from the metadata cache, calling loader() when missing, expired or refresh."""
+        with self._meta_lock:
+            entry = self._meta_store().get(kind)
+            if not refresh and entry and time.time() - entry.get("fetched", 0) < META_TTL:
+                return entry["data"]
+            data = loader()
+            self._meta_store()[kind] = {"fetched": time.time(), "data": data}
+            self._save_meta()
+            return data
+
+    def invalidate_meta(self, kind: Optional[str] = None) -> None:
+        """Drop one cached kind ('blogs', 'publications', 'shop'), or all of them."""
+        with self._meta_lock:
+            store = self._meta_store()
+            if kind:
+                store.pop(kind, None)
+            else:
+                store.clear()
+            self._save_meta()
+
+    def warm_metadata(self) -> None:
+        """Prime blogs, publications and shop info (no-op for entries still fresh). Never raises."""
+        for loader in (self.get_blogs, self.get_publications, self.shop_info):
+            try:
+                loader()
+            except Exception as e:
+                print(f"[SYSTEM_WARNING]: Metadata warm-up skipped {loader.__name__} — {e}")
+
+    def get_blogs(self, refresh: bool = False) -> List[Dict]:
+        """All blogs ({id, title, handle}), cached for META_TTL."""
+        def load():
+            blogs = self._get("blogs.json", params={"fields": "id,title,handle"}).get("blogs", [])
+            return [{"id": b["id"], "title": b.get("title", ""), "handle": b.get("handle", "")} for b in blogs]
+        return self._cached_meta("blogs", load, refresh=refresh)
+
+    def get_publications(self, refresh: bool = False) -> List[Dict]:
+        """Sales channels ({id, name}) from GraphQL, cached for META_TTL."""
+        def load():
+            resp = self._graphql("{ publications(first: 50) { edges { node { id name } } } }")
+            if resp.get("errors"):
+                raise RuntimeError(f"publications query failed — {resp['errors'][0].get('message', resp['errors'])}")
+            edges = ((resp.get("data") or {}).get("publications") or {}).get("edges", [])
+            return [e["node"] for e in edges]
+        return self._cached_meta("publications", load, refresh=refresh)
+
+    def shop_info(self, refresh: bool = False) -> Dict:
+        """shop.json, cached for META_TTL."""
+        return self._cached_meta("shop", lambda: self._get("shop.json").get("shop", {}), refresh=refresh)
+
+    # ── pagination ──────────────────────────────────────────────
+
+    @staticmethod
+    def _parse_next_link(link_header: Optional[str]) -> Optional[str]:
+        """Extract the 'next' URL from a Shopify Link header."""
+        if not link_header:
+            return None
+        for part in link_header.split(","):
+            if 'rel="next"' in part:
+                match = re.search(r"<([^>]+)>", part)
+                if match:
+                    return match.group(1)
+        return None
+
+    def _load_cursor(self, checkpoint: str) -> Optional[str]:
+        with self._cursor_lock:
+            if not CURSOR_FILE.exists():
+                return None
+            try:
+                return json.loads(CURSOR_FILE.read_text(encoding="utf-8")).get(checkpoint)
+            except (json.JSONDecodeError, OSError):
+                return None
+
+    def _save_cursor(self, checkpoint: str, next_url: Optional[str]) -> None:
+        """Persist (or clear, when next_url is None) the resume point for a checkpoint."""
+        with self._cursor_lock:
+            cursors: Dict[str, str] = {}
+            if CURSOR_FILE.exists():
+                try:
+                    cursors = json.loads(CURSOR_FILE.read_text(encoding="utf-8"))
+                except (json.JSONDecodeError, OSError):
+                    cursors = {}
+            if next_url:
+                cursors[checkpoint] = next_url
+            else:
+                cursors.pop(checkpoint, None)
+            CURSOR_FILE.parent.mkdir(parents=True, exist_ok=True)
+            CURSOR_FILE.write_text(json.dumps(cursors, indent=2, sort_keys=True), encoding="utf-8")
+
+    def iter_pages(
+        self,
+        path: str,
+        key: str,
+        params: Optional[Dict] = None,
+        checkpoint: Optional[str] = None,
+    ) -> Iterator[List[Dict]]:
+        """
+        Stream a REST collection one page at a time, following the Link header.
+
+        Args:
+            path:       Endpoint relative to the API root, e.g. 'comments.json'.
+            key:        Top-level response key holding the records, e.g. 'comments'.
+            params:     First-page query params (limit defaults to 250).
+            checkpoint: Optional cursor name. The next-page URL is persisted to
+                        artifacts/.shopify_cursors.json once the caller has consumed
+                        a page, so an interrupted sync resumes after the last page it
+                        finished. The cursor is cleared when the stream is exhausted.
+        """
+        query: Dict[str, Any] = {"limit": 250, **(params or {})}
+        url: Optional[str] = f"{self.base_url}/{path}"
+
+        if checkpoint:
+            resume_url = self._load_cursor(checkpoint)
+            if resume_url:
+                print(f"[SIGNAL_RECOVERY]: Resuming '{checkpoint}' from saved cursor.")
+                url, query = resume_url, None
+
+        page = 0
+        while url:
+            page += 1
+            r = self._request("GET", url, params=query)
+            records = r.json().get(key, [])
+            next_url = self._parse_next_link(r.headers.get("Link"))
+            query = None  # page_info URLs already carry every param
+
+            yield records
+
+            if checkpoint:
+                self._save_cursor(checkpoint, next_url)
+            url = next_url if records else None
+
+    def iter_all(
+        self,
+        path: str,
+        key: str,
+        params: Optional[Dict] = None,
+        checkpoint: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        """Flatten iter_pages() into a stream of individual records."""
+        for records in self.iter_pages(path, key, params=params, checkpoint=checkpoint):
+            yield from records
+
+    def fan_out(self, fn, items: Iterable, max_workers: int = MAX_WORKERS) -> List[Tuple[Any, Any]]:
+        """
+        Run fn(item) concurrently for each item and return [(item, result)] in input order.
+        All workers share this conduit's leaky bucket, so fan-out never exceeds the API budget.
+        Failed items yield the raised exception as their result.
+        """
+        items = list(items)
+
+        def _run(item):
+            try:
+                return fn(item)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(zip(items, pool.map(_run, items)))
+
     # ── CONNECTION ──────────────────────────────────────────────
 
     def check_connection(self) -> bool:
         """Verify the uplink to the Shopify Archive."""
         try:
-            data = self._get("shop.json")
-            shop = data.get("shop", {})
+            shop = self.shop_info(refresh=True)
             name = shop.get("name", "Unknown")
             domain = shop.get("myshopify_domain", self.store_url)
             print(f"[SYSTEM_ECHO]: Shopify Uplink RESONANT. Store: {name} ({domain})")
@@ -97,9 +368,8 @@ class ShopifyConduit:
     # ═══════════════════════════════════════════════════════════
 
     def list_blogs(self) -> List[Dict]:
-        """List all blogs in the store."""
-        data = self._get("blogs.json")
-        blogs = data.get("blogs", [])
+        """List all blogs in the store (always fresh; also refreshes the blog cache)."""
+        blogs = self.get_blogs(refresh=True)
         print(f"[SYSTEM_ECHO]: {len(blogs)} blog(s) detected.")
         for b in blogs:
             print(f"  [{b['id']}] {b['title']}")
@@ -172,6 +442,132 @@ class ShopifyConduit:
         print(f"[SYSTEM_ECHO]: Article {article_id} updated.")
         return result.get("article", {})
 
+    def find_blog(self, title: str) -> Optional[Dict]:
+        """
+        Return the blog whose title matches (whitespace-trimmed), or None.
+        Served from the blog cache; a miss re-lists once in case it was created elsewhere.
+        """
+        for refresh in (False, True):
+            for b in self.get_blogs(refresh=refresh):
+                if b.get("title", "").strip() == title.strip():
+                    return b
+        return None
+
+    def get_or_create_blog(self, title: str) -> Dict:
+        """find_blog(title), creating the blog (and invalidating the cache) when absent."""
+        blog = self.find_blog(title)
+        if blog:
+            return blog
+        blog = self._post("blogs.json", {"blog": {"title": title}}).get("blog", {})
+        self.invalidate_meta("blogs")
+        print(f"// BLOG_CREATED: {title} (ID {blog.get('id')})")
+        return blog
+
+    def iter_articles(
+        self,
+        blog_id: int,
+        fields: Optional[List[str]] = None,
+        params: Optional[Dict] = None,
+        checkpoint: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        """Stream every article in a blog (250 per page), optionally limited to `fields` / filtered by `params`."""
+        query = dict(params or {})
+        if fields:
+            query["fields"] = ",".join(fields)
+        return self.iter_all(f"blogs/{blog_id}/articles.json", "articles", params=query or None, checkpoint=checkpoint)
+
+    def rewrite_articles(
+        self,
+        blog_id: int,
+        transform,
+        journal: Optional[str] = None,
+        max_workers: int = MAX_WORKERS,
+        dry_run: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Bulk article mutation. Streams every article, computes
+        transform(article) -> new body_html (or None to leave it) locally, and
+        PUTs only bodies whose normalized hash changed, through a bounded pool
+        sharing this conduit's leaky bucket.
+
+        With `journal`, each applied rewrite is recorded in
+        artifacts/.shopify_rewrites/<journal>.json (article id -> hash written).
+        A rerun skips articles whose body still matches the journal, and the
+        journal is removed once a run finishes without failures.
+
+        Returns counts: scanned, updated, unchanged, skipped, resumed, failed.
+        """
+        journal_path = REWRITE_JOURNAL_DIR / f"{journal}.json" if journal else None
+        done: Dict[str, str] = {}
+        if journal_path and journal_path.exists():
+            try:
+                done = json.loads(journal_path.read_text(encoding="utf-8"))
+                print(f"[SIGNAL_RECOVERY]: Journal '{journal}' holds {len(done)} applied rewrite(s).")
+            except (json.JSONDecodeError, OSError):
+                done = {}
+        journal_lock = threading.Lock()
+        counts = dict.fromkeys(("scanned", "updated", "unchanged", "skipped", "resumed", "failed"), 0)
+
+        def _record(article_id: int, digest: str) -> None:
+            with journal_lock:
+                done[str(article_id)] = digest
+                REWRITE_JOURNAL_DIR.mkdir(parents=True, exist_ok=True)
+                tmp = journal_path.with_suffix(".tmp")
+                tmp.write_text(json.dumps(done, indent=1, sort_keys=True), encoding="utf-8")
+                tmp.replace(journal_path)
+
+        def _apply(article: Dict, new_body: str, digest: str) -> None:
+            self._put(f"blogs/{blog_id}/articles/{article['id']}.json",
+                      {"article": {"id": article["id"], "body_html": new_body}})
+            if journal_path:
+                _record(article["id"], digest)
+            print(f"   [UPDATED] {article['id']} — '{article.get('title', '?')}'")
+
+        in_flight = set()
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+
+            def _settle(block_until_below: int) -> None:
+                while len(in_flight) > block_until_below:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for f in finished:
+                        in_flight.discard(f)
+                        if f.exception():
+                            counts["failed"] += 1
+                            print(f"[SYSTEM_DISSONANCE]: Article {f.article_id} rewrite failed — {f.exception()}")
+                        else:
+                            counts["updated"] += 1
+
+            for article in self.iter_articles(blog_id, fields=["id", "title", "body_html"]):
+                counts["scanned"] += 1
+                body = article.get("body_html") or ""
+                current = body_hash(body)
+                if done.get(str(article["id"])) == current:
+                    counts["resumed"] += 1
+                    continue
+
+                new_body = transform(article)
+                if new_body is None:
+                    counts["skipped"] += 1
+                    continue
+                digest = body_hash(new_body)
+                if digest == current:
+                    counts["unchanged"] += 1
+                    continue
+                if dry_run:
+                    counts["updated"] += 1
+                    print(f"   [WOULD_UPDATE] {article['id']} — '{article.get('title', '?')}'")
+                    continue
+
+                _settle(max_workers * 2 - 1)
+                future = pool.submit(_apply, article, new_body, digest)
+                future.article_id = article["id"]
+                in_flight.add(future)
+            _settle(0)
+
+        if journal_path and not counts["failed"] and not dry_run:
+            journal_path.unlink(missing_ok=True)
+        return counts
+
     def delete_article(self, blog_id: int, article_id: int) -> None:
         self._delete(f"blogs/{blog_id}/articles/{article_id}.json")
         print(f"[SYSTEM_ECHO]: Article {article_id} deleted.")
@@ -213,6 +609,67 @@ class ShopifyConduit:
             print(f"  [{c['id']}] {c.get('author', '?')}: {c.get('body', '')[:80]}")
         return comments
 
+    def _comment_params(self, blog_id: Optional[int], article_id: Optional[int], status: str) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"status": status}
+        if blog_id:
+            params["blog_id"] = blog_id
+            if article_id:
+                params["article_id"] = article_id
+        return params
+
+    def iter_comment_pages(
+        self,
+        blog_id: Optional[int] = None,
+        article_id: Optional[int] = None,
+        status: str = "published",
+        checkpoint: Optional[str] = None,
+    ) -> Iterator[List[Dict]]:
+        """Stream every comment in scope page-by-page (250 per page). See iter_pages()."""
+        params = self._comment_params(blog_id, article_id, status)
+        return self.iter_pages("comments.json", "comments", params=params, checkpoint=checkpoint)
+
+    def list_all_comments(
+        self,
+        blog_id: Optional[int] = None,
+        article_id: Optional[int] = None,
+        status: str = "published",
+    ) -> List[Dict]:
+        """Retrieve ALL comments in scope, following pagination (no 250-item ceiling)."""
+        comments: List[Dict] = []
+        for page in self.iter_comment_pages(blog_id, article_id, status):
+            comments.extend(page)
+        print(f"[SYSTEM_ECHO]: {len(comments)} comment(s) retrieved across all pages (status={status}).")
+        return comments
+
+    def list_comments_across(
+        self,
+        scopes: Iterable[Tuple[int, Optional[int]]],
+        status: str = "published",
+        max_workers: int = MAX_WORKERS,
+    ) -> Dict[Tuple[int, Optional[int]], List[Dict]]:
+        """
+        Fully paginate comments for several (blog_id, article_id) scopes concurrently.
+        Pass article_id=None to take a whole blog. Returns {scope: comments}.
+        """
+        def _drain(scope):
+            out: List[Dict] = []
+            for page in self.iter_comment_pages(scope[0], scope[1], status):
+                out.extend(page)
+            return out
+
+        results: Dict[Tuple[int, Optional[int]], List[Dict]] = {}
+        for scope, result in self.fan_out(_drain, scopes, max_workers=max_workers):
+            if isinstance(result, Exception):
+                print(f"[SYSTEM_WARNING]: Comment fetch failed for scope {scope}: {result}")
+                result = []
+            results[scope] = result
+        return results
+
+    def count_comments(self, blog_id: Optional[int] = None, article_id: Optional[int] = None, status: str = "published") -> int:
+        """Return the comment count in scope without paging through the records."""
+        data = self._get("comments/count.json", params=self._comment_params(blog_id, article_id, status))
+        return int(data.get("count", 0))
+
     def approve_comment(self, comment_id: int) -> Dict:
         """Mark a pending comment as approved / published."""
         result = self._post(f"comments/{comment_id}/approve.json", {})
@@ -264,6 +721,154 @@ class ShopifyConduit:
         self._delete(f"products/{product_id}.json")
         print(f"[SYSTEM_ECHO]: Product {product_id} deleted.")
 
+    # ═══════════════════════════════════════════════════════════
+    #  PRODUCT MEDIA  (stagedUploadsCreate → productCreateMedia)
+    # ═══════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _product_gid(product_id) -> str:
+        product_id = str(product_id)
+        return product_id if product_id.startswith("gid://") else f"gid://shopify/Product/{product_id}"
+
+    def _graphql_checked(self, name: str, query: str, variables: Optional[Dict] = None) -> Dict:
+        """Run a mutation and return its data, raising on top-level GraphQL errors."""
+        resp = self._graphql(query, variables=variables)
+        if resp.get("errors"):
+            raise RuntimeError(f"[SYSTEM_DISSONANCE]: {name} failed — {resp['errors']}")
+        return resp.get("data") or {}
+
+    def staged_upload_targets(self, paths: List[Path]) -> List[Dict]:
+        """
+        Reserve one staged upload target per file (a single stagedUploadsCreate).
+        Returns [{url, resourceUrl, parameters: [{name, value}]}] in the order of `paths`.
+        """
+        mutation = """
+        mutation stagedUploadsCreate($input: [StagedUploadInput!]!) {
+          stagedUploadsCreate(input: $input) {
+            stagedTargets { url resourceUrl parameters { name value } }
+            userErrors { field message }
+          }
+        }
+        """
+        inputs = [{
+            "filename": p.name,
+            "mimeType": mimetypes.guess_type(p.name)[0] or "application/octet-stream",
+            "fileSize": str(p.stat().st_size),
+            "resource": "IMAGE",
+            "httpMethod": "POST",
+        } for p in paths]
+        payload = self._graphql_checked("stagedUploadsCreate", mutation, {"input": inputs}).get("stagedUploadsCreate") or {}
+        if payload.get("userErrors"):
+            raise RuntimeError(f"[SYSTEM_DISSONANCE]: stagedUploadsCreate rejected — {payload['userErrors']}")
+        targets = payload.get("stagedTargets") or []
+        if len(targets) != len(paths):
+            raise RuntimeError(f"[SYSTEM_DISSONANCE]: stagedUploadsCreate returned {len(targets)} target(s) for {len(paths)} file(s).")
+        return targets
+
+    @staticmethod
+    def stream_to_stage(target: Dict, path: Path) -> str:
+        """
+        POST a file to its staged target as multipart form data, streamed from disk.
+        The target is storage, not the Admin API: no bucket, no access token.
+        Returns the resourceUrl to hand to productCreateMedia.
+        """
+        mime_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        fields = [(p["name"], p["value"]) for p in target.get("parameters", [])]
+        for attempt in range(STAGE_RETRIES):
+            body = _MultipartStream(fields, path, mime_type)
+            try:
+                r = requests.post(target["url"], data=body, headers={"Content-Type": body.content_type}, timeout=120)
+            except requests.RequestException as e:
+                error = str(e)
+            else:
+                if r.status_code < 300:
+                    return target["resourceUrl"]
+                error = f"HTTP {r.status_code}"
+                if r.status_code < 500 and r.status_code != 429:
+                    break
+            finally:
+                body.close()
+            print(f"[SYSTEM_WARNING]: Staged upload of {path.name} failed ({error}); attempt {attempt + 1}/{STAGE_RETRIES}")
+            time.sleep(2 ** attempt)
+        raise RuntimeError(f"[SYSTEM_DISSONANCE]: Staged upload of {path.name} failed — {error}")
+
+    def attach_product_media(self, sources: Dict[Any, List[str]], primary: bool = False) -> Dict[str, List[Dict]]:
+        """
+        Attach staged files to products: {product_id: [resourceUrl, ...]}.
+        Up to MEDIA_BATCH products are aliased into each productCreateMedia
+        document. With primary=True the new media are moved to the front of
+        each product's gallery (one aliased productReorderMedia document).
+        Returns {product gid: [media {id, status}]}.
+        """
+        gids = [(self._product_gid(pid), media) for pid, media in sources.items() if media]
+        created: Dict[str, List[Dict]] = {}
+        for start in range(0, len(gids), MEDIA_BATCH):
+            batch = gids[start:start + MEDIA_BATCH]
+            params = ", ".join(f"$p{i}: ID!, $m{i}: [CreateMediaInput!]!" for i in range(len(batch)))
+            fields = "\n".join(
+                f"  a{i}: productCreateMedia(productId: $p{i}, media: $m{i}) "
+                f"{{ media {{ id status }} mediaUserErrors {{ field message }} }}"
+                for i in range(len(batch))
+            )
+            variables: Dict[str, Any] = {}
+            for i, (gid, media) in enumerate(batch):
+                variables[f"p{i}"] = gid
+                variables[f"m{i}"] = [{"originalSource": url, "mediaContentType": "IMAGE"} for url in media]
+            data = self._graphql_checked("productCreateMedia", f"mutation attachMedia({params}) {{\n{fields}\n}}", variables)
+            for i, (gid, _) in enumerate(batch):
+                result = data.get(f"a{i}") or {}
+                if result.get("mediaUserErrors"):
+                    raise RuntimeError(f"[SYSTEM_DISSONANCE]: productCreateMedia rejected for {gid} — {result['mediaUserErrors']}")
+                created[gid] = result.get("media") or []
+
+        if primary and created:
+            self._move_media_to_front(created)
+        print(f"[SYSTEM_ECHO]: Attached {sum(len(m) for m in created.values())} media to {len(created)} product(s).")
+        return created
+
+    def _move_media_to_front(self, created: Dict[str, List[Dict]]) -> None:
+        items = [(gid, media) for gid, media in created.items() if media]
+        for start in range(0, len(items), MEDIA_BATCH):
+            batch = items[start:start + MEDIA_BATCH]
+            params = ", ".join(f"$p{i}: ID!, $v{i}: [MoveInput!]!" for i in range(len(batch)))
+            fields = "\n".join(
+                f"  r{i}: productReorderMedia(id: $p{i}, moves: $v{i}) {{ mediaUserErrors {{ field message }} }}"
+                for i in range(len(batch))
+            )
+            variables: Dict[str, Any] = {}
+            for i, (gid, media) in enumerate(batch):
+                variables[f"p{i}"] = gid
+                variables[f"v{i}"] = [{"id": m["id"], "newPosition": str(pos)} for pos, m in enumerate(media)]
+            data = self._graphql_checked("productReorderMedia", f"mutation frontMedia({params}) {{\n{fields}\n}}", variables)
+            for i, (gid, _) in enumerate(batch):
+                errors = (data.get(f"r{i}") or {}).get("mediaUserErrors")
+                if errors:
+                    print(f"[SYSTEM_WARNING]: Could not move new media to the front of {gid}: {errors}")
+
+    def upload_product_images(self, images: Dict[Any, List], primary: bool = False,
+                              max_workers: int = MAX_WORKERS) -> Dict[str, List[Dict]]:
+        """
+        Upload local images to products without base64: reserve staged targets
+        for every file in one call, stream the files to them concurrently, then
+        attach everything in batched productCreateMedia documents.
+
+        Args:
+            images:  {product_id: [path, ...]} — ids may be numeric or product gids.
+            primary: Move the new images to the front of each product's gallery.
+        """
+        flat = [(pid, Path(p)) for pid, paths in images.items() for p in paths]
+        if not flat:
+            return {}
+        targets = self.staged_upload_targets([p for _, p in flat])
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            urls = list(pool.map(lambda pair: self.stream_to_stage(*pair), zip(targets, (p for _, p in flat))))
+        print(f"[SYSTEM_ECHO]: Staged {len(urls)} file(s).")
+
+        sources: Dict[Any, List[str]] = {}
+        for (pid, _), url in zip(flat, urls):
+            sources.setdefault(pid, []).append(url)
+        return self.attach_product_media(sources, primary=primary)
+
     # ═══════════════════════════════════════════════════════════
     #  COLLECTIONS  (Custom + Smart)
     # ═══════════════════════════════════════════════════════════
@@ -308,22 +913,12 @@ class ShopifyConduit:
         Args:
             gid: Shopify Global ID, e.g. 'gid://shopify/Collection/123456789'.
         """
-        pubs_query = """
-        {
-          publications(first: 20) {
-            edges {
-              node { id name }
-            }
-          }
-        }
-        """
-        resp = self._graphql(pubs_query)
-        gql_errors = resp.get("errors")
-        if gql_errors:
-            print(f"[SYSTEM_WARNING]: publications query failed — {gql_errors[0].get('message', gql_errors)}")
+        try:
+            publications = self.get_publications()
+        except RuntimeError as e:
+            print(f"[SYSTEM_WARNING]: {e}")
             return
-        edges = ((resp.get("data") or {}).get("publications") or {}).get("edges", [])
-        pub_ids = [e["node"]["id"] for e in edges]
+        pub_ids = [p["id"] for p in publications]
 
         if not pub_ids:
             print("[SYSTEM_WARNING]: No publications found — skipping channel publish.")
@@ -340,9 +935,11 @@ class ShopifyConduit:
         result = self._graphql(mutation, variables={"id": gid, "input": pub_input})
         errors = (result.get("data", {}).get("publishablePublish") or {}).get("userErrors", [])
         if errors:
+            # A removed or added channel makes the cached list stale; re-list next time.
+            self.invalidate_meta("publications")
             print(f"[SYSTEM_WARNING]: Channel publish errors: {errors}")
         else:
-            names = [e["node"]["name"] for e in edges]
+            names = [p["name"] for p in publications]
             print(f"[SYSTEM_ECHO]: Published to {len(pub_ids)} channel(s): {', '.join(names)}")
 
     def create_smart_collection(self, title: str, rules: List[Dict], disjunctive: bool = False, body_html: str = "") -> Dict:
@@ -393,6 +990,81 @@ class ShopifyConduit:
         print(f"[SYSTEM_ECHO]: Product {product_id} added to collection {collection_id}.")
         return result.get("collect", {})
 
+    # ═══════════════════════════════════════════════════════════
+    #  BULK OPERATIONS  (GraphQL bulkOperationRunQuery → JSONL)
+    # ═══════════════════════════════════════════════════════════
+
+    def run_bulk_query(self, query: str) -> Dict:
+        """
+        Start an asynchronous bulk export. `query` must select exactly one
+        top-level connection, e.g. '{ products { edges { node { id title } } } }'.
+        Returns the BulkOperation node ({id, status}).
+        """
+        mutation = """
+        mutation bulkOperationRunQuery($query: String!) {
+          bulkOperationRunQuery(query: $query) {
+            bulkOperation { id status }
+            userErrors { field message }
+          }
+        }
+        """
+        resp = self._graphql(mutation, variables={"query": query})
+        if resp.get("errors"):
+            raise RuntimeError(f"[SYSTEM_DISSONANCE]: bulkOperationRunQuery failed — {resp['errors']}")
+        payload = (resp.get("data") or {}).get("bulkOperationRunQuery") or {}
+        errors = payload.get("userErrors") or []
+        if errors:
+            raise RuntimeError(f"[SYSTEM_DISSONANCE]: bulkOperationRunQuery rejected — {errors}")
+        op = payload.get("bulkOperation") or {}
+        print(f"[SYSTEM_ECHO]: Bulk operation started — {op.get('id')} ({op.get('status')})")
+        return op
+
+    def wait_for_bulk_operation(self, timeout: int = 600, poll_interval: float = 2.0) -> Dict:
+        """
+        Poll currentBulkOperation until it leaves CREATED/RUNNING.
+        Returns the finished node ({id, status, objectCount, url}). `url` is None
+        when the export matched nothing.
+        """
+        query = """
+        {
+          currentBulkOperation {
+            id status errorCode objectCount url
+          }
+        }
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            resp = self._graphql(query)
+            op = (resp.get("data") or {}).get("currentBulkOperation") or {}
+            status = op.get("status")
+            if status not in ("CREATED", "RUNNING"):
+                break
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Bulk operation {op.get('id')} still {status} after {timeout}s.")
+            time.sleep(poll_interval)
+
+        if status != "COMPLETED":
+            raise RuntimeError(f"[SYSTEM_DISSONANCE]: Bulk operation {op.get('id')} ended {status} ({op.get('errorCode')}).")
+        print(f"[SYSTEM_ECHO]: Bulk operation complete — {op.get('objectCount')} object(s).")
+        return op
+
+    @staticmethod
+    def iter_bulk_jsonl(url: Optional[str]) -> Iterator[Dict]:
+        """Stream-parse a bulk result file line by line without loading it into memory."""
+        if not url:
+            return
+        with requests.get(url, stream=True, timeout=60) as r:
+            r.raise_for_status()
+            for line in r.iter_lines():
+                if line:
+                    yield json.loads(line)
+
+    def bulk_export(self, query: str, timeout: int = 600) -> Iterator[Dict]:
+        """Run a bulk query end-to-end and stream its JSONL records."""
+        self.run_bulk_query(query)
+        op = self.wait_for_bulk_operation(timeout=timeout)
+        return self.iter_bulk_jsonl(op.get("url"))
+
     # ═══════════════════════════════════════════════════════════
     #  URL REDIRECTS
     # ═══════════════════════════════════════════════════════════
@@ -417,6 +1089,12 @@ class ShopifyConduit:
         print(f"[SYSTEM_ECHO]: {len(redirects)} redirect(s).")
         return redirects
 
+    def update_redirect(self, redirect_id: int, to_path: str) -> Dict:
+        """Point an existing redirect at a new target path."""
+        result = self._put(f"redirects/{redirect_id}.json", {"redirect": {"id": redirect_id, "target": to_path}})
+        print(f"[SYSTEM_ECHO]: Redirect {redirect_id} retargeted → {to_path}")
+        return result.get("redirect", {})
+
     def delete_redirect(self, redirect_id: int) -> None:
         """Delete a URL redirect by ID."""
         self._delete(f"redirects/{redirect_id}.json")
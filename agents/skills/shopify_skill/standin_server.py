@@ -0,0 +1,182 @@
+# [FILE_ID]: skills/SHOPIFY_SKILL/STANDIN_SERVER // VERSION: 1.0 // STATUS: STABLE
+# [NARRATIVE]: A local stand-in for the Admin GraphQL media flow
+# (stagedUploadsCreate → staged POST → productCreateMedia / productReorderMedia),
+# so ShopifyConduit.upload_product_images can be exercised without touching the Archive.
+#
+# It enforces the staged protocol: every upload must echo the issued form
+# parameters, carry exactly the declared fileSize, and productCreateMedia only
+# accepts resourceUrls whose upload completed. --fail-every N answers every Nth
+# staged POST with a 503 to exercise retry. Received files land in --output-dir.
+#
+# Usage:
+#   python3 agents/skills/shopify_skill/standin_server.py --port 8766 --fail-every 3
+#   SHOPIFY_API_BASE=http://127.0.0.1:8766/admin/api/2024-01 \
+#       python3 scripts/publish_printify_product.py <printify_product_id>
+
+import argparse
+import json
+import re
+import tempfile
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ALIAS_RE = re.compile(r"(\w+): (productCreateMedia|productReorderMedia)\((?:productId|id): \$(\w+), (?:media|moves): \$(\w+)\)")
+DISPOSITION_RE = re.compile(r'name="([^"]+)"(?:; filename="([^"]*)")?')
+
+
+class StandinState:
+    def __init__(self, output_dir: Path, fail_every: int = 0):
+        self.output_dir = output_dir
+        self.fail_every = fail_every
+        self.targets = {}       # token -> {filename, size, params, done}
+        self.media = {}         # product gid -> [media ids]
+        self.graphql_calls = 0
+        self.posts = 0
+        self.lock = threading.Lock()
+
+
+def parse_multipart(body: bytes, content_type: str):
+    """Split a multipart/form-data body into ({field: value}, (filename, bytes))."""
+    boundary = content_type.split("boundary=", 1)[-1].encode()
+    fields, upload = {}, None
+    for part in body.split(b"--" + boundary)[1:]:
+        if part.startswith(b"--"):
+            break
+        head, _, data = part[2:].partition(b"\r\n\r\n")
+        match = DISPOSITION_RE.search(head.decode(errors="replace"))
+        if not match:
+            continue
+        data = data[:-2] if data.endswith(b"\r\n") else data
+        if match.group(2) is not None:
+            upload = (match.group(2), data)
+        else:
+            fields[match.group(1)] = data.decode()
+    return fields, upload
+
+
+def make_handler(state: StandinState):
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, code, payload=None):
+            body = json.dumps(payload or {}).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _body(self) -> bytes:
+            return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        def do_POST(self):
+            if self.path.endswith("/graphql.json"):
+                return self._graphql(json.loads(self._body() or b"{}"))
+            if self.path.startswith("/staged/"):
+                return self._staged(self.path.rsplit("/", 1)[-1])
+            self._reply(404, {"errors": "Not Found"})
+
+        # ── GraphQL ─────────────────────────────────────────────
+
+        def _graphql(self, req):
+            query, variables = req.get("query", ""), req.get("variables") or {}
+            with state.lock:
+                state.graphql_calls += 1
+            if "stagedUploadsCreate" in query:
+                return self._reply(200, {"data": {"stagedUploadsCreate": self._stage(variables.get("input", []))}})
+            aliases = ALIAS_RE.findall(query)
+            if not aliases:
+                return self._reply(200, {"errors": [{"message": "stand-in does not implement this query"}]})
+            data = {}
+            for alias, field, pid_var, arg_var in aliases:
+                gid, items = variables.get(pid_var), variables.get(arg_var) or []
+                data[alias] = (self._create_media(gid, items) if field == "productCreateMedia"
+                               else self._reorder_media(gid, items))
+            self._reply(200, {"data": data})
+
+        def _stage(self, inputs):
+            host, port = self.server.server_address[:2]
+            targets = []
+            with state.lock:
+                for item in inputs:
+                    token = uuid.uuid4().hex[:16]
+                    params = [{"name": "key", "value": f"tmp/{token}/{item['filename']}"},
+                              {"name": "policy", "value": uuid.uuid4().hex}]
+                    state.targets[token] = {"filename": item["filename"], "size": int(item.get("fileSize") or -1),
+                                            "params": params, "done": False}
+                    targets.append({"url": f"http://{host}:{port}/staged/{token}",
+                                    "resourceUrl": f"http://{host}:{port}/staged/{token}/{item['filename']}",
+                                    "parameters": params})
+            return {"stagedTargets": targets, "userErrors": []}
+
+        def _create_media(self, gid, items):
+            media, errors = [], []
+            with state.lock:
+                for item in items:
+                    token = item.get("originalSource", "").rsplit("/", 2)[-2]
+                    target = state.targets.get(token)
+                    if not target or not target["done"]:
+                        errors.append({"field": ["originalSource"], "message": "staged file was never uploaded"})
+                        continue
+                    media_id = f"gid://shopify/MediaImage/{uuid.uuid4().int % 10 ** 12}"
+                    state.media.setdefault(gid, []).append(media_id)
+                    media.append({"id": media_id, "status": "UPLOADED"})
+            return {"media": media, "mediaUserErrors": errors}
+
+        def _reorder_media(self, gid, moves):
+            with state.lock:
+                known = state.media.get(gid, [])
+                unknown = [m["id"] for m in moves if m["id"] not in known]
+                if unknown:
+                    return {"mediaUserErrors": [{"field": ["moves"], "message": f"unknown media {unknown}"}]}
+                moved = [m["id"] for m in sorted(moves, key=lambda m: int(m["newPosition"]))]
+                state.media[gid] = moved + [m for m in known if m not in moved]
+            return {"mediaUserErrors": []}
+
+        # ── staged target ───────────────────────────────────────
+
+        def _staged(self, token):
+            body = self._body()
+            with state.lock:
+                state.posts += 1
+                if state.fail_every and state.posts % state.fail_every == 0:
+                    return self._reply(503, {"error": "injected_failure"})
+                target = state.targets.get(token)
+                if not target:
+                    return self._reply(404, {"error": "unknown target"})
+            fields, upload = parse_multipart(body, self.headers.get("Content-Type", ""))
+            expected = {p["name"]: p["value"] for p in target["params"]}
+            if fields != expected or not upload:
+                return self._reply(400, {"error": "form parameters do not match the issued target"})
+            if target["size"] >= 0 and len(upload[1]) != target["size"]:
+                return self._reply(400, {"error": f"expected {target['size']} bytes, got {len(upload[1])}"})
+            (state.output_dir / f"{token}_{upload[0]}").write_bytes(upload[1])
+            with state.lock:
+                target["done"] = True
+            self._reply(201)
+
+        def log_message(self, fmt, *args):
+            print(f"[STANDIN]: {fmt % args}")
+
+    return Handler
+
+
+def serve(port: int = 8766, output_dir=None, fail_every: int = 0) -> ThreadingHTTPServer:
+    """Build (but do not start) a stand-in server bound to 127.0.0.1:port."""
+    output_dir = Path(output_dir or tempfile.mkdtemp(prefix="shopify_standin_"))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    state = StandinState(output_dir, fail_every)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    server.state = state
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for Shopify's staged media uploads")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--output-dir", help="Where received files are written (default: a temp dir)")
+    parser.add_argument("--fail-every", type=int, default=0, help="Answer every Nth staged POST with 503")
+    args = parser.parse_args()
+    server = serve(args.port, args.output_dir, args.fail_every)
+    print(f"[SYSTEM_LOG]: Stand-in listening on http://127.0.0.1:{args.port}/admin/api/2024-01 -> {server.state.output_dir}")
+    server.serve_forever()
@@ -0,0 +1,283 @@
+# [FILE_ID]: skills/SHOPIFY_STORE_INDEX // VERSION: 1.0 // STATUS: STABLE
+# [NARRATIVE]: Local lookup table of every Shopify product and collection, seeded
+# by a GraphQL bulk export and kept current with small updated_at deltas, so
+# title-fragment and handle lookups never re-list the whole Archive.
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterator
+
+from .shopify_skill import ShopifyConduit
+
+INDEX_FILE = Path(__file__).resolve().parent.parent.parent.parent / "artifacts" / ".shopify_store_index.json"
+INDEX_VERSION = 1
+
+# Deltas cannot observe deletions — fall back to a full bulk export past this age.
+FULL_REBUILD_AGE = timedelta(hours=24)
+
+# StoreIndex.shared() serves its in-process copy without any network call
+# until it is older than this; then it applies a cheap updated_at delta.
+SHARED_STALENESS = timedelta(minutes=10)
+
+PRODUCT_FIELDS = "id legacyResourceId title handle productType updatedAt"
+COLLECTION_FIELDS = "id legacyResourceId title handle updatedAt ruleSet { appliedDisjunctively }"
+
+BULK_PRODUCTS_QUERY = "{ products { edges { node { %s } } } }" % PRODUCT_FIELDS
+BULK_COLLECTIONS_QUERY = "{ collections { edges { node { %s } } } }" % COLLECTION_FIELDS
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _product_row(node: Dict) -> Dict[str, Any]:
+    return {
+        "id": int(node["legacyResourceId"]),
+        "title": node.get("title", ""),
+        "handle": node.get("handle", ""),
+        "product_type": node.get("productType", ""),
+        "updated_at": node.get("updatedAt"),
+    }
+
+
+def _collection_row(node: Dict) -> Dict[str, Any]:
+    return {
+        "id": int(node["legacyResourceId"]),
+        "title": node.get("title", ""),
+        "handle": node.get("handle", ""),
+        "smart": node.get("ruleSet") is not None,
+        "updated_at": node.get("updatedAt"),
+    }
+
+
+class StoreIndex:
+    """
+    The Archive's local memory. Products and collections are keyed by numeric
+    id and persisted to artifacts/.shopify_store_index.json.
+
+    Usage:
+        index = StoreIndex.shared(conduit)    # one refreshed copy per process
+        index.find_product_by_title_fragment(printify_id)
+        index.product_by_handle("specimen-abc123")
+        index.ensure_redirect("/products/old", "/products/new")
+    """
+
+    _lock = threading.RLock()
+    _shared: Optional["StoreIndex"] = None
+    _shared_checked: Optional[datetime] = None
+
+    def __init__(self, conduit: Optional[ShopifyConduit] = None, path: Path = INDEX_FILE):
+        self.conduit = conduit
+        self.path = path
+        self.products: Dict[int, Dict] = {}
+        self.collections: Dict[int, Dict] = {}
+        self.built_at: Optional[str] = None
+        self.synced_at: Optional[str] = None
+        # Redirects have no updated_at filter — fetched once per process, kept in memory.
+        self.redirects: Optional[Dict[str, Dict]] = None
+        self.load()
+
+    @classmethod
+    def shared(cls, conduit: ShopifyConduit, max_staleness: timedelta = SHARED_STALENESS) -> "StoreIndex":
+        """
+        Process-wide index. The first call loads and refreshes it; later calls
+        (batch workers, backfills) reuse it, applying a delta only once it is
+        older than max_staleness. Local creates update it in place.
+        """
+        with cls._lock:
+            now = _now()
+            if cls._shared is None:
+                cls._shared = cls(conduit)
+            if cls._shared_checked is None or now - cls._shared_checked > max_staleness:
+                cls._shared.conduit = cls._shared.conduit or conduit
+                cls._shared.refresh()
+                cls._shared_checked = now
+            return cls._shared
+
+    # ── persistence ─────────────────────────────────────────────
+
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self.products = {int(k): v for k, v in data.get("products", {}).items()}
+        self.collections = {int(k): v for k, v in data.get("collections", {}).items()}
+        self.built_at = data.get("built_at")
+        self.synced_at = data.get("synced_at")
+
+    def save(self) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                "version": INDEX_VERSION,
+                "built_at": self.built_at,
+                "synced_at": self.synced_at,
+                "products": self.products,
+                "collections": self.collections,
+            }
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            tmp.replace(self.path)
+
+    # ── synchronisation ─────────────────────────────────────────
+
+    def rebuild(self) -> None:
+        """Replace the index with a fresh bulk export of products and collections."""
+        started = _now().isoformat()
+        print("[SYSTEM_LOG]: Bulk-exporting Shopify products...")
+        self.products = {r["id"]: r for r in map(_product_row, self.conduit.bulk_export(BULK_PRODUCTS_QUERY))}
+        print("[SYSTEM_LOG]: Bulk-exporting Shopify collections...")
+        self.collections = {r["id"]: r for r in map(_collection_row, self.conduit.bulk_export(BULK_COLLECTIONS_QUERY))}
+        self.built_at = self.synced_at = started
+        self.save()
+        print(f"[SYSTEM_ECHO]: Store index rebuilt — {len(self.products)} product(s), "
+              f"{len(self.collections)} collection(s).")
+
+    def _iter_updated(self, connection: str, fields: str, since: str) -> Iterator[Dict]:
+        """Page a GraphQL connection filtered to nodes updated after `since`."""
+        query = """
+        query delta($q: String!, $after: String) {
+          %s(first: 250, query: $q, after: $after) {
+            pageInfo { hasNextPage endCursor }
+            edges { node { %s } }
+          }
+        }
+        """ % (connection, fields)
+        after = None
+        while True:
+            resp = self.conduit._graphql(query, variables={"q": f"updated_at:>'{since}'", "after": after})
+            if resp.get("errors"):
+                raise RuntimeError(f"[SYSTEM_DISSONANCE]: {connection} delta query failed — {resp['errors']}")
+            conn = (resp.get("data") or {}).get(connection) or {}
+            for edge in conn.get("edges", []):
+                yield edge["node"]
+            page_info = conn.get("pageInfo") or {}
+            if not page_info.get("hasNextPage"):
+                return
+            after = page_info.get("endCursor")
+
+    def sync(self) -> int:
+        """Merge products/collections updated since the last sync. Returns rows touched."""
+        started = _now().isoformat()
+        touched = 0
+        for node in self._iter_updated("products", PRODUCT_FIELDS, self.synced_at):
+            self.upsert_product(_product_row(node))
+            touched += 1
+        for node in self._iter_updated("collections", COLLECTION_FIELDS, self.synced_at):
+            self.upsert_collection(_collection_row(node))
+            touched += 1
+        self.synced_at = started
+        self.save()
+        return touched
+
+    def refresh(self, max_age: timedelta = FULL_REBUILD_AGE) -> None:
+        """Bulk-rebuild when missing or older than max_age, otherwise apply a delta."""
+        if not self.built_at or _now() - datetime.fromisoformat(self.built_at) > max_age:
+            self.rebuild()
+        else:
+            touched = self.sync()
+            print(f"[SYSTEM_ECHO]: Store index synced — {touched} change(s).")
+
+    # ── in-place updates (after local creates) ──────────────────
+
+    def upsert_product(self, row: Dict) -> None:
+        with self._lock:
+            self.products[int(row["id"])] = row
+
+    def upsert_collection(self, row: Dict) -> None:
+        with self._lock:
+            self.collections[int(row["id"])] = row
+
+    def record_collection(self, collection: Dict, smart: bool = True) -> None:
+        """Upsert from a REST collection payload (e.g. create_smart_collection's return)."""
+        if collection.get("id"):
+            self.upsert_collection({
+                "id": int(collection["id"]),
+                "title": collection.get("title", ""),
+                "handle": collection.get("handle", ""),
+                "smart": smart,
+                "updated_at": collection.get("updated_at"),
+            })
+            self.save()
+
+    # ── lookups ─────────────────────────────────────────────────
+
+    def find_products(self, fragment: str) -> List[Dict]:
+        return [p for p in self.products.values() if fragment in p.get("title", "")]
+
+    def find_product_by_title_fragment(self, fragment: str) -> Optional[Dict]:
+        hits = self.find_products(fragment)
+        return hits[0] if hits else None
+
+    def product_by_handle(self, handle: str) -> Optional[Dict]:
+        for p in self.products.values():
+            if p.get("handle") == handle:
+                return p
+        return None
+
+    def collection_by_title(self, title: str) -> Optional[Dict]:
+        wanted = title.upper()
+        for c in self.collections.values():
+            if c.get("title", "").upper() == wanted:
+                return c
+        return None
+
+    def collection_titles(self, smart_only: bool = False) -> set:
+        with self._lock:
+            return {
+                c.get("title", "").upper()
+                for c in self.collections.values()
+                if c.get("smart") or not smart_only
+            }
+
+    def ensure_smart_collection(self, title: str, rules: List[Dict], **kwargs) -> Optional[Dict]:
+        """
+        Create a smart collection unless one with this title is already indexed.
+        Check-and-create is serialised so parallel workers never duplicate one.
+        Returns the created collection, or None if it already existed.
+        """
+        with self._lock:
+            if title.upper() in self.collection_titles(smart_only=True):
+                return None
+            col = self.conduit.create_smart_collection(title=title, rules=rules, **kwargs)
+            self.record_collection(col, smart=True)
+            return col
+
+    # ── redirects ───────────────────────────────────────────────
+
+    def _load_redirects(self) -> Dict[str, Dict]:
+        with self._lock:
+            if self.redirects is None:
+                self.redirects = {
+                    r["path"]: {"id": r["id"], "target": r["target"]}
+                    for r in self.conduit.iter_all("redirects.json", "redirects")
+                }
+                print(f"[SYSTEM_ECHO]: Redirect registry loaded — {len(self.redirects)} redirect(s).")
+            return self.redirects
+
+    def ensure_redirect(self, from_path: str, to_path: str) -> Optional[Dict]:
+        """
+        Make `from_path` redirect to `to_path`: no-op if already so, retarget if
+        it points elsewhere, otherwise create. Returns the created/updated
+        redirect, or None when nothing had to change.
+        """
+        redirects = self._load_redirects()
+        with self._lock:
+            existing = redirects.get(from_path)
+            if existing and existing["target"] == to_path:
+                print(f"[SYSTEM_ECHO]: Redirect already in place — {from_path} → {to_path}")
+                return None
+            if existing:
+                redirect = self.conduit.update_redirect(existing["id"], to_path)
+            else:
+                redirect = self.conduit.create_redirect(from_path, to_path)
+            if redirect.get("id"):
+                redirects[from_path] = {"id": redirect["id"], "target": to_path}
+            return redirect
@@ -0,0 +1,209 @@
+"""
+/* [FILE_ID]: TEST_SHOPIFY_INDEXES // VERSION: 1.0 // STATUS: TESTING */
+Exercises the local Shopify indexes (ArticleLinkIndex, StoreIndex) against an
+in-memory conduit: full builds, updated_at deltas, in-place records and the
+registry-backed writes. No Shopify credentials or network access needed.
+
+Run with pytest, or directly:
+    python3 agents/skills/shopify_skill/test_indexes.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Ensure we can import the module
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from agents.skills.shopify_skill.article_index import ArticleLinkIndex, extract_product_ids
+from agents.skills.shopify_skill.store_index import StoreIndex
+
+BLOG_ID = 42
+PID_A = "a" * 24
+PID_B = "b" * 24
+PID_C = "c" * 24
+
+
+class FakeConduit:
+    """Just enough of ShopifyConduit for the indexes, with call counters."""
+
+    def __init__(self):
+        self.articles = {}
+        self.article_reads = []
+        self.products = []
+        self.collections = []
+        self.delta_products = []
+        self.redirects = []
+        self.created = []
+
+    # articles
+    def iter_articles(self, blog_id, fields=None, params=None):
+        since = (params or {}).get("updated_at_min")
+        self.article_reads.append(since)
+        for article in self.articles.values():
+            if not since or article["updated_at"] >= since:
+                yield dict(article)
+
+    def _get(self, path, params=None):
+        assert path == f"blogs/{BLOG_ID}/articles/count.json"
+        return {"count": len(self.articles)}
+
+    # store
+    def bulk_export(self, query):
+        return list(self.products if "products" in query else self.collections)
+
+    def _graphql(self, query, variables=None):
+        connection = "products" if "products(" in query else "collections"
+        nodes = self.delta_products if connection == "products" else []
+        return {"data": {connection: {"edges": [{"node": n} for n in nodes],
+                                      "pageInfo": {"hasNextPage": False}}}}
+
+    def create_smart_collection(self, title, rules, **kwargs):
+        self.created.append(("collection", title))
+        return {"id": 900 + len(self.created), "title": title, "handle": title.lower()}
+
+    def iter_all(self, path, key, params=None):
+        return iter(self.redirects)
+
+    def create_redirect(self, from_path, to_path):
+        self.created.append(("redirect", from_path, to_path))
+        return {"id": 700 + len(self.created), "path": from_path, "target": to_path}
+
+    def update_redirect(self, redirect_id, to_path):
+        self.created.append(("retarget", redirect_id, to_path))
+        return {"id": redirect_id, "target": to_path}
+
+
+def article(aid, updated_at, title="", body=""):
+    return {"id": aid, "title": title, "body_html": body, "updated_at": updated_at}
+
+
+def product_node(pid, title, handle):
+    return {"legacyResourceId": str(pid), "title": title, "handle": handle,
+            "productType": "Hoodie", "updatedAt": "2026-01-01T00:00:00Z"}
+
+
+def index_path() -> Path:
+    return Path(tempfile.mkdtemp(prefix="shopify_index_test_")) / "index.json"
+
+
+# ── ArticleLinkIndex ────────────────────────────────────────────
+
+def test_extract_product_ids():
+    found = extract_product_ids(article(1, "", title=f"Specimen {PID_A.upper()}",
+                                        body=f'<a href="/products/{PID_B}">buy</a>'))
+    assert found == [PID_A, PID_B]
+    assert extract_product_ids(article(2, "", title="No ids here")) == []
+
+
+def test_article_index_rebuild_and_missing():
+    conduit = FakeConduit()
+    conduit.articles = {1: article(1, "2026-01-01", title=PID_A),
+                        2: article(2, "2026-01-02", body=f"products/{PID_B}")}
+    index = ArticleLinkIndex(conduit, BLOG_ID, path=index_path())
+    index.rebuild()
+    assert index.linked_product_ids() == {PID_A, PID_B}
+    assert index.missing([PID_A, PID_C.upper()]) == {PID_C}
+    assert index.synced_through == "2026-01-02"
+
+    reloaded = ArticleLinkIndex(None, BLOG_ID, path=index.path)
+    assert reloaded.links == index.links
+
+
+def test_record_keeps_the_sync_watermark():
+    conduit = FakeConduit()
+    conduit.articles = {1: article(1, "2026-01-01", title=PID_A)}
+    index = ArticleLinkIndex(conduit, BLOG_ID, path=index_path())
+    index.rebuild()
+
+    # An edit lands upstream, then an article is created and recorded locally
+    conduit.articles[1] = article(1, "2026-01-03", title=PID_A, body=f"products/{PID_B}")
+    created = article(5, "2026-01-05", title="Untitled")
+    conduit.articles[5] = created
+    index.record(created, PID_C)
+    assert index.synced_through == "2026-01-01"
+    assert PID_C in index.linked_product_ids()
+
+    index.sync()
+    assert conduit.article_reads[-1] == "2026-01-01"
+    assert index.linked_product_ids() == {PID_A, PID_B, PID_C}
+
+
+def test_explicit_links_survive_rebuild():
+    conduit = FakeConduit()
+    conduit.articles = {5: article(5, "2026-01-05", title="Untitled")}
+    index = ArticleLinkIndex(conduit, BLOG_ID, path=index_path())
+    index.record(conduit.articles[5], PID_C)
+    index.rebuild()
+    assert index.linked_product_ids() == {PID_C}
+
+
+def test_refresh_rebuilds_after_a_deletion():
+    conduit = FakeConduit()
+    conduit.articles = {1: article(1, "2026-01-01", title=PID_A),
+                        2: article(2, "2026-01-02", title=PID_B)}
+    index = ArticleLinkIndex(conduit, BLOG_ID, path=index_path())
+    index.rebuild()
+    del conduit.articles[2]
+    index.refresh()
+    assert index.linked_product_ids() == {PID_A}
+    # delta first, then the count mismatch forces a full pass
+    assert conduit.article_reads[-2:] == ["2026-01-02", None]
+
+
+# ── StoreIndex ──────────────────────────────────────────────────
+
+def test_store_index_rebuild_and_lookups():
+    conduit = FakeConduit()
+    conduit.products = [product_node(1, f"Hoodie {PID_A}", "specimen-a"),
+                        product_node(2, f"Tee {PID_B}", "specimen-b")]
+    conduit.collections = [{"legacyResourceId": "10", "title": "[MESH OVERLOAD]", "handle": "mesh",
+                            "updatedAt": "2026-01-01T00:00:00Z", "ruleSet": {"appliedDisjunctively": False}}]
+    index = StoreIndex(conduit, path=index_path())
+    index.rebuild()
+    assert index.find_product_by_title_fragment(PID_B)["id"] == 2
+    assert index.product_by_handle("specimen-a")["id"] == 1
+    assert index.collection_by_title("[mesh overload]")["id"] == 10
+
+    reloaded = StoreIndex(None, path=index.path)
+    assert set(reloaded.products) == {1, 2}
+
+
+def test_store_index_sync_merges_deltas():
+    conduit = FakeConduit()
+    conduit.products = [product_node(1, f"Hoodie {PID_A}", "specimen-a")]
+    index = StoreIndex(conduit, path=index_path())
+    index.rebuild()
+    conduit.delta_products = [product_node(1, f"Hoodie v2 {PID_A}", "specimen-a"),
+                              product_node(3, f"Mug {PID_C}", "specimen-c")]
+    assert index.sync() == 2
+    assert index.products[1]["title"].startswith("Hoodie v2")
+    assert index.find_product_by_title_fragment(PID_C)["id"] == 3
+
+
+def test_registry_backed_writes():
+    conduit = FakeConduit()
+    conduit.redirects = [{"id": 1, "path": "/products/old", "target": "/products/new"}]
+    index = StoreIndex(conduit, path=index_path())
+
+    assert index.ensure_smart_collection("[GLITCH]", rules=[]) is not None
+    assert index.ensure_smart_collection("[glitch]", rules=[]) is None
+    assert index.ensure_redirect("/products/old", "/products/new") is None
+    index.ensure_redirect("/products/old", "/products/newer")
+    index.ensure_redirect("/products/x", "/products/y")
+    assert conduit.created == [("collection", "[GLITCH]"), ("retarget", 1, "/products/newer"),
+                               ("redirect", "/products/x", "/products/y")]
+
+
+if __name__ == "__main__":
+    print("--- [TEST_INIT]: SHOPIFY_INDEXES ---")
+    failed = 0
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            try:
+                fn()
+                print(f"[TEST_PASS] {name}")
+            except Exception as e:
+                failed += 1
+                print(f"[TEST_FAIL] {name}: {e!r}")
+    sys.exit(1 if failed else 0)
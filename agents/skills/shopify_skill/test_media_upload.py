@@ -0,0 +1,136 @@
+"""
+/* [FILE_ID]: TEST_SHOPIFY_MEDIA_UPLOAD // VERSION: 1.0 // STATUS: TESTING */
+Exercises ShopifyConduit.upload_product_images against the local stand-in
+(standin_server.py): stagedUploadsCreate, the streamed multipart POST with
+retry, batched productCreateMedia and productReorderMedia. No Shopify
+credentials or network access needed.
+
+Run with pytest, or directly:
+    python3 agents/skills/shopify_skill/test_media_upload.py
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+# Ensure we can import the module
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from agents.skills.shopify_skill import shopify_skill
+from agents.skills.shopify_skill import standin_server
+
+ENV_KEYS = ("SHOPIFY_STORE_URL", "SHOPIFY_ACCESS_TOKEN", "SHOPIFY_API_BASE")
+
+
+@contextmanager
+def standin(fail_every=0):
+    """Stand-in server on a free port, with a conduit pointed at it."""
+    server = standin_server.serve(port=0, fail_every=fail_every)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    work = Path(tempfile.mkdtemp(prefix="shopify_test_"))
+    saved = (shopify_skill.MEDIA_BATCH, shopify_skill.time.sleep)
+    env = {k: os.environ.get(k) for k in ENV_KEYS}
+    shopify_skill.time.sleep = lambda s: None
+    os.environ["SHOPIFY_STORE_URL"] = "standin.myshopify.com"
+    os.environ["SHOPIFY_ACCESS_TOKEN"] = "standin"
+    os.environ["SHOPIFY_API_BASE"] = f"http://127.0.0.1:{server.server_address[1]}/admin/api/{shopify_skill.API_VERSION}"
+    try:
+        yield shopify_skill.ShopifyConduit(), server, work
+    finally:
+        shopify_skill.MEDIA_BATCH, shopify_skill.time.sleep = saved
+        for k, v in env.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+        server.shutdown()
+        server.server_close()
+
+
+def make_image(work: Path, name: str, size: int = 3000) -> Path:
+    path = work / name
+    path.write_bytes(b"\x89PNG\r\n\x1a\n" + os.urandom(size))
+    return path
+
+
+def stored(server, path: Path) -> bytes:
+    """Bytes the stand-in received for a local file (matched by filename)."""
+    hits = list(server.state.output_dir.glob(f"*_{path.name}"))
+    assert len(hits) == 1, f"{path.name}: {len(hits)} upload(s)"
+    return hits[0].read_bytes()
+
+
+def test_upload_and_attach():
+    with standin() as (conduit, server, work):
+        a, b, c = (make_image(work, n) for n in ("a.png", "b.png", "c.jpg"))
+        created = conduit.upload_product_images({101: [a, b], "gid://shopify/Product/202": [c]})
+        assert {g: len(m) for g, m in created.items()} == {
+            "gid://shopify/Product/101": 2, "gid://shopify/Product/202": 1}
+        for path in (a, b, c):
+            assert stored(server, path) == path.read_bytes()
+        # One stagedUploadsCreate, one aliased productCreateMedia
+        assert server.state.graphql_calls == 2
+        assert server.state.posts == 3
+
+
+def test_staged_posts_are_retried():
+    with standin(fail_every=2) as (conduit, server, work):
+        paths = [make_image(work, f"{n}.png") for n in range(3)]
+        created = conduit.upload_product_images({7: paths}, max_workers=1)
+        assert len(created["gid://shopify/Product/7"]) == 3
+        for path in paths:
+            assert stored(server, path) == path.read_bytes()
+        # POSTs 2 and 4 were answered 503 and re-sent
+        assert server.state.posts == 5
+
+
+def test_failed_stage_raises_before_attaching():
+    with standin(fail_every=1) as (conduit, server, work):
+        path = make_image(work, "doomed.png")
+        try:
+            conduit.upload_product_images({9: [path]})
+        except RuntimeError as e:
+            assert "doomed.png" in str(e)
+        else:
+            raise AssertionError("upload_product_images should raise when staging fails")
+        assert server.state.posts == shopify_skill.STAGE_RETRIES
+        assert server.state.media == {}
+
+
+def test_attach_is_batched():
+    with standin() as (conduit, server, work):
+        shopify_skill.MEDIA_BATCH = 2
+        images = {pid: [make_image(work, f"{pid}.png")] for pid in (1, 2, 3)}
+        created = conduit.upload_product_images(images)
+        assert len(created) == 3
+        # stagedUploadsCreate + productCreateMedia for products 1-2, then 3
+        assert server.state.graphql_calls == 3
+
+
+def test_primary_moves_new_media_to_front():
+    with standin() as (conduit, server, work):
+        gid = "gid://shopify/Product/55"
+        server.state.media[gid] = ["gid://shopify/MediaImage/1"]
+        created = conduit.upload_product_images({55: [make_image(work, "hero.png")]}, primary=True)
+        new_id = created[gid][0]["id"]
+        assert server.state.media[gid] == [new_id, "gid://shopify/MediaImage/1"]
+        # stagedUploadsCreate, productCreateMedia, productReorderMedia
+        assert server.state.graphql_calls == 3
+
+
+if __name__ == "__main__":
+    print("--- [TEST_INIT]: SHOPIFY_MEDIA_STANDIN ---")
+    failed = 0
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            try:
+                fn()
+                print(f"[TEST_PASS] {name}")
+            except Exception as e:
+                failed += 1
+                print(f"[TEST_FAIL] {name}: {e!r}")
+    sys.exit(1 if failed else 0)
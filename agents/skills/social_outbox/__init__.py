@@ -0,0 +1,3 @@
+# [CONDUIT_INIT]
+from .channels import CHANNELS, select_hashtags
+from .social_outbox import enqueue, spawn_worker, OutboxWorker
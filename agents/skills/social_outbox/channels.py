@@ -0,0 +1,320 @@
+# [FILE_ID]: skills/SOCIAL_OUTBOX/CHANNELS // VERSION: 1.0 // STATUS: STABLE
+# [NARRATIVE]: One adapter per broadcast channel. Each instance caches its client,
+# so a worker logs in / negotiates tokens once, and paces its own sends.
+
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _log(msg: str) -> None:
+    """Prints a timestamped log message."""
+    print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {msg}")
+
+
+def select_hashtags(title: str, description_text: str) -> list:
+    """
+    2-4 searchable hashtags for a Specimen: Gemini first, keyword heuristics
+    as the fallback, topped up with generic defaults.
+    """
+    # Analyze content to determine the hashtags to include dynamically using the Gemini API.
+    # Fallback keyword list is maintained in case LLM is unreachable or fails.
+    tags = []
+    try:
+        from agents.skills.gemini_skill.gemini_skill import generate_specimen_data
+
+        _log("[SYSTEM_LOG]: Engaging LLM for dynamic hashtag synthesis ...")
+        llm_prompt = f"""You are a high-fidelity social media hashtag extraction system for a technical apparel line.
+Analyze the following title and description of a garment specimen.
+Extract exactly 2 to 4 highly-relevant, popular, interesting, and highly-searchable hashtags (such as #CentaurusA, #GeomagneticStorm, #Whales, #Defcon, #Goth, #Techwear, #Streetwear) based on real-world topics, cosmic/terrestrial events, organizations, and aesthetic themes explicitly mentioned or strongly featured in the text.
+Do NOT use niche tags unique only to our brand (like #TheLoom, #ChayaBerryGoose, #CBGStudio).
+Only output a valid JSON block containing an array of strings called "tags", formatted as shown, with NO additional chat, commentary, or markdown wrapping:
+{{"tags": ["Tag1", "Tag2"]}}
+
+Garment Specimen Title: {title}
+Garment Specimen Description:
+{description_text}
+"""
+        # Query Gemini
+        response_text = generate_specimen_data("gemini-2.5-flash", llm_prompt)
+        json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
+        if json_match:
+            parsed_data = json.loads(json_match.group(0))
+            extracted_tags = parsed_data.get("tags", [])
+            
+            # Filter, clean and format extracted tags to be valid alphanumeric hashtags
+            for raw_tag in extracted_tags:
+                # Remove # if present, remove non-alphanumeric chars
+                clean_tag = re.sub(r"[^\w]", "", raw_tag).strip()
+                if clean_tag and len(clean_tag) >= 3 and len(clean_tag) <= 30:
+                    if clean_tag not in tags:
+                        tags.append(clean_tag)
+            _log(f"✅ [SYSTEM_SUCCESS]: Dynamic hashtags synthesized: {tags}")
+    except Exception as llm_err:
+        _log(f"⚠️ [SYSTEM_WARNING]: Dynamic hashtag synthesis failed: {llm_err}. Reverting to static keyword heuristics.")
+
+    # Local static heuristic mapping as a robust fallback
+    if not tags:
+        combined_content = f"{title} {description_text}".lower()
+        
+        # Map specific interesting topic keywords in description/title to popular, heavily-searched hashtags
+        topic_map = {
+            "floral": ["Floral", "Botanical"],
+            "flower": ["Floral"],
+            "botanical": ["Botanical", "Floral"],
+            "garden": ["MidnightGarden"],
+            "plaid": ["Plaid", "Tartan"],
+            "tartan": ["Tartan", "Plaid"],
+            "fishnet": ["Fishnet", "Mesh"],
+            "mesh": ["Mesh", "Fishnet"],
+            "geometric": ["Geometric"],
+            "grid": ["GridAesthetic", "Minimalist"],
+            "wireframe": ["3DArt", "Minimalist"],
+            "glitch": ["GlitchArt"],
+            "distortion": ["GlitchArt"],
+            "anomaly": ["SciFi"],
+            "brutalist": ["Brutalist"],
+            "brutalism": ["Brutalist"],
+            "skeleton": ["Goth", "Anatomy"],
+            "anatomical": ["Anatomy", "Goth"],
+            "skull": ["Goth"],
+            "cyberpunk": ["Cyberpunk", "SciFi"],
+            "industrial": ["Industrial"],
+            "goth": ["Goth"],
+            "gothic": ["Goth"],
+            "alt": ["AlternativeFashion"],
+            "alternative": ["AlternativeFashion"],
+            "minimalist": ["Minimalism"],
+            "minimalism": ["Minimalism"],
+            "dark": ["DarkAesthetic"],
+            "moody": ["DarkAesthetic"],
+            "midnight": ["DarkAesthetic"],
+            "obsidian": ["AllBlackEverything", "DarkAesthetic"],
+            "black": ["AllBlackEverything"],
+            "red": ["RedAesthetic"],
+            "neon": ["NeonGlow"],
+            "hoodie": ["Streetwear", "Cozy"],
+            "sweatshirt": ["Streetwear", "Cozy"],
+            "cozy": ["Cozy"],
+            "soft": ["Cozy"],
+            "jogger": ["Streetwear", "Activewear"],
+            "legging": ["Streetwear", "Activewear"],
+            "pant": ["Streetwear", "Activewear"],
+            "cargo": ["Streetwear", "CargoPants"],
+            "skirt": ["OOTD", "AlternativeFashion"],
+            "dress": ["OOTD", "AlternativeFashion"],
+            "bag": ["Accessories"],
+            "tote": ["Accessories"],
+            "sports bra": ["Activewear", "Athleisure"],
+            "athletic": ["Activewear", "Athleisure"]
+        }
+
+        for keyword, mapped_tags in topic_map.items():
+            if keyword in combined_content:
+                for t in mapped_tags:
+                    if t not in tags:
+                        tags.append(t)
+
+    # Deduplicate, keep order
+    seen = set()
+    deduped_tags = []
+    for t in tags:
+        if t not in seen:
+            seen.add(t)
+            deduped_tags.append(t)
+
+    # Fallback default highly-searched/popular hashtags instead of niche brand tags
+    defaults = ["Techwear", "Streetwear", "Cyberpunk", "Fashion", "OOTD"]
+    for d in defaults:
+        if len(deduped_tags) >= 4:
+            break
+        if d not in seen:
+            seen.add(d)
+            deduped_tags.append(d)
+
+    # Keep a maximum of 4 high-signal tags to stay compact and prevent spam look
+    selected_tags = deduped_tags[:4]
+
+    return selected_tags
+
+
+class Channel:
+    """
+    Base adapter. Subclasses set `name`, `min_interval` (seconds between sends)
+    and `max_attempts`, and implement configured(), _connect() and _send().
+    """
+    name = "channel"
+    min_interval = 5.0
+    max_attempts = 5
+
+    def __init__(self):
+        self._client = None
+        self._lock = threading.Lock()
+        self._last_sent = 0.0
+
+    @classmethod
+    def configured(cls) -> bool:
+        raise NotImplementedError
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = self._connect()
+        return self._client
+
+    def _connect(self):
+        raise NotImplementedError
+
+    def _send(self, job: dict) -> str:
+        raise NotImplementedError
+
+    def deliver(self, job: dict) -> str:
+        """Send one job, serialized and paced per channel. Raises on failure."""
+        with self._lock:
+            wait = self._last_sent + self.min_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                return self._send(job)
+            except Exception:
+                # A failure may mean a stale session; reconnect on the next attempt.
+                self._client = None
+                raise
+            finally:
+                self._last_sent = time.monotonic()
+
+
+class BlueskyChannel(Channel):
+    """Posts the lifestyle mockup as a link card with generated hashtags."""
+    name = "bluesky"
+    min_interval = 5.0
+    handle = "cbgstudio.bsky.social"
+
+    @classmethod
+    def configured(cls) -> bool:
+        return bool(os.getenv("BLUESKY_APP_PASSWORD"))
+
+    def _connect(self):
+        from atproto import Client
+        client = Client()
+        client.login(self.handle, os.getenv("BLUESKY_APP_PASSWORD"))
+        _log(f"[SYSTEM_LOG]: Logged into Bluesky as {self.handle}.")
+        return client
+
+    def _send(self, job: dict) -> str:
+        from atproto import models, client_utils
+        from agents.skills.broadcast_encoder import encode_bytes
+
+        client = self.client
+        # Fit the image under Bluesky's 1MB blob limit (cached per image)
+        image_data = encode_bytes(job["lifestyle_path"], "bluesky")
+        upload = client.upload_blob(image_data)
+
+        # Clean title & description
+        title = job.get("title") or "UNVERIFIED SPECIMEN"
+        description_text = job.get("description") or ""
+        clean_desc = description_text.replace("\n", " ").strip()
+        if len(clean_desc) > 200:
+            clean_desc = clean_desc[:197] + "..."
+
+        # Package link card with the uploaded blob reference
+        link_card = models.AppBskyEmbedExternal.Main(
+            external=models.AppBskyEmbedExternal.External(
+                title=title,
+                description=clean_desc,
+                uri=job.get("product_url") or "https://cbg.studio",
+                thumb=upload.blob
+            )
+        )
+
+        selected_tags = select_hashtags(title, description_text)
+
+        # Assemble the base alert text
+        base_alert = f"[ALERT] A new active intrusion specimen has been extruded into the manifold: {title}"
+
+        # Adjust text length to strictly fit the 300 character limit with the hashtags
+        tags_str = " ".join([f"#{t}" for t in selected_tags])
+        max_base_len = 300 - len(tags_str) - 2  # 2 accounts for \n\n divider
+        if len(base_alert) > max_base_len:
+            base_alert = base_alert[:max_base_len - 3] + "..."
+
+        tb = client_utils.TextBuilder()
+        tb.text(base_alert)
+        tb.text("\n\n")
+        for i, t in enumerate(selected_tags):
+            if i > 0:
+                tb.text(" ")
+            tb.tag(f"#{t}", t)
+
+        post = client.send_post(text=tb, embed=link_card)
+        return getattr(post, "uri", "") or "posted"
+
+
+class PinterestChannel(Channel):
+    """Pins the lifestyle mockup to PINTEREST_BOARD_ID, linking to the product."""
+    name = "pinterest"
+    min_interval = 10.0
+
+    @classmethod
+    def configured(cls) -> bool:
+        return bool(os.getenv("PINTEREST_ACCESS_TOKEN") and os.getenv("PINTEREST_BOARD_ID"))
+
+    def _connect(self):
+        from agents.skills.pinterest_skill.pinterest_skill import PinterestConduit
+        sandbox = os.getenv("PINTEREST_SANDBOX", "true").lower() != "false"
+        if sandbox:
+            _log("⚠️ [SYSTEM_WARNING]: Pinterest channel is posting to the sandbox (set PINTEREST_SANDBOX=false for production).")
+        return PinterestConduit(sandbox=sandbox)
+
+    def _send(self, job: dict) -> str:
+        title = (job.get("title") or "UNVERIFIED SPECIMEN")[:100]
+        description = (job.get("description") or "").replace("\n", " ").strip()[:500]
+        data = self.client.create_pin(
+            os.getenv("PINTEREST_BOARD_ID"), title, description,
+            image_path=job["lifestyle_path"], link=job.get("product_url"),
+        )
+        if not data:
+            raise RuntimeError("Pin creation failed")
+        return str(data.get("id"))
+
+
+class TikTokChannel(Channel):
+    """Synthesizes a still-image video from the mockup and direct-posts it."""
+    name = "tiktok"
+    min_interval = 60.0
+    max_attempts = 3
+
+    @classmethod
+    def configured(cls) -> bool:
+        # Direct posting needs a user access token; client key + secret alone
+        # only yield a client token, which _connect rejects.
+        token_file = Path(__file__).resolve().parent.parent.parent.parent / ".env" / "tiktok_access_token.txt"
+        return bool(os.getenv("TIKTOK_ACCESS_TOKEN") or token_file.exists())
+
+    def _connect(self):
+        from agents.skills.tiktok_skill.tiktok_skill import TikTokConduit
+        conduit = TikTokConduit()
+        if not conduit.access_token:
+            raise RuntimeError("No TikTok access token")
+        return conduit
+
+    def _send(self, job: dict) -> str:
+        from agents.skills.tiktok_skill.synthesizer import synthesize_video_from_image
+        video_path = synthesize_video_from_image(job["lifestyle_path"])
+        if not video_path:
+            raise RuntimeError("Video synthesis failed")
+        title = f"CBG Studio // {job.get('title') or 'UNVERIFIED SPECIMEN'}"
+        publish_id = self.client.post_video(video_path, title=title)
+        if not publish_id:
+            raise RuntimeError("TikTok post failed")
+        return str(publish_id)
+
+
+CHANNELS = {c.name: c for c in (BlueskyChannel, PinterestChannel, TikTokChannel)}
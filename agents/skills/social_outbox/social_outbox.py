@@ -0,0 +1,228 @@
+# [FILE_ID]: skills/SOCIAL_OUTBOX // VERSION: 1.0 // STATUS: STABLE
+# [NARRATIVE]: Durable local outbox for social broadcasts. Fabrication enqueues a
+# job and moves on; a background worker fans it out to every enabled channel
+# (SOCIAL_CHANNELS, default bluesky) whose credentials are present.
+#
+# Jobs live in artifacts/.social_outbox/<job_id>.json, written atomically. Each
+# job tracks per-channel state (pending / done / failed), attempts, and the time
+# of the next retry; settled jobs move to done/. One worker runs at a time (flock on worker.lock); it keeps
+# one client per channel, so logins and token negotiation happen once.
+#
+# Usage:
+#   python3 -m agents.skills.social_outbox.social_outbox --drain    # until empty
+#   python3 -m agents.skills.social_outbox.social_outbox --watch    # poll forever
+#   python3 -m agents.skills.social_outbox.social_outbox --status
+
+import argparse
+import fcntl
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+from .channels import CHANNELS, _log
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+OUTBOX_DIR = REPO_ROOT / "artifacts" / ".social_outbox"
+DONE_DIR = OUTBOX_DIR / "done"
+LOCK_PATH = OUTBOX_DIR / "worker.lock"
+WORKER_LOG = OUTBOX_DIR / "worker.log"
+BASE_BACKOFF = 60          # seconds; doubles per failed attempt
+MAX_BACKOFF = 3600
+POLL_INTERVAL = 15
+# Channels are opt-in: only those listed here (and configured) receive broadcasts.
+ENABLED_CHANNELS = [c.strip() for c in os.getenv("SOCIAL_CHANNELS", "bluesky").split(",") if c.strip()]
+
+
+def _job_path(job_id: str) -> Path:
+    return OUTBOX_DIR / f"{job_id}.json"
+
+
+def _write_job(job: dict) -> None:
+    OUTBOX_DIR.mkdir(parents=True, exist_ok=True)
+    path = _job_path(job["id"])
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(job, indent=2), encoding="utf-8")
+    tmp.replace(path)
+
+
+def load_jobs() -> List[dict]:
+    jobs = []
+    for path in sorted(OUTBOX_DIR.glob("*.json")):
+        try:
+            jobs.append(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, json.JSONDecodeError):
+            continue
+    return jobs
+
+
+def configured_channels() -> List[str]:
+    """Channels listed in SOCIAL_CHANNELS whose credentials are present."""
+    return [name for name in ENABLED_CHANNELS if name in CHANNELS and CHANNELS[name].configured()]
+
+
+def enqueue(lifestyle_path, title: str, product_url: str, description: str = "",
+            channels: Optional[List[str]] = None) -> Optional[str]:
+    """
+    Record a broadcast job for every enabled, configured channel (or the given
+    subset). Returns the job id, or None when no channel is configured.
+    """
+    names = [c for c in (channels or configured_channels()) if c in CHANNELS]
+    if not names:
+        _log("⚠️ [SYSTEM_WARNING]: No social channels configured. Broadcast not queued.")
+        return None
+
+    job = {
+        "id": f"{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "lifestyle_path": str(Path(lifestyle_path).resolve()),
+        "title": title,
+        "product_url": product_url,
+        "description": description,
+        "channels": {name: {"state": "pending", "attempts": 0, "next_at": 0} for name in names},
+    }
+    _write_job(job)
+    _log(f"[SYSTEM_LOG]: Broadcast queued ({', '.join(names)}): {job['id']}")
+    return job["id"]
+
+
+def spawn_worker() -> None:
+    """Start a detached draining worker. A worker already running keeps the lock, so the new one just exits."""
+    OUTBOX_DIR.mkdir(parents=True, exist_ok=True)
+    with open(WORKER_LOG, "a") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "agents.skills.social_outbox.social_outbox", "--drain"],
+            cwd=str(REPO_ROOT), stdout=log, stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL, start_new_session=True,
+        )
+
+
+class OutboxWorker:
+    """
+    Delivers due (job, channel) pairs concurrently. Channels run in parallel;
+    each channel serializes and paces its own sends. Failures back off
+    exponentially until the channel's max_attempts.
+    """
+
+    def __init__(self, max_workers: int = len(CHANNELS)):
+        self.max_workers = max_workers
+        self.channels = {}
+        self._job_lock = threading.Lock()
+
+    def _channel(self, name: str):
+        if name not in self.channels:
+            self.channels[name] = CHANNELS[name]()
+        return self.channels[name]
+
+    def _due(self, jobs: List[dict], now: float):
+        for job in jobs:
+            for name, state in job["channels"].items():
+                if state["state"] == "pending" and state.get("next_at", 0) <= now and name in CHANNELS:
+                    yield job, name
+
+    def _deliver(self, job: dict, name: str) -> None:
+        channel = self._channel(name)
+        try:
+            if not Path(job["lifestyle_path"]).exists():
+                raise FileNotFoundError(job["lifestyle_path"])
+            result, error = channel.deliver(job), None
+        except Exception as e:
+            result, error = None, str(e)
+
+        with self._job_lock:
+            state = job["channels"][name]
+            state["attempts"] = state.get("attempts", 0) + 1
+            if error is None:
+                state.update(state="done", result=result, done_at=datetime.now(timezone.utc).isoformat())
+                state.pop("error", None)
+                _log(f"✅ [SYSTEM_SUCCESS]: {name} broadcast delivered for {job['title']}")
+            elif state["attempts"] >= channel.max_attempts:
+                state.update(state="failed", error=error)
+                _log(f"❌ [SYSTEM_ERROR]: {name} broadcast abandoned after {state['attempts']} attempts: {error}")
+            else:
+                delay = min(BASE_BACKOFF * 2 ** (state["attempts"] - 1), MAX_BACKOFF)
+                state.update(error=error, next_at=time.time() + delay)
+                _log(f"⚠️ [SYSTEM_WARNING]: {name} broadcast failed ({error}); retry in {delay}s")
+            _write_job(job)
+            if all(s["state"] != "pending" for s in job["channels"].values()):
+                DONE_DIR.mkdir(parents=True, exist_ok=True)
+                _job_path(job["id"]).replace(DONE_DIR / f"{job['id']}.json")
+
+    def run_once(self) -> int:
+        """Deliver everything currently due. Returns the number of pending channel sends left."""
+        jobs = load_jobs()
+        due = list(self._due(jobs, time.time()))
+        if due:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for f in as_completed([pool.submit(self._deliver, job, name) for job, name in due]):
+                    f.result()
+        return sum(
+            1 for job in jobs for name, s in job["channels"].items()
+            if s["state"] == "pending" and name in CHANNELS
+        )
+
+    def run(self, drain: bool = True, poll: int = POLL_INTERVAL) -> None:
+        """Loop until nothing is pending (drain) or forever (watch)."""
+        while True:
+            pending = self.run_once()
+            if drain and not pending:
+                return
+            time.sleep(poll)
+
+
+def _acquire_lock():
+    OUTBOX_DIR.mkdir(parents=True, exist_ok=True)
+    handle = open(LOCK_PATH, "w")
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        handle.close()
+        return None
+    return handle
+
+
+def print_status() -> None:
+    jobs = load_jobs()
+    print(f"[SYSTEM_LOG]: {len(jobs)} job(s) in {OUTBOX_DIR}")
+    for job in jobs:
+        states = ", ".join(f"{n}={s['state']}({s.get('attempts', 0)})" for n, s in job["channels"].items())
+        print(f"  {job['id']}  {job['title'][:40]:<40}  {states}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Social broadcast outbox worker")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--drain", action="store_true", help="Deliver until nothing is pending (default)")
+    mode.add_argument("--watch", action="store_true", help="Keep polling for new jobs")
+    mode.add_argument("--status", action="store_true", help="List queued jobs and exit")
+    parser.add_argument("--poll", type=int, default=POLL_INTERVAL, help="Seconds between polls")
+    args = parser.parse_args()
+
+    if args.status:
+        print_status()
+        return
+
+    worker = OutboxWorker()
+    while True:
+        lock = _acquire_lock()
+        if lock is None:
+            print("[SYSTEM_LOG]: Another outbox worker holds the lock. Exiting.")
+            return
+        try:
+            worker.run(drain=not args.watch, poll=args.poll)
+        finally:
+            lock.close()
+        # A job enqueued while we were exiting found the lock held; pick it up.
+        if not any(s["state"] == "pending" for job in load_jobs() for s in job["channels"].values()):
+            return
+
+
+if __name__ == "__main__":
+    main()
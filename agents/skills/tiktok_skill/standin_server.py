@@ -0,0 +1,110 @@
+# [FILE_ID]: skills/TIKTOK_SKILL/STANDIN_SERVER // VERSION: 1.0 // STATUS: STABLE
+# [NARRATIVE]: A local stand-in for TikTok's Direct Post init + chunked upload
+# endpoints, so TikTokConduit can be exercised without touching the Archive.
+#
+# It enforces the chunk protocol: every PUT must carry the next contiguous
+# Content-Range, and the last chunk must end at video_size - 1. Partial chunks
+# answer 206, the final one 201. --fail-every N answers every Nth PUT with a 503
+# to exercise per-chunk retry. Assembled uploads land in --output-dir.
+#
+# Usage:
+#   python3 agents/skills/tiktok_skill/standin_server.py --port 8765 --fail-every 3
+#   TIKTOK_API_BASE=http://127.0.0.1:8765/v2 TIKTOK_ACCESS_TOKEN=standin \
+#       python3 scripts/post_catalog_to_tiktok.py <image>
+
+import argparse
+import json
+import re
+import tempfile
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+
+class StandinState:
+    def __init__(self, output_dir: Path, fail_every: int = 0):
+        self.output_dir = output_dir
+        self.fail_every = fail_every
+        self.uploads = {}
+        self.puts = 0
+        self.lock = threading.Lock()
+
+
+def make_handler(state: StandinState):
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, code, payload=None):
+            body = json.dumps(payload or {}).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            if not self.path.rstrip("/").endswith("/post/publish/video/init"):
+                return self._reply(404, {"error": {"code": "not_found"}})
+            req = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            info = req.get("source_info", {})
+            size, chunk, count = info.get("video_size", 0), info.get("chunk_size", 0), info.get("total_chunk_count", 0)
+            if not size or not chunk or count != max(1, size // chunk):
+                return self._reply(400, {"error": {"code": "invalid_params", "message": "bad chunk plan"}})
+
+            publish_id = f"v_pub_standin~{uuid.uuid4().hex[:12]}"
+            with state.lock:
+                state.uploads[publish_id] = {"size": size, "received": 0,
+                                             "path": state.output_dir / f"{publish_id}.mp4"}
+            host, port = self.server.server_address[:2]
+            self._reply(200, {"data": {"publish_id": publish_id,
+                                       "upload_url": f"http://{host}:{port}/upload/{publish_id}"},
+                              "error": {"code": "ok"}})
+
+        def do_PUT(self):
+            publish_id = self.path.rsplit("/", 1)[-1]
+            length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(length)
+            with state.lock:
+                state.puts += 1
+                if state.fail_every and state.puts % state.fail_every == 0:
+                    return self._reply(503, {"error": {"code": "injected_failure"}})
+                upload = state.uploads.get(publish_id)
+                match = RANGE_RE.fullmatch(self.headers.get("Content-Range", ""))
+                if not upload or not match:
+                    return self._reply(404 if not upload else 400, {"error": {"code": "bad_request"}})
+                first, last, total = map(int, match.groups())
+                if total != upload["size"] or first != upload["received"] or last - first + 1 != len(body):
+                    return self._reply(416, {"error": {"code": "range_mismatch",
+                                                       "expected_offset": upload["received"]}})
+                with open(upload["path"], "ab") as f:
+                    f.write(body)
+                upload["received"] = last + 1
+                done = upload["received"] == upload["size"]
+            self._reply(201 if done else 206)
+
+        def log_message(self, fmt, *args):
+            print(f"[STANDIN]: {fmt % args}")
+
+    return Handler
+
+
+def serve(port: int = 8765, output_dir=None, fail_every: int = 0) -> ThreadingHTTPServer:
+    """Build (but do not start) a stand-in server bound to 127.0.0.1:port."""
+    output_dir = Path(output_dir or tempfile.mkdtemp(prefix="tiktok_standin_"))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    state = StandinState(output_dir, fail_every)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    server.state = state
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for TikTok's chunked upload API")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--output-dir", help="Where assembled uploads are written (default: a temp dir)")
+    parser.add_argument("--fail-every", type=int, default=0, help="Answer every Nth PUT with 503")
+    args = parser.parse_args()
+    server = serve(args.port, args.output_dir, args.fail_every)
+    print(f"[SYSTEM_LOG]: Stand-in listening on http://127.0.0.1:{args.port}/v2 -> {server.state.output_dir}")
+    server.serve_forever()
@@ -5,6 +5,11 @@ import subprocess
 import os
 from pathlib import Path
 
+try:
+    from agents.skills.broadcast_encoder import encode_for
+except ImportError:
+    encode_for = None
+
 def synthesize_video_from_image(image_path, output_path=None, duration=5):
     """
     The Ritual of Motion.
@@ -25,6 +30,9 @@ def synthesize_video_from_image(image_path, output_path=None, duration=5):
         output_path = Path(output_path)
 
     print(f"[SYSTEM_LOG]: Synthesizing Data Stream from {image_path.name}...")
+
+    # Feed ffmpeg a frame already bounded for TikTok instead of the full-size master
+    source_frame = encode_for(image_path, "tiktok") if encode_for else image_path
     
     # FFmpeg command to create a static video from an image
     # -loop 1: Loop the single image
@@ -34,7 +42,7 @@ def synthesize_video_from_image(image_path, output_path=None, duration=5):
     cmd = [
         "ffmpeg", "-y",
         "-loop", "1",
-        "-i", str(image_path),
+        "-i", str(source_frame),
         "-c:v", "libx264",
         "-t", str(duration),
         "-pix_fmt", "yuv420p",
@@ -0,0 +1,146 @@
+"""
+/* [FILE_ID]: TEST_TIKTOK_UPLOAD // VERSION: 1.0 // STATUS: TESTING */
+Exercises TikTokConduit.post_video against the local stand-in
+(standin_server.py): chunk plan, per-chunk retry, and resume after an
+interrupted upload. No TikTok credentials or network access needed.
+
+Run with pytest, or directly:
+    python3 agents/skills/tiktok_skill/test_tiktok_upload.py
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+# Ensure we can import the module
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from agents.skills.tiktok_skill import tiktok_skill
+from agents.skills.tiktok_skill import standin_server
+
+CHUNK = 4096
+
+
+class Interrupted(Exception):
+    pass
+
+
+@contextmanager
+def standin(fail_every=0):
+    """Stand-in server on a free port, with the conduit pointed at it and chunk sizes scaled down."""
+    server = standin_server.serve(port=0, fail_every=fail_every)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    work = Path(tempfile.mkdtemp(prefix="tiktok_test_"))
+    saved = (tiktok_skill.MIN_CHUNK_SIZE, tiktok_skill.UPLOAD_STATE_PATH, tiktok_skill.time.sleep)
+    env = {k: os.environ.get(k) for k in ("TIKTOK_API_BASE", "TIKTOK_ACCESS_TOKEN")}
+    tiktok_skill.MIN_CHUNK_SIZE = 1024
+    tiktok_skill.UPLOAD_STATE_PATH = work / "uploads.json"
+    tiktok_skill.time.sleep = lambda s: None
+    os.environ["TIKTOK_API_BASE"] = f"http://127.0.0.1:{server.server_address[1]}/v2"
+    os.environ["TIKTOK_ACCESS_TOKEN"] = "standin"
+    try:
+        yield server, work
+    finally:
+        tiktok_skill.MIN_CHUNK_SIZE, tiktok_skill.UPLOAD_STATE_PATH, tiktok_skill.time.sleep = saved
+        for k, v in env.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+        server.shutdown()
+        server.server_close()
+
+
+def make_video(work: Path, size: int) -> Path:
+    path = work / "specimen.mp4"
+    path.write_bytes(os.urandom(size))
+    return path
+
+
+def received(server, publish_id) -> bytes:
+    return server.state.uploads[publish_id]["path"].read_bytes()
+
+
+def test_chunk_plan():
+    assert tiktok_skill.chunk_plan(4 * 1024 * 1024) == (4 * 1024 * 1024, 1)
+    size = 23 * 1024 * 1024
+    assert tiktok_skill.chunk_plan(size, 10 * 1024 * 1024) == (10 * 1024 * 1024, 2)
+    # Chunks are clamped to the 5 MB floor; the remainder rides on the last chunk
+    assert tiktok_skill.chunk_plan(size, 1024) == (5 * 1024 * 1024, 4)
+
+
+def test_chunked_upload():
+    with standin() as (server, work):
+        video = make_video(work, 4 * CHUNK + 1500)
+        sent = []
+        publish_id = tiktok_skill.TikTokConduit().post_video(
+            video, "chunked", chunk_size=CHUNK, progress=lambda done, total: sent.append(done))
+        assert publish_id
+        assert received(server, publish_id) == video.read_bytes()
+        assert server.state.puts == 4
+        assert sent == [CHUNK, 2 * CHUNK, 3 * CHUNK, video.stat().st_size]
+        assert not tiktok_skill.UPLOAD_STATE_PATH.exists() or publish_id not in tiktok_skill.UPLOAD_STATE_PATH.read_text()
+
+
+def test_single_chunk_upload():
+    with standin() as (server, work):
+        video = make_video(work, 800)
+        publish_id = tiktok_skill.TikTokConduit().post_video(video, "small", chunk_size=CHUNK)
+        assert received(server, publish_id) == video.read_bytes()
+        assert server.state.puts == 1
+
+
+def test_failed_chunks_are_retried():
+    with standin(fail_every=3) as (server, work):
+        video = make_video(work, 5 * CHUNK)
+        publish_id = tiktok_skill.TikTokConduit().post_video(video, "retried", chunk_size=CHUNK)
+        assert publish_id
+        assert received(server, publish_id) == video.read_bytes()
+        # PUTs 3 and 6 (chunks 3 and 5) were answered 503 and re-sent
+        assert server.state.puts == 7
+
+
+def test_exhausted_retries_return_none():
+    with standin(fail_every=1) as (server, work):
+        video = make_video(work, 2 * CHUNK)
+        assert tiktok_skill.TikTokConduit().post_video(video, "doomed", chunk_size=CHUNK) is None
+        assert server.state.puts == tiktok_skill.CHUNK_RETRIES + 1
+
+
+def test_interrupted_upload_resumes():
+    with standin() as (server, work):
+        video = make_video(work, 3 * CHUNK + 10)
+
+        def interrupt(done, total):
+            raise Interrupted()
+
+        try:
+            tiktok_skill.TikTokConduit().post_video(video, "resumed", chunk_size=CHUNK, progress=interrupt)
+        except Interrupted:
+            pass
+        assert len(server.state.uploads) == 1
+        assert server.state.puts == 1
+
+        publish_id = tiktok_skill.TikTokConduit().post_video(video, "resumed", chunk_size=CHUNK)
+        # Same publish id, no second init, only the remaining chunks sent
+        assert list(server.state.uploads) == [publish_id]
+        assert server.state.puts == 3
+        assert received(server, publish_id) == video.read_bytes()
+
+
+if __name__ == "__main__":
+    print("--- [TEST_INIT]: TIKTOK_UPLOAD_STANDIN ---")
+    failed = 0
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            try:
+                fn()
+                print(f"[TEST_PASS] {name}")
+            except Exception as e:
+                failed += 1
+                print(f"[TEST_FAIL] {name}: {e!r}")
+    sys.exit(1 if failed else 0)
@@ -3,6 +3,7 @@
 
 import os
 import sys
+import time
 import requests
 import json
 from pathlib import Path
@@ -11,6 +12,24 @@ from dotenv import load_dotenv
 # Initialize environment
 load_dotenv()
 
+# Chunked upload protocol: chunks are 5-64 MB, the remainder is merged into the
+# final chunk (so it may reach 128 MB), and files under 5 MB go as one chunk.
+MIN_CHUNK_SIZE = 5 * 1024 * 1024
+MAX_CHUNK_SIZE = 64 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = int(os.getenv("TIKTOK_CHUNK_MB", "10")) * 1024 * 1024
+CHUNK_RETRIES = 4
+UPLOAD_URL_TTL = 55 * 60        # upload URLs expire after an hour
+UPLOAD_STATE_PATH = Path(__file__).resolve().parent.parent.parent.parent / "artifacts" / ".tiktok_uploads.json"
+
+
+def chunk_plan(video_size, chunk_size=DEFAULT_CHUNK_SIZE):
+    """(chunk_size, total_chunk_count) for a file of video_size bytes."""
+    if video_size <= MIN_CHUNK_SIZE:
+        return video_size, 1
+    chunk_size = max(MIN_CHUNK_SIZE, min(chunk_size, MAX_CHUNK_SIZE, video_size))
+    return chunk_size, max(1, video_size // chunk_size)
+
+
 class TikTokConduit:
     """
     The Ritual for transmitting Specimens to the TikTok Archive.
@@ -21,7 +40,9 @@ class TikTokConduit:
         self.client_key = os.getenv("TIKTOK_CLIENT_KEY")
         self.client_secret = os.getenv("TIKTOK_CLIENT_SECRET")
         self.access_token = self._fetch_credential()
-        self.api_base_url = "https://open.tiktokapis.com/v2"
+        # TIKTOK_API_BASE points the conduit at a stand-in server (see standin_server.py)
+        self.api_base_url = os.getenv("TIKTOK_API_BASE", "https://open.tiktokapis.com/v2")
+        self.session = requests.Session()
         self.headers = {
             "Authorization": f"Bearer {self.access_token}" if self.access_token else "",
             "Content-Type": "application/json; charset=UTF-8"
@@ -114,10 +135,13 @@ class TikTokConduit:
             print(f"[SYSTEM_DISSONANCE]: Connection Ritual failed: {e}")
             return False
 
-    def post_video(self, video_path, title, privacy_level="PUBLIC_TO_EVERYONE"):
+    def post_video(self, video_path, title, privacy_level="PUBLIC_TO_EVERYONE",
+                   chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
         """
         Initiates the Direct Post ritual for a video Specimen.
-        Note: This is a multi-step process involving initialization and file streaming.
+        The file is streamed in chunks; an interrupted upload of the same file
+        resumes from the last acknowledged chunk while its upload URL is live.
+        progress, if given, is called as progress(bytes_sent, total_bytes).
         """
         if not self.access_token:
             print("[SYSTEM_DISSONANCE]: Cannot transmit without valid credentials.")
@@ -129,10 +153,31 @@ class TikTokConduit:
             return None
 
         print(f"[SYSTEM_LOG]: Preparing transmission of Specimen: {video_path.name}")
-        
-        # 1. Initialize Post Ritual
+        stat = video_path.stat()
+        state_key = f"{video_path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+        upload = self._load_upload_state().get(state_key)
+
+        if upload and time.time() - upload["created"] < UPLOAD_URL_TTL:
+            print(f"[SYSTEM_LOG]: Resuming {upload['publish_id']} at chunk "
+                  f"{upload['acked']}/{upload['total_chunk_count']}")
+        else:
+            upload = self._init_upload(title, privacy_level, stat.st_size, chunk_size)
+            if not upload:
+                return None
+            if not upload.get("upload_url"):
+                return upload["publish_id"]
+            self._save_upload_state(state_key, upload)
+
+        return self._stream_specimen(
+            video_path, upload["upload_url"], upload["publish_id"],
+            chunk_size=upload["chunk_size"], total_chunk_count=upload["total_chunk_count"],
+            start_chunk=upload["acked"], progress=progress, state_key=state_key,
+        )
+
+    def _init_upload(self, title, privacy_level, video_size, chunk_size):
+        """POST the init call for a chunked FILE_UPLOAD. Returns the upload record or None."""
+        chunk_size, total_chunk_count = chunk_plan(video_size, chunk_size)
         init_url = f"{self.api_base_url}/post/publish/video/init/"
-        # Simplistic payload for demonstration; real API needs exact file size etc.
         payload = {
             "post_info": {
                 "title": title,
@@ -144,23 +189,27 @@ class TikTokConduit:
             },
             "source_info": {
                 "source": "FILE_UPLOAD",
-                "video_size": video_path.stat().st_size,
-                "chunk_size": video_path.stat().st_size,
-                "total_chunk_count": 1
+                "video_size": video_size,
+                "chunk_size": chunk_size,
+                "total_chunk_count": total_chunk_count
             }
         }
 
         try:
-            response = requests.post(init_url, headers=self.headers, json=payload)
+            response = self.session.post(init_url, headers=self.headers, json=payload)
             if response.status_code == 200:
                 data = response.json().get('data', {})
                 publish_id = data.get('publish_id')
-                upload_url = data.get('upload_url')
-                print(f"[SYSTEM_ECHO]: Ritual Initialized. Publish ID: {publish_id}")
-                
-                if upload_url:
-                    return self._stream_specimen(video_path, upload_url, publish_id)
-                return publish_id
+                print(f"[SYSTEM_ECHO]: Ritual Initialized. Publish ID: {publish_id} "
+                      f"({total_chunk_count} chunk(s) of {chunk_size} bytes)")
+                return {
+                    "publish_id": publish_id,
+                    "upload_url": data.get('upload_url'),
+                    "chunk_size": chunk_size,
+                    "total_chunk_count": total_chunk_count,
+                    "acked": 0,
+                    "created": time.time(),
+                }
             else:
                 print(f"[SYSTEM_DISSONANCE]: Initialization failed: {response.text}")
                 return None
@@ -168,33 +217,91 @@ class TikTokConduit:
             print(f"[SYSTEM_DISSONANCE]: Transmission init failed: {e}")
             return None
 
-    def _stream_specimen(self, file_path, upload_url, publish_id):
+    def _stream_specimen(self, file_path, upload_url, publish_id, chunk_size=None,
+                         total_chunk_count=1, start_chunk=0, progress=None, state_key=None):
         """
-        Streams the file bytes to the negotiated upload URL.
+        Streams the file to the negotiated upload URL one chunk at a time.
+        Each chunk is retried with backoff; progress is checkpointed after
+        every acknowledged chunk so a later call can resume.
         """
         file_path = Path(file_path)
         file_size = file_path.stat().st_size
-        
-        headers = {
-            "Content-Type": "video/mp4",
-            "Content-Length": str(file_size),
-            "Content-Range": f"bytes 0-{file_size - 1}/{file_size}"
-        }
-        
+        chunk_size = chunk_size or file_size
+
         print(f"[SYSTEM_LOG]: Streaming bytes to TikTok Archive...")
+        with open(file_path, 'rb') as f:
+            for index in range(start_chunk, total_chunk_count):
+                first = index * chunk_size
+                last = file_size - 1 if index == total_chunk_count - 1 else first + chunk_size - 1
+                f.seek(first)
+                body = f.read(last - first + 1)
+                headers = {
+                    "Content-Type": "video/mp4",
+                    "Content-Length": str(len(body)),
+                    "Content-Range": f"bytes {first}-{last}/{file_size}"
+                }
+
+                outcome = self._put_chunk(upload_url, headers, body, index, total_chunk_count)
+                if outcome != "acked":
+                    # A rejected chunk (expired URL, bad range) cannot be resumed; start over next time.
+                    if outcome == "rejected" and state_key:
+                        self._save_upload_state(state_key, None)
+                    return None
+                if state_key:
+                    self._save_upload_state(state_key, {"acked": index + 1})
+                if progress:
+                    progress(last + 1, file_size)
+
+        if state_key:
+            self._save_upload_state(state_key, None)
+        print(f"[SYSTEM_ECHO]: Transmission complete for {publish_id}.")
+        return publish_id
+
+    def _put_chunk(self, upload_url, headers, body, index, total_chunk_count):
+        """
+        PUT one chunk, retrying network errors, 429 and 5xx.
+        Returns "acked", "rejected" (other 4xx) or "exhausted" (retries spent).
+        """
+        for attempt in range(CHUNK_RETRIES + 1):
+            try:
+                response = self.session.put(upload_url, headers=headers, data=body)
+                if response.status_code in [200, 201, 206]:
+                    return "acked"
+                if response.status_code != 429 and response.status_code < 500:
+                    print(f"[SYSTEM_DISSONANCE]: Streaming failed on chunk {index + 1}/{total_chunk_count}. "
+                          f"Code: {response.status_code} - {response.text}")
+                    return "rejected"
+                reason = f"HTTP {response.status_code}"
+            except requests.RequestException as e:
+                reason = str(e)
+            if attempt < CHUNK_RETRIES:
+                delay = 2 ** attempt
+                print(f"[SYSTEM_LOG]: Chunk {index + 1}/{total_chunk_count} failed ({reason}); retry in {delay}s")
+                time.sleep(delay)
+        print(f"[SYSTEM_DISSONANCE]: Chunk {index + 1}/{total_chunk_count} abandoned after {CHUNK_RETRIES + 1} attempts.")
+        return "exhausted"
+
+    # ── RESUME STATE ────────────────────────────────────────────
+
+    def _load_upload_state(self):
         try:
-            with open(file_path, 'rb') as f:
-                response = requests.put(upload_url, headers=headers, data=f)
-                
-            if response.status_code in [200, 201]:
-                print(f"[SYSTEM_ECHO]: Transmission complete for {publish_id}.")
-                return publish_id
-            else:
-                print(f"[SYSTEM_DISSONANCE]: Streaming failed. Code: {response.status_code} - {response.text}")
-                return None
-        except Exception as e:
-            print(f"[SYSTEM_DISSONANCE]: Critical error during streaming: {e}")
-            return None
+            return json.loads(UPLOAD_STATE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_upload_state(self, key, update):
+        """Merge update into the record for key (None drops it); expired records are pruned."""
+        state = self._load_upload_state()
+        if update is None:
+            state.pop(key, None)
+        else:
+            state[key] = {**state.get(key, {}), **update}
+        now = time.time()
+        state = {k: v for k, v in state.items() if now - v.get("created", now) < UPLOAD_URL_TTL}
+        UPLOAD_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = UPLOAD_STATE_PATH.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state, indent=1), encoding="utf-8")
+        tmp.replace(UPLOAD_STATE_PATH)
 
 def main():
     conduit = TikTokConduit()
@@ -106,40 +106,42 @@ def classify_feedback_basic(body: str) -> Dict[str, bool]:
     }
 
 
+def _fetch_article_meta(conduit: ShopifyConduit, article_id: int) -> Dict[str, Any]:
+    article = conduit.get_article(STATUS_UNVERIFIED_BLOG_ID, article_id)
+    return {
+        "title": article.get("title", ""),
+        "product_id": extract_product_id_from_title(article.get("title", "")),
+        "image_url": (article.get("image") or {}).get("src"),
+        "body_excerpt": article.get("body_html", "")[:500],
+    }
+
+
 def fetch_all_feedback(conduit: ShopifyConduit) -> List[Dict]:
     """
-    Fetch all comments from STATUS: UNVERIFIED blog,
-    enriched with article metadata.
+    Fetch all comments from STATUS: UNVERIFIED blog (every page),
+    enriched with article metadata fetched concurrently per article.
     """
     print("[SIGNAL_RECOVERY]: Fetching feedback from STATUS: UNVERIFIED blog...")
     
-    comments = conduit.list_comments(
+    comments = conduit.list_all_comments(
         blog_id=STATUS_UNVERIFIED_BLOG_ID,
         status="published",
-        limit=250,
     )
     
-    # Group comments by article
+    # Resolve each distinct article once, fanned out across the shared bucket
+    article_ids = sorted({c.get("article_id") for c in comments if c.get("article_id")})
     article_cache = {}
+    for article_id, meta in conduit.fan_out(lambda aid: _fetch_article_meta(conduit, aid), article_ids):
+        if isinstance(meta, Exception):
+            print(f"[SYSTEM_WARNING]: Failed to fetch article {article_id}: {meta}")
+            meta = None
+        article_cache[article_id] = meta
+    
     enriched_comments = []
     
     for comment in comments:
         article_id = comment.get("article_id")
         
-        # Fetch article metadata if not cached
-        if article_id and article_id not in article_cache:
-            try:
-                article = conduit.get_article(STATUS_UNVERIFIED_BLOG_ID, article_id)
-                article_cache[article_id] = {
-                    "title": article.get("title", ""),
-                    "product_id": extract_product_id_from_title(article.get("title", "")),
-                    "image_url": article.get("image", {}).get("src"),
-                    "body_excerpt": article.get("body_html", "")[:500],
-                }
-            except Exception as e:
-                print(f"[SYSTEM_WARNING]: Failed to fetch article {article_id}: {e}")
-                article_cache[article_id] = None
-        
         article_meta = article_cache.get(article_id, {}) or {}
         
         # Basic classification
@@ -421,13 +423,11 @@ def check_for_new_comments(conduit: ShopifyConduit) -> Tuple[bool, int, int]:
     latest_id = comments[0].get("id", 0)
     last_analyzed = get_last_analyzed_comment_id()
     
-    # Also get total count for reporting
-    all_comments = conduit.list_comments(
+    # Also get total count for reporting (count endpoint — no page ceiling)
+    total_count = conduit.count_comments(
         blog_id=STATUS_UNVERIFIED_BLOG_ID,
         status="published",
-        limit=250,
     )
-    total_count = len(all_comments)
     
     if last_analyzed is None:
         # First run - consider as "new"
@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 """
-/* [FILE_ID]: backfill_blog_footer // VERSION: 1.1 // STATUS: STABLE */
+/* [FILE_ID]: backfill_blog_footer // VERSION: 1.2 // STATUS: STABLE */
 Backfill the blog footer onto all existing articles in the
 STATUS: UNVERIFIED blog that don't already contain it.
 
+Every article is streamed (not just the first 250), new bodies are computed
+locally, unchanged bodies are skipped by normalized hash, and updates run
+concurrently under the conduit's rate limiter. Progress is journaled so an
+interrupted rollout resumes where it stopped.
+
 Usage:
     python3 scripts/backfill_blog_footer.py          # append only to articles missing the footer
     python3 scripts/backfill_blog_footer.py --force   # strip old footer and re-apply current version
+    python3 scripts/backfill_blog_footer.py --strip-only --dry-run
 """
 
 import argparse
@@ -21,6 +27,7 @@ _spec = importlib.util.spec_from_file_location("shopify_skill", _skill_path)
 _shopify_module = importlib.util.module_from_spec(_spec)
 _spec.loader.exec_module(_shopify_module)
 ShopifyConduit = _shopify_module.ShopifyConduit
+body_hash = _shopify_module.body_hash
 
 BLOG_TITLE = "[STATUS: UNVERIFIED]"
 FOOTER_PATH = os.path.join(os.path.dirname(__file__), "..", "artifacts", "templates", "blog_footer.html")
@@ -34,91 +41,61 @@ def main():
     parser = argparse.ArgumentParser(description="Backfill blog footer on STATUS: UNVERIFIED articles")
     parser.add_argument("--force", action="store_true", help="Replace existing footer with current version")
     parser.add_argument("--strip-only", action="store_true", help="Remove footer from all articles without re-adding")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent article updates (default: 4)")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
     args = parser.parse_args()
 
-    conduit = ShopifyConduit()
-    blogs = conduit.list_blogs()
-    blog_id = None
-    for b in blogs:
-        if b.get("title", "").strip() == BLOG_TITLE:
-            blog_id = b["id"]
-            break
+    footer_html = None
+    if not args.strip_only:
+        footer_path = os.path.normpath(FOOTER_PATH)
+        if not os.path.exists(footer_path):
+            print(f"!! FOOTER_NOT_FOUND: {footer_path}")
+            sys.exit(1)
+        with open(footer_path, "r") as f:
+            footer_html = f.read()
 
-    if not blog_id:
+    conduit = ShopifyConduit()
+    blog = conduit.find_blog(BLOG_TITLE)
+    if not blog:
         print(f"!! BLOG_NOT_FOUND: '{BLOG_TITLE}'")
         sys.exit(1)
-
+    blog_id = blog["id"]
     print(f"// TARGET_BLOG: {BLOG_TITLE} (ID {blog_id})")
 
     if args.strip_only:
         print("// MODE: STRIP_ONLY — removing footers from all articles")
-        articles = conduit.list_articles(blog_id, limit=250)
-        print(f"// ARTICLES_FOUND: {len(articles)}")
-        stripped = 0
-        for article in articles:
-            aid = article["id"]
-            title = article.get("title", "?")
-            body = article.get("body_html", "") or ""
-            if FOOTER_MARKER in body:
-                new_body = FOOTER_STRIP_RE.sub("", body)
-                conduit.update_article(blog_id, aid, {"body_html": new_body})
-                print(f"   [STRIPPED] {aid} — '{title}'")
-                stripped += 1
-            else:
-                print(f"   [SKIP] {aid} — '{title}' (no footer)")
-        print(f"\n// STRIP_COMPLETE: {stripped} articles updated")
-        return
-
-    footer_path = os.path.normpath(FOOTER_PATH)
-    if not os.path.exists(footer_path):
-        print(f"!! FOOTER_NOT_FOUND: {footer_path}")
-        sys.exit(1)
-
-    with open(footer_path, "r") as f:
-        footer_html = f.read()
-
-    conduit = ShopifyConduit()
-    blogs = conduit.list_blogs()
-    blog_id = None
-    for b in blogs:
-        if b.get("title", "").strip() == BLOG_TITLE:
-            blog_id = b["id"]
-            break
-
-    if not blog_id:
-        print(f"!! BLOG_NOT_FOUND: '{BLOG_TITLE}'")
-        sys.exit(1)
-
-    print(f"// TARGET_BLOG: {BLOG_TITLE} (ID {blog_id})")
-    if args.force:
+        mode = "strip"
+    elif args.force:
         print("// MODE: FORCE — replacing existing footers with current template")
-    articles = conduit.list_articles(blog_id, limit=250)
-    print(f"// ARTICLES_FOUND: {len(articles)}")
+        mode = "force"
+    else:
+        mode = "append"
 
-    updated = 0
-    skipped = 0
-    for article in articles:
-        aid = article["id"]
-        title = article.get("title", "?")
+    def transform(article):
         body = article.get("body_html", "") or ""
-
         has_footer = FOOTER_MARKER in body
-
-        if has_footer and not args.force:
-            print(f"   [SKIP] {aid} — '{title}' (footer already present)")
-            skipped += 1
-            continue
-
+        if mode == "strip":
+            return FOOTER_STRIP_RE.sub("", body) if has_footer else None
+        if has_footer and mode == "append":
+            return None
         if has_footer:
-            # Strip old footer before re-applying
+            # Strip old footer before re-applying; an identical footer hashes unchanged and is skipped
             body = FOOTER_STRIP_RE.sub("", body)
-
-        new_body = body + footer_html
-        conduit.update_article(blog_id, aid, {"body_html": new_body})
-        print(f"   [UPDATED] {aid} — '{title}'")
-        updated += 1
-
-    print(f"\n// BACKFILL_COMPLETE: {updated} updated, {skipped} skipped")
+        return body + footer_html
+
+    # The journal is keyed by mode and footer version, so a changed template starts a fresh run
+    footer_tag = body_hash(footer_html)[:12] if footer_html else "none"
+    counts = conduit.rewrite_articles(
+        blog_id, transform,
+        journal=f"blog_footer_{blog_id}_{mode}_{footer_tag}",
+        max_workers=args.workers,
+        dry_run=args.dry_run,
+    )
+    print(f"\n// BACKFILL_COMPLETE: {counts['updated']} updated, "
+          f"{counts['skipped'] + counts['unchanged']} skipped, {counts['resumed']} already applied, "
+          f"{counts['failed']} failed ({counts['scanned']} scanned)")
+    if counts["failed"]:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-# [FILE_ID]: scripts/BACKFILL_BLOG_POSTS // VERSION: 1.0 // STATUS: STABLE
+# [FILE_ID]: scripts/BACKFILL_BLOG_POSTS // VERSION: 1.1 // STATUS: STABLE
 # [SYSTEM_LOG]: AUDIT_AND_BACKFILL_MISSING_BLOG_POSTS
 
 """
@@ -17,6 +17,16 @@ Usage:
 
     # Skip lifestyle generation (use Printify mockup instead)
     python scripts/backfill_blog_posts.py --skip-lifestyle
+
+    # Backfill more products at once
+    python scripts/backfill_blog_posts.py --workers 5
+
+    # Non-urgent: all lifestyle images as one Nanobanana batch job
+    python scripts/backfill_blog_posts.py --batch
+
+The product -> article links come from ArticleLinkIndex
+(artifacts/.shopify_article_links.json), refreshed with an updated_at delta,
+so the audit is a set difference rather than a regex scan of every article.
 """
 
 import sys
@@ -25,10 +35,9 @@ import argparse
 import json
 import time
 import requests
-import io
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from PIL import Image
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
@@ -36,8 +45,11 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from agents.skills.fabricator.fabricator import Fabricator
+from agents.skills.gemini_skill.image_context import prepare_reference
 from agents.skills.shopify_skill.shopify_skill import ShopifyConduit
+from agents.skills.shopify_skill.article_index import ArticleLinkIndex
 from agents.skills.nanobanana_skill.nanobanana_skill import generate_nano_banana_image
+from agents.skills.nanobanana_skill.batch import ImageBatch
 
 
 def _ts() -> str:
@@ -95,18 +107,17 @@ def parse_printify_timestamp(ts_str: str) -> datetime:
         return datetime.strptime(clean, "%Y-%m-%d %H:%M:%S")
 
 
-def synthesize_lifestyle_for_product(product: dict, theme: str = "Industrial Noir") -> tuple:
+def lifestyle_request(product: dict, theme: str = "Industrial Noir"):
     """
-    Synthesizes a lifestyle image for a product.
-    Returns (local_path, cdn_url) or (None, None) on failure.
+    (prompt, prepared mockup context) for a product's lifestyle image,
+    or None when the product has no usable mockup.
     """
     product_id = product.get('id')
-    product_title = product.get('title', 'Unknown')
     images = product.get('images', [])
     
     if not images:
         _log(f"⚠️ No images for product {product_id}")
-        return None, None
+        return None
     
     # Get mockup URL
     mockup_url = images[0].get('src')
@@ -115,16 +126,12 @@ def synthesize_lifestyle_for_product(product: dict, theme: str = "Industrial Noi
             mockup_url = img.get('src')
             break
     
-    _log(f"// Synthesizing lifestyle for: {product_title}")
-    
     # Fetch mockup image
     try:
-        resp = requests.get(mockup_url)
-        resp.raise_for_status()
-        image_context = Image.open(io.BytesIO(resp.content))
+        image_context = prepare_reference(mockup_url)
     except Exception as e:
         _log(f"⚠️ Failed to fetch mockup: {e}")
-        return None, None
+        return None
     
     # Build prompt
     prompt = (
@@ -136,17 +143,11 @@ def synthesize_lifestyle_for_product(product: dict, theme: str = "Industrial Noi
         f"high-contrast shadows, clinical warehouse lighting. "
         f"The shot should be a medium close-up, focusing on the quality and design of the product specimen."
     )
-    
-    # Generate
-    lifestyle_path = generate_nano_banana_image(
-        prompt,
-        graphic_type_override="mockups",
-        image_context=image_context
-    )
-    
-    if not lifestyle_path:
-        return None, None
-    
+    return prompt, image_context
+
+
+def finish_lifestyle(product_id: str, lifestyle_path: str) -> tuple:
+    """Stamp, upload to the Printify CDN and tag the run folder. Returns (local_path, cdn_url)."""
     # Apply stamp
     try:
         from scripts.fabricate_specimen_v2 import apply_unverified_stamp
@@ -171,11 +172,53 @@ def synthesize_lifestyle_for_product(product: dict, theme: str = "Industrial Noi
     return lifestyle_path, cdn_url
 
 
+def synthesize_lifestyle_for_product(product: dict, theme: str = "Industrial Noir") -> tuple:
+    """
+    Synthesizes a lifestyle image for a product.
+    Returns (local_path, cdn_url) or (None, None) on failure.
+    """
+    _log(f"// Synthesizing lifestyle for: {product.get('title', 'Unknown')}")
+    request = lifestyle_request(product, theme)
+    if not request:
+        return None, None
+    prompt, image_context = request
+    
+    # Generate
+    lifestyle_path = generate_nano_banana_image(
+        prompt,
+        graphic_type_override="mockups",
+        image_context=image_context
+    )
+    
+    if not lifestyle_path:
+        return None, None
+    return finish_lifestyle(product.get('id'), lifestyle_path)
+
+
+def synthesize_lifestyle_batch(products: list, theme: str = "Industrial Noir") -> dict:
+    """
+    Lifestyle images for many products as one Nanobanana batch job. Blocks
+    until the batch settles. Returns {product_id: local image path}.
+    """
+    batch = ImageBatch("lifestyle-backfill")
+    for product in products:
+        request = lifestyle_request(product, theme)
+        if request:
+            prompt, image_context = request
+            batch.add(prompt, graphic_type_override="mockups", image_context=image_context, key=product['id'])
+    if not batch.jobs:
+        return {}
+    batch.submit()
+    return {pid: path for pid, path in batch.collect(wait=True).items() if path}
+
+
 def main():
     parser = argparse.ArgumentParser(description="Backfill missing blog posts for Printify products")
     parser.add_argument("--since", type=str, help="Cutoff datetime (default: 5am today)")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be created without creating")
     parser.add_argument("--skip-lifestyle", action="store_true", help="Skip lifestyle generation, use Printify mockup")
+    parser.add_argument("--workers", type=int, default=3, help="Products backfilled concurrently (default: 3)")
+    parser.add_argument("--batch", action="store_true", help="Synthesize all lifestyle images as one Nanobanana batch job (slower to return, cheaper per image)")
     args = parser.parse_args()
     
     # Determine cutoff time
@@ -218,110 +261,111 @@ def main():
         _log("[SYSTEM_LOG]: No recent products found. Nothing to backfill.")
         return 0
     
-    # 2. Get blog posts from STATUS: UNVERIFIED
-    _log("// Fetching Shopify blog articles...")
-    blogs = shopify.list_blogs()
-    blog_id = None
-    for b in blogs:
-        if b.get('title', '').strip() == '[STATUS: UNVERIFIED]':
-            blog_id = b['id']
-            break
-    
+    # 2. Resolve the STATUS: UNVERIFIED blog and its product link index
+    _log("// Refreshing Shopify article index...")
+    blog = shopify.find_blog('[STATUS: UNVERIFIED]')
+    blog_id = blog['id'] if blog else None
+
     if not blog_id:
         _log("⚠️ [STATUS: UNVERIFIED] blog not found. Will create it.")
         if not args.dry_run:
-            result = shopify._post('blogs.json', {'blog': {'title': '[STATUS: UNVERIFIED]'}})
-            blog_id = result.get('blog', {}).get('id')
+            blog_id = shopify.get_or_create_blog('[STATUS: UNVERIFIED]').get('id')
             _log(f"// Created blog ID: {blog_id}")
-    
-    # Get all articles
-    articles = shopify.list_articles(blog_id, limit=250) if blog_id else []
-    
-    # Extract product IDs from article titles (format: "... | <product_id>" or direct product titles)
-    article_product_ids = set()
-    for art in articles:
-        title = art.get('title', '')
-        # Check if title contains a product ID (24-char hex)
-        import re
-        matches = re.findall(r'[0-9a-f]{24}', title.lower())
-        article_product_ids.update(matches)
-        # Also check body for product links
-        body = art.get('body_html', '') or ''
-        matches = re.findall(r'products/([0-9a-f]{24})', body.lower())
-        article_product_ids.update(matches)
-    
-    _log(f"// Products with blog posts: {len(article_product_ids)}")
-    
-    # 3. Find products missing blog posts
-    missing = []
-    for p in recent_products:
-        pid = p.get('id', '').lower()
-        if pid not in article_product_ids:
-            missing.append(p)
-    
+
+    index = ArticleLinkIndex.shared(shopify, blog_id) if blog_id else None
+    linked = index.linked_product_ids() if index else set()
+    _log(f"// Products with blog posts: {len(linked)}")
+
+    # 3. Find products missing blog posts (local set difference)
+    missing = [p for p in recent_products if p.get('id', '').lower() not in linked]
+
     _log(f"// Products MISSING blog posts: {len(missing)}")
-    
+
     if not missing:
         _log("[SYSTEM_LOG]: All recent products have blog posts. Nothing to backfill.")
         return 0
-    
+
     # 4. Display and optionally backfill
     _log("\n--- MISSING BLOG POSTS ---")
     for p in missing:
         _log(f"  [{p.get('id')}] {p.get('title')} (created: {p.get('created_at')})")
-    
+
     if args.dry_run:
         _log("\n[DRY_RUN]: Would create blog posts for the above products.")
         return 0
-    
-    # 5. Backfill each missing product
-    _log("\n--- BACKFILLING ---")
-    created = 0
-    failed = 0
-    
-    for p in missing:
+
+    # 5. Backfill missing products concurrently (synthesis, upload and article per worker)
+    batched = {}
+    if args.batch and not args.skip_lifestyle:
+        _log(f"// Submitting {len(missing)} lifestyle synthesis job(s) as one batch...")
+        full_products = []
+        for p in missing:
+            try:
+                full_products.append(fab.get_product(p.get('id')))
+            except Exception as e:
+                _log(f"⚠️ Failed to fetch {p.get('id')}: {e}")
+        batched = synthesize_lifestyle_batch(full_products)
+
+    _log(f"\n--- BACKFILLING ({args.workers} worker(s)) ---")
+
+    def backfill_one(p: dict) -> None:
         product_id = p.get('id')
         product_title = p.get('title', f'UNVERIFIED SPECIMEN: {product_id}')
         description = p.get('description', '')
-        
-        _log(f"\n// Processing: {product_title}")
-        
+
+        _log(f"// Processing: {product_title}")
+
         image_url = None
-        
-        if not args.skip_lifestyle:
+
+        if args.batch and not args.skip_lifestyle:
+            if product_id in batched:
+                try:
+                    _, image_url = finish_lifestyle(product_id, batched[product_id])
+                except Exception as e:
+                    _log(f"⚠️ Lifestyle upload failed for {product_id}: {e}")
+            if not image_url:
+                _log(f"// Using Printify mockup as fallback for {product_id}...")
+        elif not args.skip_lifestyle:
             # Fetch full product details (for images)
             try:
                 full_product = fab.get_product(product_id)
                 _, cdn_url = synthesize_lifestyle_for_product(full_product)
                 image_url = cdn_url
             except Exception as e:
-                _log(f"⚠️ Lifestyle synthesis failed: {e}")
-        
-        if not image_url and not args.skip_lifestyle:
-            _log("// Using Printify mockup as fallback...")
-        
+                _log(f"⚠️ Lifestyle synthesis failed for {product_id}: {e}")
+
+            if not image_url:
+                _log(f"// Using Printify mockup as fallback for {product_id}...")
+
         # Fallback to Printify mockup
         if not image_url:
             images = p.get('images', [])
             if images:
                 image_url = images[0].get('src')
-        
-        # Create blog post
-        try:
-            shopify.create_article(
-                blog_id=blog_id,
-                title=product_title,
-                body_html=f"<p>{description}</p>" if description else "",
-                image_url=image_url,
-                author="CBG Studio",
-                published=True,
-            )
-            _log(f"✅ Blog post created for {product_id}")
-            created += 1
-        except Exception as e:
-            _log(f"❌ Failed to create blog post: {e}")
-            failed += 1
-    
+
+        article = shopify.create_article(
+            blog_id=blog_id,
+            title=product_title,
+            body_html=f"<p>{description}</p>" if description else "",
+            image_url=image_url,
+            author="CBG Studio",
+            published=True,
+        )
+        index.record(article, product_id)
+        _log(f"✅ Blog post created for {product_id}")
+
+    created = 0
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = {pool.submit(backfill_one, p): p for p in missing}
+        for future in as_completed(futures):
+            try:
+                future.result()
+                created += 1
+            except Exception as e:
+                _log(f"❌ Failed to create blog post for {futures[future].get('id')}: {e}")
+                failed += 1
+
     # Summary
     _log(f"\n{'=' * 60}")
     _log(f"[SUMMARY] Created: {created} | Failed: {failed}")
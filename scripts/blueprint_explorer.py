@@ -11,6 +11,9 @@ Usage:
     # Inspect a specific blueprint
     python3 scripts/blueprint_explorer.py --inspect 281
 
+    # Refresh the local catalog mirror for every AOP blueprint
+    python3 scripts/blueprint_explorer.py --sync-catalog
+
     # Create a template from blueprint
     python3 scripts/blueprint_explorer.py --create 281 --tile path/to/tile.png --texture path/to/texture.png --logo path/to/logo.png
 """
@@ -20,6 +23,7 @@ import os
 import json
 import argparse
 import requests
+from datetime import timedelta
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -27,6 +31,11 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from dotenv import load_dotenv
 load_dotenv()
 
+from agents.skills.fabricator.fabricator import Fabricator
+from agents.skills.fabricator.product_index import ProductIndex
+from agents.skills.fabricator.catalog_mirror import CatalogMirror, DEFAULT_POSITIONS
+from agents.skills.fabricator.printify_limiter import PrintifySession
+
 
 class BlueprintExplorer:
     BASE_URL = "https://api.printify.com/v1"
@@ -42,93 +51,49 @@ class BlueprintExplorer:
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json"
         }
+        self.session = PrintifySession()
+        self.session.headers.update(self.headers)
+        self._fab = None
+        self.product_index = ProductIndex()
+        self.catalog = CatalogMirror.shared(token=self.token)
 
     def list_aop_blueprints(self) -> list:
-        """Lists all AOP blueprints from the Printify catalog."""
-        resp = requests.get(f"{self.BASE_URL}/catalog/blueprints.json", headers=self.headers)
-        resp.raise_for_status()
-        blueprints = resp.json()
-        return [b for b in blueprints if "AOP" in b.get("title", "") or "All Over" in b.get("title", "")]
+        """Lists all AOP blueprints from the Printify catalog (via the local mirror)."""
+        return self.catalog.aop_blueprints()
+
+    @property
+    def fab(self) -> Fabricator:
+        """Pooled Printify client for shop listings (created on first use)."""
+        if self._fab is None:
+            self._fab = Fabricator(shop_id=self.shop_id)
+        return self._fab
 
-    def get_used_blueprint_ids(self) -> set:
+    def get_used_blueprint_ids(self, max_age: timedelta = timedelta(0)) -> set:
         """
         Returns set of blueprint IDs already in use in the shop.
         Only considers products with [DRAFT] or [TEMPLATE] in the title
-        and excludes deleted products.
-        Paginates through all products to ensure complete coverage.
+        and excludes deleted or hidden products.
+
+        Read from the local ProductIndex: the shop listing is re-pulled
+        (pages in parallel) when older than max_age, and per-product GETs
+        happen only for rows the listing left incomplete and whose
+        updated_at moved since the last check.
         """
-        all_products = []
-        page = 1
-        
-        while True:
-            resp = requests.get(
-                f"{self.BASE_URL}/shops/{self.shop_id}/products.json?page={page}",
-                headers=self.headers
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            products = data.get("data", [])
-            
-            if not products:
-                break
-            
-            all_products.extend(products)
-            
-            current_page = data.get("current_page", page)
-            last_page = data.get("last_page", page)
-            if current_page >= last_page:
-                break
-            
-            page += 1
-        
-        print(f"// SCANNED: {len(all_products)} total products across {page} page(s)")
-        
-        used = set()
-        for p in all_products:
-            title = p.get("title", "")
-            # Only consider [DRAFT] or [TEMPLATE] products
-            if "[DRAFT]" not in title and "[TEMPLATE]" not in title:
-                continue
-            
-            resp2 = requests.get(
-                f"{self.BASE_URL}/shops/{self.shop_id}/products/{p['id']}.json",
-                headers=self.headers
-            )
-            if resp2.status_code == 200:
-                product_data = resp2.json()
-                # Skip deleted products
-                if product_data.get("is_deleted", False):
-                    continue
-                if not product_data.get("visible", True):
-                    continue
-                bp_id = product_data.get("blueprint_id")
-                if bp_id:
-                    used.add(bp_id)
-        return used
+        self.product_index.refresh(self.fab, max_age=max_age)
+        print(f"// SCANNED: {len(self.product_index.products)} total products")
+        return self.product_index.used_blueprint_ids(self.fab)
 
     def get_blueprint(self, blueprint_id: int) -> dict:
         """Gets blueprint details."""
-        resp = requests.get(f"{self.BASE_URL}/catalog/blueprints/{blueprint_id}.json", headers=self.headers)
-        resp.raise_for_status()
-        return resp.json()
+        return self.catalog.blueprint(blueprint_id)
 
     def get_print_providers(self, blueprint_id: int) -> list:
         """Gets available print providers for a blueprint."""
-        resp = requests.get(
-            f"{self.BASE_URL}/catalog/blueprints/{blueprint_id}/print_providers.json",
-            headers=self.headers
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return self.catalog.providers(blueprint_id)
 
     def get_variants(self, blueprint_id: int, provider_id: int) -> list:
         """Gets variants (sizes/colors) for a blueprint+provider combo."""
-        resp = requests.get(
-            f"{self.BASE_URL}/catalog/blueprints/{blueprint_id}/print_providers/{provider_id}/variants.json",
-            headers=self.headers
-        )
-        resp.raise_for_status()
-        return resp.json().get("variants", [])
+        return self.catalog.variants(blueprint_id, provider_id)
 
     def upload_image(self, local_path: str, file_name: str) -> str:
         """Uploads an image to Printify and returns the image ID."""
@@ -137,7 +102,7 @@ class BlueprintExplorer:
             data = base64.b64encode(f.read()).decode("utf-8")
 
         payload = {"file_name": file_name, "contents": data}
-        resp = requests.post(f"{self.BASE_URL}/uploads/images.json", json=payload, headers=self.headers)
+        resp = self.session.post(f"{self.BASE_URL}/uploads/images.json", json=payload)
         resp.raise_for_status()
         return resp.json()["id"]
 
@@ -167,59 +132,24 @@ class BlueprintExplorer:
 
     def get_positions_from_api(self, blueprint_id: int, provider_id: int) -> list:
         """
-        Fetches actual placeholder positions from the Printify API.
-        Extracts unique positions from variant placeholders.
+        Placeholder positions for a blueprint/provider, extracted from the
+        (mirrored) catalog variants. Empty if the catalog has no such combo.
         """
-        resp = requests.get(
-            f"{self.BASE_URL}/catalog/blueprints/{blueprint_id}/print_providers/{provider_id}/variants.json",
-            headers=self.headers
-        )
-        if resp.status_code != 200:
+        try:
+            return self.catalog.positions(blueprint_id, provider_id)
+        except requests.HTTPError:
             return []
-        
-        data = resp.json()
-        variants = data.get("variants", [])
-        
-        # Collect unique positions from all variants
-        positions = set()
-        for v in variants:
-            for ph in v.get("placeholders", []):
-                pos = ph.get("position")
-                if pos:
-                    positions.add(pos)
-        
-        return list(positions)
 
     def get_known_positions(self, blueprint_id: int) -> list:
         """
-        Returns known placeholder positions for common AOP blueprints.
-        This is based on examination of existing products.
+        Placeholder positions for a blueprint, generated from the catalog
+        mirror (first print provider). Falls back to front/back/all when the
+        catalog cannot answer.
         """
-        positions = {
-            256: ["front", "back", "all", "waistband"],  # Women's Leggings
-            276: ["front", "back", "all"],  # Women's Racerback Dress
-            279: ["front", "back", "all", "right_sleeve", "left_sleeve"],  # Women's Tee
-            281: ["front", "back", "all", "right_sleeve", "left_sleeve", "Collar"],  # Unisex Tee
-            285: ["front", "back", "all", "waistband"],  # Pencil Skirt
-            286: ["front", "back", "all", "waistband"],  # Skater Skirt
-            349: ["front", "back", "all"],  # Bikini
-            350: ["front", "back", "all"],  # One-piece Swimsuit
-            406: ["front", "back", "all", "waistband"],  # Men's Boxer
-            407: ["front", "back", "all", "waistband"],  # Women's Briefs
-            431: ["front", "back", "all"],  # T-Shirt Dress
-            433: ["front", "back", "all", "right_sleeve", "left_sleeve"],  # Bomber Jacket
-            449: ["front", "back", "all", "right_sleeve", "left_sleeve"],  # Sweatshirt
-            450: ["front", "back", "all", "pocket", "waistband", "right_sleeve", "left_sleeve",
-                  "right_cuff_panel", "left_cuff_panel", "right_hood", "left_hood"],  # Pullover Hoodie
-            451: ["front_left", "front_right", "back", "all", "pocket_left", "pocket_right",
-                  "waistband", "right_sleeve", "left_sleeve", "right_cuff_panel",
-                  "left_cuff_panel", "right_hood", "left_hood"],  # Zip Hoodie
-            516: ["left_leg", "right_leg", "all", "front_waistband", "back_waistband", "gusset"],  # Yoga Leggings
-            591: ["left_leg", "right_leg", "pocket", "waistband"],  # Athletic Joggers
-            700: ["front", "back", "all"],  # Sports Bra
-            925: ["front_left_leg", "front_right_leg", "back_left_leg", "back_right_leg", "waistband"],  # Relaxed Shorts
-        }
-        return positions.get(blueprint_id, ["front", "back", "all"])
+        try:
+            return self.catalog.positions(blueprint_id) or list(DEFAULT_POSITIONS)
+        except requests.HTTPError:
+            return list(DEFAULT_POSITIONS)
 
     def create_template(
         self,
@@ -230,6 +160,9 @@ class BlueprintExplorer:
         provider_id: int = None,  # Auto-detect if not specified
         price_cents: int = 4500,
         tile_scale: float = 1.0,
+        tile_id: str = None,
+        texture_id: str = None,
+        logo_id: str = None,
     ) -> dict:
         """
         Creates a new [DRAFT] product from a blueprint.
@@ -241,6 +174,8 @@ class BlueprintExplorer:
             logo_path: Path to logo image
             provider_id: Print provider ID (auto-detected if not specified)
             price_cents: Price in cents (default: $45.00)
+            tile_id / texture_id / logo_id: Already-uploaded Printify image ids
+                (e.g. from an UploadPool); the matching *_path is then not re-uploaded
         """
         bp = self.get_blueprint(blueprint_id)
         
@@ -264,20 +199,16 @@ class BlueprintExplorer:
         print(f"[SYSTEM_LOG]: Provider ID: {provider_id}, Variants: {len(variants)}")
         print(f"[SYSTEM_LOG]: Available positions: {positions}")
 
-        # Upload images
-        tile_id = None
-        texture_id = None
-        logo_id = None
-
-        if tile_path and Path(tile_path).exists():
+        # Upload images (unless pre-uploaded)
+        if not tile_id and tile_path and Path(tile_path).exists():
             print(f"// UPLOADING_TILE: {tile_path}")
             tile_id = self.upload_image(tile_path, f"template_tile_{blueprint_id}.png")
 
-        if texture_path and Path(texture_path).exists():
+        if not texture_id and texture_path and Path(texture_path).exists():
             print(f"// UPLOADING_TEXTURE: {texture_path}")
             texture_id = self.upload_image(texture_path, f"template_texture_{blueprint_id}.png")
 
-        if logo_path and Path(logo_path).exists():
+        if not logo_id and logo_path and Path(logo_path).exists():
             print(f"// UPLOADING_LOGO: {logo_path}")
             logo_id = self.upload_image(logo_path, f"template_logo_{blueprint_id}.png")
 
@@ -351,10 +282,9 @@ class BlueprintExplorer:
 
         print(f"// CREATING_PRODUCT with {len(placeholders)} placeholders...")
 
-        resp = requests.post(
+        resp = self.session.post(
             f"{self.BASE_URL}/shops/{self.shop_id}/products.json",
-            json=payload,
-            headers=self.headers
+            json=payload
         )
 
         if resp.status_code != 200:
@@ -362,6 +292,7 @@ class BlueprintExplorer:
             resp.raise_for_status()
 
         product = resp.json()
+        self.product_index.upsert(product)
         print(f"--- [TEMPLATE_CREATED]: {product['id']} ---")
         print(f"Title: {product['title']}")
         print(f"Conduit: https://printify.com/app/store/{self.shop_id}/products/{product['id']}")
@@ -374,6 +305,7 @@ def main():
     parser.add_argument("--list", action="store_true", help="List all AOP blueprints")
     parser.add_argument("--unused", action="store_true", help="List only UNUSED AOP blueprints")
     parser.add_argument("--inspect", type=int, help="Inspect a specific blueprint ID")
+    parser.add_argument("--sync-catalog", action="store_true", help="Refresh the local catalog mirror for all AOP blueprints")
     parser.add_argument("--create", type=int, help="Create template from blueprint ID")
     parser.add_argument("--tile", type=str, help="Path to tile image for template creation")
     parser.add_argument("--texture", type=str, help="Path to texture image for template creation")
@@ -386,6 +318,10 @@ def main():
 
     explorer = BlueprintExplorer()
 
+    if args.sync_catalog:
+        explorer.catalog.warm(force=True)
+        return
+
     if args.list:
         blueprints = explorer.list_aop_blueprints()
         print(f"Found {len(blueprints)} AOP blueprints:\n")
@@ -1,15 +1,19 @@
 import json
 import os
 import requests
+import sys
 import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agents.skills.fabricator.catalog_mirror import CatalogMirror
 
 def get_blueprint_info(blueprint_id, headers):
-    url = f"https://api.printify.com/v1/catalog/blueprints/{blueprint_id}.json"
+    token = headers.get("Authorization", "").replace("Bearer ", "") or None
     try:
-        res = requests.get(url, headers=headers)
-        if res.status_code == 200:
-            data = res.json()
-            return data.get('title', f"Blueprint {blueprint_id}"), data.get('description', '')
+        data = CatalogMirror.shared(token=token).blueprint(blueprint_id)
+        return data.get('title', f"Blueprint {blueprint_id}"), data.get('description', '')
     except Exception as e:
         print(f"Error fetching blueprint {blueprint_id}: {e}")
     return f"Blueprint {blueprint_id}", ""
@@ -16,14 +16,14 @@ import os
 import time
 import json
 import requests
-import io
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from PIL import Image
 from dotenv import load_dotenv
 from agents.skills.fabricator.fabricator import Fabricator
+from agents.skills.gemini_skill.image_context import prepare_reference
+from agents.skills.fabricator.stamp_compositor import composite_stamp
 from agents.skills.nanobanana_skill.nanobanana_skill import generate_nano_banana_image
 
 load_dotenv()
@@ -39,18 +39,7 @@ def apply_unverified_stamp(image_path: str) -> str:
         return image_path
 
     try:
-        base_img = Image.open(image_path).convert("RGBA")
-        stamp = Image.open(str(STAMP_PATH)).convert("RGBA")
-
-        stamp_size = max(int(base_img.width * 0.12), 48)
-        stamp = stamp.resize((stamp_size, stamp_size), Image.LANCZOS)
-
-        padding = int(base_img.width * 0.03)
-        x = base_img.width - stamp_size - padding
-        y = base_img.height - stamp_size - padding
-
-        base_img.paste(stamp, (x, y), stamp)
-        base_img.save(image_path)
+        x, y, _ = composite_stamp(image_path, STAMP_PATH)
         print(f"// STAMP_APPLIED: STATUS: UNVERIFIED @ ({x}, {y})")
         return image_path
     except Exception as e:
@@ -64,9 +53,7 @@ def synthesize_lifestyle_mockup(product_title: str, mockup_url: str) -> str:
 
     image_context = None
     try:
-        resp = requests.get(mockup_url)
-        resp.raise_for_status()
-        image_context = Image.open(io.BytesIO(resp.content))
+        image_context = prepare_reference(mockup_url)
         print(f"✅ [SYSTEM_LOG]: Mockup context secured.")
     except Exception as e:
         print(f"⚠️ [SYSTEM_WARNING]: Failed to fetch mockup: {e}")
@@ -2,6 +2,7 @@
 # [SYSTEM_LOG]: AGILE_NANOBANANA_FABRICATION_PROTOCOL_V2 // REMIX_PROTOCOL_ONLINE
 # [SYSTEM_LOG]: EQUAL_WEIGHT_LORE_SELECTION — USAGE_TRACKER_ENABLED
 # [SYSTEM_LOG]: SHOPIFY_PUBLISH_INTEGRATED — BLOG_STEP_REMOVED
+# [SYSTEM_LOG]: SPECULATIVE_ASSET_POOL — TILES_TEXTURES_CLAIMED_BEFORE_SYNTHESIS
 
 import sys
 import os
@@ -9,11 +10,8 @@ import argparse
 import random
 import re
 import time
-import requests
-import io
 import json
 from pathlib import Path
-from PIL import Image
 from dotenv import load_dotenv
 
 # Add project root to path
@@ -22,7 +20,11 @@ sys.path.append(str(Path(__file__).parent.parent))
 from google import genai
 from google.genai import types
 from agents.skills.nanobanana_skill.nanobanana_skill import generate_nano_banana_image
+from agents.skills.nanobanana_skill import asset_pool
 from agents.skills.fabricator.fabricator import Fabricator
+from agents.skills.gemini_skill.image_context import prepare_reference
+from agents.skills.fabricator.stamp_compositor import composite_stamp
+from agents.skills.social_outbox import social_outbox
 from scripts.publish_printify_product import (
     set_margin_and_publish,
     wait_for_printify_publish,
@@ -305,6 +307,16 @@ def select_remix_pair(base_override=None, breach_override=None) -> tuple:
     breach_picks = select_least_used(available, count=1, exclude=[base_name])
     breach_name = breach_picks[0]
 
+    # An equally under-used pair whose tiles/textures are already pooled skips synthesis
+    usage = _load_usage()
+    rank = lambda pair: (usage.get(pair[0], 0), usage.get(pair[1], 0))
+    pooled = [p for p in asset_pool.ready_themes()
+              if len(p) == 2 and p[0] != p[1] and set(p) <= set(available)
+              and rank(p) <= rank((base_name, breach_name))]
+    if pooled:
+        base_name, breach_name = min(pooled, key=rank)
+        print(f"[SYSTEM_LOG]: Asset pool holds {base_name} x {breach_name}; taking the pooled pair.")
+
     # Check if this pair happens to match a named combo (for logging only)
     protocol = load_remix_protocol()
     combo_match = next(
@@ -337,21 +349,7 @@ def apply_unverified_stamp(image_path: str, stamp_path: Path | None = None) -> s
         return image_path
 
     try:
-        base_img = Image.open(image_path).convert("RGBA")
-        stamp = Image.open(str(chosen_stamp)).convert("RGBA")
-
-        # Scale stamp to ~12% of image width
-        stamp_size = max(int(base_img.width * 0.12), 48)
-        stamp = stamp.resize((stamp_size, stamp_size), Image.LANCZOS)
-
-        # Position: bottom-right corner with padding
-        padding = int(base_img.width * 0.03)
-        x = base_img.width - stamp_size - padding
-        y = base_img.height - stamp_size - padding
-
-        # Composite
-        base_img.paste(stamp, (x, y), stamp)
-        base_img.save(image_path)
+        x, y, _ = composite_stamp(image_path, chosen_stamp)
         print(f"// STAMP_APPLIED: STATUS: UNVERIFIED using stamp {chosen_stamp.name} @ ({x}, {y})")
         return image_path
     except Exception as e:
@@ -359,219 +357,6 @@ def apply_unverified_stamp(image_path: str, stamp_path: Path | None = None) -> s
         return image_path
 
 
-def publish_to_bluesky(lifestyle_path: str, product_title: str, product_url: str, description_text: str):
-    """
-    Connects to Bluesky and publishes a post with the lifestyle mockup as an embedded link card.
-    Fails gracefully without breaking the main fabrication pipeline.
-    """
-    _log("[SYSTEM_LOG]: Protocol Initiation: BLUESKY_BROADCAST")
-    app_password = os.getenv("BLUESKY_APP_PASSWORD")
-    if not app_password:
-        _log("⚠️ [SYSTEM_WARNING]: BLUESKY_APP_PASSWORD not found in environment. Bypassing broadcast.")
-        return
-
-    try:
-        from atproto import Client, models, client_utils
-        import io
-        client = Client()
-        client.login('cbgstudio.bsky.social', app_password)
-        
-        _log(f"[SYSTEM_LOG]: Logged into Bluesky as cbgstudio.bsky.social. Preparing package ...")
-        
-        # Load, compress or convert image if it exceeds Bluesky's strict 1MB (1,000,000 bytes) limit
-        with open(lifestyle_path, 'rb') as f:
-            image_data = f.read()
-            
-        file_size = len(image_data)
-        if file_size > 950000:
-            _log(f"[SYSTEM_LOG]: Input image size ({file_size} bytes) exceeds Bluesky's 1MB limit. Initiating compression ritual...")
-            img = Image.open(io.BytesIO(image_data))
-            
-            # Convert RGBA to RGB (required for JPEG conversion)
-            if img.mode in ("RGBA", "P"):
-                img = img.convert("RGB")
-            
-            # Scale down if extremely large
-            if img.width > 1200 or img.height > 1200:
-                img.thumbnail((1200, 1200), Image.Resampling.LANCZOS)
-                
-            # Compress dynamically until under 950KB
-            quality = 85
-            while quality > 10:
-                out_buffer = io.BytesIO()
-                img.save(out_buffer, format="JPEG", quality=quality, optimize=True)
-                compressed_bytes = out_buffer.getvalue()
-                if len(compressed_bytes) < 950000:
-                    image_data = compressed_bytes
-                    _log(f"✅ [SYSTEM_LOG]: Compression finalized: {len(image_data)} bytes at JPEG quality {quality}%")
-                    break
-                quality -= 10
-                
-        upload = client.upload_blob(image_data)
-            
-        # Clean title & description
-        title = product_title if product_title else "UNVERIFIED SPECIMEN"
-        clean_desc = description_text.replace("\n", " ").strip()
-        if len(clean_desc) > 200:
-            clean_desc = clean_desc[:197] + "..."
-            
-        # Package link card with the uploaded blob reference
-        link_card = models.AppBskyEmbedExternal.Main(
-            external=models.AppBskyEmbedExternal.External(
-                title=title,
-                description=clean_desc,
-                uri=product_url if product_url else "https://cbg.studio",
-                thumb=upload.blob
-            )
-        )
-        
-        # Analyze content to determine the hashtags to include dynamically using the Gemini API.
-        # Fallback keyword list is maintained in case LLM is unreachable or fails.
-        tags = []
-        try:
-            from agents.skills.gemini_skill.gemini_skill import generate_specimen_data
-            import json
-            
-            _log("[SYSTEM_LOG]: Engaging LLM for dynamic hashtag synthesis ...")
-            llm_prompt = f"""You are a high-fidelity social media hashtag extraction system for a technical apparel line.
-Analyze the following title and description of a garment specimen.
-Extract exactly 2 to 4 highly-relevant, popular, interesting, and highly-searchable hashtags (such as #CentaurusA, #GeomagneticStorm, #Whales, #Defcon, #Goth, #Techwear, #Streetwear) based on real-world topics, cosmic/terrestrial events, organizations, and aesthetic themes explicitly mentioned or strongly featured in the text.
-Do NOT use niche tags unique only to our brand (like #TheLoom, #ChayaBerryGoose, #CBGStudio).
-Only output a valid JSON block containing an array of strings called "tags", formatted as shown, with NO additional chat, commentary, or markdown wrapping:
-{{"tags": ["Tag1", "Tag2"]}}
-
-Garment Specimen Title: {title}
-Garment Specimen Description:
-{description_text}
-"""
-            # Query Gemini
-            response_text = generate_specimen_data("gemini-2.5-flash", llm_prompt)
-            json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-            if json_match:
-                parsed_data = json.loads(json_match.group(0))
-                extracted_tags = parsed_data.get("tags", [])
-                
-                # Filter, clean and format extracted tags to be valid alphanumeric hashtags
-                for raw_tag in extracted_tags:
-                    # Remove # if present, remove non-alphanumeric chars
-                    clean_tag = re.sub(r"[^\w]", "", raw_tag).strip()
-                    if clean_tag and len(clean_tag) >= 3 and len(clean_tag) <= 30:
-                        if clean_tag not in tags:
-                            tags.append(clean_tag)
-                _log(f"✅ [SYSTEM_SUCCESS]: Dynamic hashtags synthesized: {tags}")
-        except Exception as llm_err:
-            _log(f"⚠️ [SYSTEM_WARNING]: Dynamic hashtag synthesis failed: {llm_err}. Reverting to static keyword heuristics.")
-
-        # Local static heuristic mapping as a robust fallback
-        if not tags:
-            combined_content = f"{title} {description_text}".lower()
-            
-            # Map specific interesting topic keywords in description/title to popular, heavily-searched hashtags
-            topic_map = {
-                "floral": ["Floral", "Botanical"],
-                "flower": ["Floral"],
-                "botanical": ["Botanical", "Floral"],
-                "garden": ["MidnightGarden"],
-                "plaid": ["Plaid", "Tartan"],
-                "tartan": ["Tartan", "Plaid"],
-                "fishnet": ["Fishnet", "Mesh"],
-                "mesh": ["Mesh", "Fishnet"],
-                "geometric": ["Geometric"],
-                "grid": ["GridAesthetic", "Minimalist"],
-                "wireframe": ["3DArt", "Minimalist"],
-                "glitch": ["GlitchArt"],
-                "distortion": ["GlitchArt"],
-                "anomaly": ["SciFi"],
-                "brutalist": ["Brutalist"],
-                "brutalism": ["Brutalist"],
-                "skeleton": ["Goth", "Anatomy"],
-                "anatomical": ["Anatomy", "Goth"],
-                "skull": ["Goth"],
-                "cyberpunk": ["Cyberpunk", "SciFi"],
-                "industrial": ["Industrial"],
-                "goth": ["Goth"],
-                "gothic": ["Goth"],
-                "alt": ["AlternativeFashion"],
-                "alternative": ["AlternativeFashion"],
-                "minimalist": ["Minimalism"],
-                "minimalism": ["Minimalism"],
-                "dark": ["DarkAesthetic"],
-                "moody": ["DarkAesthetic"],
-                "midnight": ["DarkAesthetic"],
-                "obsidian": ["AllBlackEverything", "DarkAesthetic"],
-                "black": ["AllBlackEverything"],
-                "red": ["RedAesthetic"],
-                "neon": ["NeonGlow"],
-                "hoodie": ["Streetwear", "Cozy"],
-                "sweatshirt": ["Streetwear", "Cozy"],
-                "cozy": ["Cozy"],
-                "soft": ["Cozy"],
-                "jogger": ["Streetwear", "Activewear"],
-                "legging": ["Streetwear", "Activewear"],
-                "pant": ["Streetwear", "Activewear"],
-                "cargo": ["Streetwear", "CargoPants"],
-                "skirt": ["OOTD", "AlternativeFashion"],
-                "dress": ["OOTD", "AlternativeFashion"],
-                "bag": ["Accessories"],
-                "tote": ["Accessories"],
-                "sports bra": ["Activewear", "Athleisure"],
-                "athletic": ["Activewear", "Athleisure"]
-            }
-
-            for keyword, mapped_tags in topic_map.items():
-                if keyword in combined_content:
-                    for t in mapped_tags:
-                        if t not in tags:
-                            tags.append(t)
-
-        # Deduplicate, keep order
-        seen = set()
-        deduped_tags = []
-        for t in tags:
-            if t not in seen:
-                seen.add(t)
-                deduped_tags.append(t)
-
-        # Fallback default highly-searched/popular hashtags instead of niche brand tags
-        defaults = ["Techwear", "Streetwear", "Cyberpunk", "Fashion", "OOTD"]
-        for d in defaults:
-            if len(deduped_tags) >= 4:
-                break
-            if d not in seen:
-                seen.add(d)
-                deduped_tags.append(d)
-
-        # Keep a maximum of 4 high-signal tags to stay compact and prevent spam look
-        selected_tags = deduped_tags[:4]
-
-        # Assemble the base alert text
-        base_alert = f"[ALERT] A new active intrusion specimen has been extruded into the manifold: {title}"
-
-        # Adjust text length to strictly fit the 300 character limit with the hashtags
-        tags_str = " ".join([f"#{t}" for t in selected_tags])
-        max_base_len = 300 - len(tags_str) - 2 # 2 accounts for \n\n divider
-
-        if len(base_alert) > max_base_len:
-            base_alert = base_alert[:max_base_len - 3] + "..."
-
-        # Construct and publish the post with TextBuilder
-        tb = client_utils.TextBuilder()
-        tb.text(base_alert)
-        tb.text("\n\n")
-        for i, t in enumerate(selected_tags):
-            if i > 0:
-                tb.text(" ")
-            tb.tag(f"#{t}", t)
-            
-        client.send_post(
-            text=tb,
-            embed=link_card
-        )
-        _log(f"✅ [SYSTEM_SUCCESS]: Bluesky broadcast completed successfully for {title}")
-    except Exception as e:
-        _log(f"⚠️ [SYSTEM_WARNING]: Bluesky broadcast failed: {e}")
-
-
 def generate_context_prompt(theme, role, base_prompt=None, theme_data=None, base_data=None, breach_data=None):
     """
     Synthesizes a role-specific Nanobanana prompt.
@@ -727,6 +512,33 @@ def generate_context_prompt(theme, role, base_prompt=None, theme_data=None, base
     ]
     return ", ".join([c for c in prompt_chunks if c])
 
+def build_role_prompt(display_theme, folder_role, rec_add_mods=(), rec_avoid_mods=(), prompt_override=None,
+                      theme_data=None, base_data=None, breach_data=None) -> str:
+    """generate_context_prompt for a tiles/textures folder, with the recommendation modifiers applied."""
+    prompt = generate_context_prompt(
+        display_theme, folder_role[:-1],
+        base_prompt=prompt_override,
+        theme_data=theme_data,
+        base_data=base_data,
+        breach_data=breach_data
+    )
+    if rec_add_mods:
+        prompt += ", " + ", ".join(rec_add_mods)
+    if rec_avoid_mods:
+        # Add as negative guidance
+        prompt += f", avoid: {', '.join(rec_avoid_mods)}"
+    return prompt
+
+
+def pool_signature(theme_names, folder_role, rec_add_mods=(), rec_avoid_mods=()) -> str:
+    """Asset pool fingerprint of what a pooled prompt was built from: lore files, modifiers, role."""
+    lore = []
+    for name in theme_names:
+        path = LORE_DIR / f"{name}.md"
+        lore.append(path.read_bytes() if path.exists() else b"")
+    return asset_pool.signature(folder_role, *theme_names, *lore, "|".join(rec_add_mods), "|".join(rec_avoid_mods))
+
+
 def synthesize_lifestyle_mockup(theme, product_title, mockup_url, style_ref_dir="artifacts/Lifestyle Photo Reference", blueprint_meta=None):
     """
     Synthesizes a lifestyle image for the product by using the Printify mockup as a base
@@ -741,9 +553,7 @@ def synthesize_lifestyle_mockup(theme, product_title, mockup_url, style_ref_dir=
     # 1. Fetch the mockup image data
     image_context = None
     try:
-        resp = requests.get(mockup_url)
-        resp.raise_for_status()
-        image_context = Image.open(io.BytesIO(resp.content))
+        image_context = prepare_reference(mockup_url)
         print(f"✅ [SYSTEM_LOG]: Mockup context secured for Nanobanana synthesis.")
     except Exception as e:
         print(f"⚠️ [SYSTEM_WARNING]: Failed to fetch mockup image for context: {e}")
@@ -843,6 +653,7 @@ def fabricate_specimen(theme, template_search=None, prompt_override=None,
                        base_name=None, breach_name=None, remix_desc=None,
                        template_id=None, tile_scale=None):
     load_dotenv()
+    asset_pool.mark_busy()   # the pool worker synthesizes only while no fabrication runs
     fab = Fabricator()
     
     # Load static recommendations if they exist (no longer auto-refreshed from blog)
@@ -934,22 +745,27 @@ def fabricate_specimen(theme, template_search=None, prompt_override=None,
     
     artifact_paths = {}
 
+    # Pooled images were synthesized ahead of time from the same lore and modifiers;
+    # a claim takes one atomically, so only a miss waits on Gemini.
+    pool_themes = (base_name, breach_name) if is_remix else (theme,)
+
     for role in roles_to_generate:
-        prompt = generate_context_prompt(
-            display_theme, role[:-1],
-            base_prompt=prompt_override,
+        if prompt_override is None:
+            sig = pool_signature(pool_themes, role, rec_add_mods, rec_avoid_mods)
+            result_path = asset_pool.claim(pool_themes, role, sig)
+            if result_path:
+                artifact_paths[role] = result_path
+                _log(f"✅ [SYSTEM_LOG]: Artifact claimed from the asset pool: {result_path}")
+                continue
+
+        prompt = build_role_prompt(
+            display_theme, role, rec_add_mods, rec_avoid_mods,
+            prompt_override=prompt_override,
             theme_data=theme_data,
             base_data=base_data,
             breach_data=breach_data
         )
         
-        # Apply recommendation-based prompt modifiers
-        if rec_add_mods:
-            prompt += ", " + ", ".join(rec_add_mods)
-        if rec_avoid_mods:
-            # Add as negative guidance
-            prompt += f", avoid: {', '.join(rec_avoid_mods)}"
-        
         _log(f"[SIGNAL_BROADCAST]: Requesting '{role}' synthesis for '{display_theme}'...")
         
         # This will use the updated nanobanana_skill routing to artifacts/graphics/<role>/...
@@ -961,6 +777,9 @@ def fabricate_specimen(theme, template_search=None, prompt_override=None,
         else:
             _log(f"❌ [SYSTEM_ERROR]: Failed to synthesize {role}")
 
+    # Refill the pool for the next run once this process goes idle
+    asset_pool.spawn_worker()
+
     if not artifact_paths:
         _log("[SYSTEM_ERROR]: No artifacts stabilized. Aborting ritual.")
         return
@@ -1242,16 +1061,16 @@ def fabricate_specimen(theme, template_search=None, prompt_override=None,
                         except Exception as sync_err:
                             _log(f"⚠️ [SYSTEM_WARNING]: Shopify lifestyle image upload failed: {sync_err}. Product still on Printify.")
 
-                        # Emit Bluesky broadcast if the lifestyle image finished uploading successfully
+                        # Queue the social broadcast if the lifestyle image finished uploading successfully.
+                        # A detached outbox worker fans it out; fabrication does not wait on it.
                         if lifestyle_uploaded_successfully:
                             # Extract a clean plain text description from either theme description or remix description
                             raw_desc = remix_desc if is_remix else (theme_data.get('description', '') if theme_data else "")
-                            publish_to_bluesky(
-                                lifestyle_path=resolved_lifestyle,
-                                product_title=product_title,
-                                product_url=product_url,
-                                description_text=raw_desc
-                            )
+                            try:
+                                if social_outbox.enqueue(resolved_lifestyle, product_title, product_url, raw_desc):
+                                    social_outbox.spawn_worker()
+                            except Exception as outbox_err:
+                                _log(f"⚠️ [SYSTEM_WARNING]: Social broadcast could not be queued: {outbox_err}")
                     else:
                         _log(f"❌ [SYSTEM_ERROR]: Media upload failed to return ID. Skipping Shopify image upload.")
                 else:
@@ -1,105 +1,219 @@
 #!/usr/bin/env python3
-# [FILE_ID]: generate_graphics_rss.py // VERSION: 1.2 // STATUS: STABLE 
+# [FILE_ID]: generate_graphics_rss.py // VERSION: 2.0 // STATUS: STABLE
+"""
+Incremental RSS 2.0 feeds for artifacts/graphics/<category>.
+
+A manifest (artifacts/feeds/.manifest.json) remembers, per category, the
+mtime of every run folder already scanned and the newest MAX_ITEMS items
+emitted. Each build only lists run folders whose mtime moved, drops items of
+folders that vanished, and streams the capped feed out with an XMLGenerator.
+A category whose items did not change is not rewritten.
+
+Usage:
+    python3 scripts/generate_graphics_rss.py
+    python3 scripts/generate_graphics_rss.py --full          # ignore the manifest
+    python3 scripts/generate_graphics_rss.py --max-items 500
+"""
 import os
+import json
+import argparse
 import datetime
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from xml.sax.saxutils import XMLGenerator
 
 # [CONFIG]
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_ROOT = os.path.abspath(os.path.join(BASE_DIR, ".."))
 GRAPHICS_DIR = os.path.join(REPO_ROOT, "artifacts", "graphics")
 OUTPUT_DIR = os.path.join(REPO_ROOT, "artifacts", "feeds")
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, ".manifest.json")
 GITHUB_RAW_BASE = "https://raw.githubusercontent.com/chayaberrygoose/cbg-loom-core/main"
 GITHUB_REPO_URL = "https://github.com/chayaberrygoose/cbg-loom-core"
 
-def create_rss_feed(category_name, items):
-    """Generates an RSS 2.0 feed for a specific graphics category."""
-    rss = ET.Element("rss", version="2.0")
-    channel = ET.SubElement(rss, "channel")
-    
-    ET.SubElement(channel, "title").text = f"CBG Studio // {category_name.upper()} // DATA_STREAM"
-    ET.SubElement(channel, "link").text = f"{GITHUB_REPO_URL}/tree/main/artifacts/graphics/{category_name}"
-    ET.SubElement(channel, "description").text = f"High-fidelity {category_name} specimens from the Chaya Berry Goose Loom."
-    ET.SubElement(channel, "language").text = "en-us"
-    ET.SubElement(channel, "lastBuildDate").text = datetime.datetime.now().strftime("%a, %d %b %Y %H:%M:%S +0000")
-
-    for item in items:
-        rss_item = ET.SubElement(channel, "item")
-        ET.SubElement(rss_item, "title").text = item['title']
-        ET.SubElement(rss_item, "link").text = item['link']
-        ET.SubElement(rss_item, "guid", isPermaLink="false").text = item['guid']
-        ET.SubElement(rss_item, "pubDate").text = item['pubDate']
-        
-        description = ET.SubElement(rss_item, "description")
-        description.text = f'<img src="{item["image_url"]}" /><br/>Prompt: {item["prompt"]}'
-
-    xml_str = ET.tostring(rss, encoding="utf-8")
-    pretty_xml = minidom.parseString(xml_str).toprettyxml(indent="  ")
-    return pretty_xml
-
-def scan_graphics():
+CATEGORIES = ["mockups", "tiles", "textures", "standalone", "logos"]
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".webp")
+MAX_ITEMS = 200
+RFC822 = "%a, %d %b %Y %H:%M:%S +0000"
+
+
+def load_manifest() -> dict:
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest: dict) -> None:
+    tmp = MANIFEST_PATH + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp, MANIFEST_PATH)
+
+
+def folder_pub_date(folder_name: str, fallback_ts: float) -> datetime.datetime:
+    """Run folders are named YYYYmmdd_HHMMSS__slug; otherwise use the folder mtime."""
+    try:
+        return datetime.datetime.strptime(folder_name.split("__")[0], "%Y%m%d_%H%M%S")
+    except ValueError:
+        return datetime.datetime.fromtimestamp(fallback_ts)
+
+
+def scan_run_folder(folder_path: str, mtime: float) -> list:
+    """Items for every image in one run folder (and any nested folders)."""
+    items = []
+    for root, dirs, files in os.walk(folder_path):
+        images = sorted(f for f in files if f.lower().endswith(IMAGE_EXTS))
+        if not images:
+            continue
+
+        prompt_text = "No prompt available."
+        if "prompt.txt" in files:
+            try:
+                with open(os.path.join(root, "prompt.txt"), "r") as f:
+                    prompt_text = f.read().strip()
+            except Exception:
+                pass
+
+        folder_name = os.path.basename(root)
+        pub_date = folder_pub_date(folder_name, mtime).isoformat()
+        for img in images:
+            rel_path = os.path.relpath(os.path.join(root, img), REPO_ROOT)
+            items.append({
+                "title": folder_name.replace("__", " // ").replace("-", " "),
+                "link": f"{GITHUB_REPO_URL}/blob/main/{rel_path}",
+                "guid": rel_path,
+                "pubDate": pub_date,
+                "image_url": f"{GITHUB_RAW_BASE}/{rel_path}",
+                "prompt": prompt_text,
+            })
+    return items
+
+
+def update_category(cat: str, state: dict, max_items: int) -> bool:
+    """
+    Bring one category's manifest entry up to date. Only run folders that are
+    new or whose mtime changed are listed. Returns True if the item set changed.
+    """
+    cat_path = os.path.join(GRAPHICS_DIR, cat)
+    seen = state.setdefault("dirs", {})
+    items = {i["guid"]: i for i in state.get("items", [])}
+    before = set(items)
+
+    present = {}
+    with os.scandir(cat_path) as it:
+        for entry in it:
+            if entry.is_dir():
+                present[entry.name] = entry.stat().st_mtime
+
+    # Only the newest max_items are stored, but `seen` covers every folder. When a
+    # folder that fed the feed disappears, the items cut by the cap are needed
+    # again: forget the other folders so the scan below refills the feed.
+    gone = set(seen) - set(present)
+    if gone:
+        prefix = os.path.relpath(cat_path, REPO_ROOT) + os.sep
+        feeding = {g[len(prefix):].split(os.sep, 1)[0] for g in items}
+        if gone & feeding:
+            for name in set(seen) - gone:
+                del seen[name]
+
+    scanned = 0
+    for name, mtime in present.items():
+        if seen.get(name) == mtime:
+            continue
+        if name in seen:
+            prefix = os.path.relpath(os.path.join(cat_path, name), REPO_ROOT) + os.sep
+            items = {g: i for g, i in items.items() if not g.startswith(prefix)}
+        for item in scan_run_folder(os.path.join(cat_path, name), mtime):
+            items[item["guid"]] = item
+        seen[name] = mtime
+        scanned += 1
+
+    for name in gone:
+        prefix = os.path.relpath(os.path.join(cat_path, name), REPO_ROOT) + os.sep
+        items = {g: i for g, i in items.items() if not g.startswith(prefix)}
+        del seen[name]
+
+    newest = sorted(items.values(), key=lambda i: (i["pubDate"], i["guid"]), reverse=True)[:max_items]
+    state["items"] = newest
+    if scanned:
+        print(f"// SCANNED: {cat} — {scanned} new/changed folder(s) of {len(present)}")
+    return {i["guid"] for i in newest} != before
+
+
+def write_rss_feed(category_name: str, items: list, output_file: str) -> None:
+    """Streams an RSS 2.0 feed for a specific graphics category to output_file."""
+    def element(gen, tag, text, attrs=None, indent="    "):
+        gen.ignorableWhitespace(f"\n{indent}")
+        gen.startElement(tag, attrs or {})
+        gen.characters(text)
+        gen.endElement(tag)
+
+    tmp = output_file + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        gen = XMLGenerator(f, encoding="utf-8", short_empty_elements=True)
+        gen.startDocument()
+        gen.startElement("rss", {"version": "2.0"})
+        gen.ignorableWhitespace("\n  ")
+        gen.startElement("channel", {})
+        element(gen, "title", f"CBG Studio // {category_name.upper()} // DATA_STREAM")
+        element(gen, "link", f"{GITHUB_REPO_URL}/tree/main/artifacts/graphics/{category_name}")
+        element(gen, "description", f"High-fidelity {category_name} specimens from the Chaya Berry Goose Loom.")
+        element(gen, "language", "en-us")
+        element(gen, "lastBuildDate", datetime.datetime.now().strftime(RFC822))
+
+        for item in items:
+            gen.ignorableWhitespace("\n    ")
+            gen.startElement("item", {})
+            element(gen, "title", item["title"], indent="      ")
+            element(gen, "link", item["link"], indent="      ")
+            element(gen, "guid", item["guid"], {"isPermaLink": "false"}, indent="      ")
+            pub_date = datetime.datetime.fromisoformat(item["pubDate"]).strftime(RFC822)
+            element(gen, "pubDate", pub_date, indent="      ")
+            element(gen, "description",
+                    f'<img src="{item["image_url"]}" /><br/>Prompt: {item["prompt"]}', indent="      ")
+            gen.ignorableWhitespace("\n    ")
+            gen.endElement("item")
+
+        gen.ignorableWhitespace("\n  ")
+        gen.endElement("channel")
+        gen.ignorableWhitespace("\n")
+        gen.endElement("rss")
+        gen.endDocument()
+        f.write("\n")
+    os.replace(tmp, output_file)
+
+
+def scan_graphics(max_items: int = MAX_ITEMS, full: bool = False):
     if not os.path.exists(OUTPUT_DIR):
         os.makedirs(OUTPUT_DIR)
 
-    categories = ["mockups", "tiles", "textures", "standalone", "logos"]
-    
-    for cat in categories:
+    manifest = {} if full else load_manifest()
+
+    for cat in CATEGORIES:
         cat_path = os.path.join(GRAPHICS_DIR, cat)
         if not os.path.exists(cat_path):
             print(f"// WARNING: Category path {cat_path} does not exist.")
             continue
-            
-        feed_items = []
-        for root, dirs, files in os.walk(cat_path):
-            images = [f for f in files if f.lower().endswith((".png", ".jpg", ".jpeg", ".webp"))]
-            if not images:
-                continue
-                
-            prompt_text = "No prompt available."
-            if "prompt.txt" in files:
-                try:
-                    with open(os.path.join(root, "prompt.txt"), "r") as f:
-                        prompt_text = f.read().strip()
-                except Exception:
-                    pass
-            
-            folder_name = os.path.basename(root)
-            if folder_name == cat:
-                continue
-
-            pub_date_raw = None
-            try:
-                date_str = folder_name.split("__")[0]
-                pub_date_raw = datetime.datetime.strptime(date_str, "%Y%m%d_%H%M%S")
-            except Exception:
-                pub_date_raw = datetime.datetime.now()
-
-            for img in images:
-                rel_path = os.path.relpath(os.path.join(root, img), REPO_ROOT)
-                image_url = f"{GITHUB_RAW_BASE}/{rel_path}"
-                
-                feed_items.append({
-                    "title": folder_name.replace("__", " // ").replace("-", " "),
-                    "link": f"{GITHUB_REPO_URL}/blob/main/{rel_path}",
-                    "guid": rel_path,
-                    "pubDate": pub_date_raw,
-                    "image_url": image_url,
-                    "prompt": prompt_text
-                })
-
-        if feed_items:
-            feed_items.sort(key=lambda x: x["pubDate"], reverse=True)
-            
-            for item in feed_items:
-                item["pubDate"] = item["pubDate"].strftime("%a, %d %b %Y %H:%M:%S +0000")
-            
-            rss_content = create_rss_feed(cat, feed_items)
-            output_file = os.path.join(OUTPUT_DIR, f"{cat}.xml")
-            
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(rss_content)
+
+        state = manifest.setdefault(cat, {})
+        if state.get("max_items") != max_items:
+            state.clear()  # a different cap needs the older folders again
+            state["max_items"] = max_items
+        output_file = os.path.join(OUTPUT_DIR, f"{cat}.xml")
+        changed = update_category(cat, state, max_items)
+
+        if state["items"] and (changed or not os.path.exists(output_file)):
+            write_rss_feed(cat, state["items"], output_file)
             print(f"// SIGNAL_RECOVERY: Generated {cat}.xml feed at {output_file}")
+        elif state["items"]:
+            print(f"// NO_CHANGE: {cat}.xml is current")
+
+    save_manifest(manifest)
+
 
 if __name__ == "__main__":
-    scan_graphics()
+    parser = argparse.ArgumentParser(description="Generate incremental RSS feeds for artifacts/graphics")
+    parser.add_argument("--max-items", type=int, default=MAX_ITEMS, help=f"Newest items kept per feed (default: {MAX_ITEMS})")
+    parser.add_argument("--full", action="store_true", help="Ignore the manifest and rescan every folder")
+    args = parser.parse_args()
+    scan_graphics(max_items=args.max_items, full=args.full)
@@ -9,6 +9,7 @@ from dotenv import load_dotenv
 # Add the repository root to sys.path
 repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(repo_root)
+from agents.skills.gemini_skill.inline_image import save_inline_image, native_extension
 
 # Load environment variables
 load_dotenv()
@@ -79,9 +80,8 @@ def main():
             for i, part in enumerate(response.candidates[0].content.parts):
                 if part.inline_data:
                     if 'image' in part.inline_data.mime_type:
-                        img = part.as_image()
-                        filename = f"generated_specimen_{target_model.replace('/', '-')}_{i}.png"
-                        img.save(filename)
+                        filename = f"generated_specimen_{target_model.replace('/', '-')}_{i}{native_extension(part.inline_data)}"
+                        save_inline_image(part.inline_data, filename)
                         _log(f"[SYSTEM_SUCCESS]: Image saved to {filename}")
                         image_saved = True
                 elif part.text:
@@ -1,8 +1,9 @@
-# /* [FILE_ID]: scripts/GENERATE_LORE_FROM_COMMENTS // VERSION: 3.0 // STATUS: STABLE */
+# /* [FILE_ID]: scripts/GENERATE_LORE_FROM_COMMENTS // VERSION: 3.1 // STATUS: STABLE */
 # [NARRATIVE]: Extracts Specimen Lore from Shopify blog comments.
 #              Each comment produces exactly ONE lore file — faithful 1:1 rendition.
 #              Tracks processed comments and maintains a comment→lore mapping log.
-#              Supports paginated comment fetching for any volume.
+#              Supports paginated comment fetching for any volume; pages are
+#              streamed and cursor-checkpointed so interrupted runs resume.
 # [USAGE]: python scripts/generate_lore_from_comments.py
 #          python scripts/generate_lore_from_comments.py --gemini
 #          python scripts/generate_lore_from_comments.py --all
@@ -12,10 +13,9 @@ import sys
 import argparse
 import re
 import json
-import requests
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Iterator
 
 # Ensure the project root is in the path for imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -124,6 +124,23 @@ def record_mapping(comment: Dict, lore_filename: str) -> None:
 
 # ─── PAGINATED COMMENT FETCHING ────────────────────────────────
 
+def iter_comment_pages(
+    conduit: ShopifyConduit,
+    blog_id: int,
+    article_id: int,
+    status: str = "published",
+) -> Iterator[List[Dict]]:
+    """
+    Stream comments for a blog article page-by-page via the conduit's shared
+    Link-header paginator.
+    """
+    total = 0
+    for page, comments in enumerate(conduit.iter_comment_pages(blog_id, article_id, status), 1):
+        total += len(comments)
+        print(f"[SIGNAL_RECOVERY]: Page {page} — {len(comments)} comment(s) (total: {total})")
+        yield comments
+
+
 def fetch_all_comments_paginated(
     conduit: ShopifyConduit,
     blog_id: int,
@@ -135,51 +152,14 @@ def fetch_all_comments_paginated(
     pagination via the Link header. Works for any volume.
     """
     all_comments: List[Dict] = []
-    page_size = 250
-    params = {
-        "limit": page_size,
-        "status": status,
-        "blog_id": blog_id,
-        "article_id": article_id,
-    }
-    url = f"{conduit.base_url}/comments.json"
-
-    page = 0
-    while url:
-        page += 1
-        resp = requests.get(url, headers=conduit.headers, params=params if page == 1 else None)
-        resp.raise_for_status()
-
-        data = resp.json()
-        comments = data.get("comments", [])
-        all_comments.extend(comments)
-        print(f"[SIGNAL_RECOVERY]: Page {page} — {len(comments)} comment(s) (total: {len(all_comments)})")
-
-        # Follow Shopify cursor pagination via Link header
-        link_header = resp.headers.get("Link", "")
-        next_url = _parse_next_link(link_header)
-        url = next_url  # None terminates the loop
-
-        if not comments:
-            break
+    for page in iter_comment_pages(conduit, blog_id, article_id, status):
+        all_comments.extend(page)
 
     # Sort by ID ascending (oldest first) so lore files are created in chronological order
     all_comments.sort(key=lambda c: c.get("id", 0))
     return all_comments
 
 
-def _parse_next_link(link_header: str) -> Optional[str]:
-    """Extract the 'next' URL from a Shopify Link header."""
-    if not link_header:
-        return None
-    for part in link_header.split(","):
-        if 'rel="next"' in part:
-            match = re.search(r'<([^>]+)>', part)
-            if match:
-                return match.group(1)
-    return None
-
-
 def generate_lore_prompt(comment_body: str, specimen_name: str) -> str:
     """
     Construct the prompt for lore synthesis from a SINGLE comment.
@@ -340,8 +320,12 @@ def main():
     blog_id = args.blog_id or DEFAULT_BLOG_ID
     article_id = args.article_id or DEFAULT_ARTICLE_ID
 
-    # ── Fetch ALL Comments (paginated) ──────────────────────────
-    print(f"[SYSTEM_LOG]: Fetching all comments from blog {blog_id}, article {article_id}...")
+    # ── Fetch All Comments → 1 Lore File Each ───────────────────
+    # Every page is read before anything is processed: comments are sorted
+    # oldest-first across pages, so lore files are created in chronological
+    # order and --max-comments takes the oldest N. The tracker is saved after
+    # each comment, so an interrupted run resumes from what was processed.
+    print(f"[SYSTEM_LOG]: Fetching comments from blog {blog_id}, article {article_id}...")
     comments = fetch_all_comments_paginated(conduit, blog_id, article_id)
 
     if not comments:
@@ -365,62 +349,21 @@ def main():
 
     if args.max_comments and len(to_process) > args.max_comments:
         to_process = to_process[:args.max_comments]
-        print(f"[SYSTEM_LOG]: Capped at {args.max_comments} comment(s) this run.")
+        print(f"[SYSTEM_LOG]: Capped at {args.max_comments} comment(s) this run (oldest first).")
 
     # ── Initialize LLM Backend ──────────────────────────────────
     model, generate_fn, backend = _init_llm_backend(args)
 
-    # ── Process Each Comment → 1 Lore File ──────────────────────
     generated = []
     failed = 0
+    processed = 0
 
-    for idx, comment in enumerate(to_process, 1):
-        cid = comment.get("id")
-        author = comment.get("author", "Anonymous")
-        body = comment.get("body", "").strip()
-
-        if not body:
-            print(f"[SYSTEM_WARNING]: Comment {cid} has empty body. Skipping.")
-            mark_comment_processed(tracker, cid)
-            continue
-
-        print(f"\n[SYSTEM_LOG]: ─── Comment {idx}/{len(to_process)} (ID: {cid}, Author: {author}) ───")
-        print(f"  Body: {body[:120]}{'...' if len(body) > 120 else ''}")
-
-        # 1. Generate specimen name from this specific comment
-        print(f"[SYSTEM_LOG]: Generating specimen name via {backend}...")
-        specimen_name = generate_specimen_name_for_comment(model, body, generate_fn)
-        print(f"[SYSTEM_LOG]: Specimen Name → {specimen_name}")
-
-        # 2. Generate lore content faithful to this comment
-        prompt = generate_lore_prompt(body, specimen_name)
-        print(f"[SYSTEM_LOG]: Synthesizing lore via {backend}...")
-        lore_content = generate_fn(model, prompt)
-
-        if lore_content.startswith("[SYSTEM_FAILURE]") or lore_content.startswith("[ACCESS_DENIED]"):
-            print(f"[SYSTEM_WARNING]: LLM failed for comment {cid}: {lore_content[:100]}")
+    for comment in to_process:
+        processed += 1
+        if not _process_comment(comment, processed, model, generate_fn, backend, args, tracker, generated):
             failed += 1
-            continue
-
-        # 3. Write or preview
-        if args.dry_run:
-            print("\n" + "=" * 60)
-            print(f"[DRY_RUN]: {specimen_name} (from comment {cid})")
-            print("=" * 60)
-            print(lore_content)
-            print("=" * 60)
-        else:
-            filepath = write_lore_file(specimen_name, lore_content)
-            if filepath:
-                generated.append((specimen_name, filepath, cid))
-                record_mapping(comment, filepath.name)
-
-        # 4. Mark processed
-        mark_comment_processed(tracker, cid)
-
-    # ── Persist Tracker ─────────────────────────────────────────
-    if not args.dry_run:
-        save_tracker(tracker)
+        if not args.dry_run:
+            save_tracker(tracker)
 
     # ── Summary ─────────────────────────────────────────────────
     print(f"\n[SYSTEM_SUCCESS]: Lore extraction complete.")
@@ -431,6 +374,53 @@ def main():
             print(f"    • {name}: {path.name} (comment {cid})")
 
 
+def _process_comment(comment: Dict, idx: int, model, generate_fn, backend: str,
+                     args, tracker: Dict, generated: List) -> bool:
+    """Render a single comment into one lore file. Returns False on LLM failure."""
+    cid = comment.get("id")
+    author = comment.get("author", "Anonymous")
+    body = comment.get("body", "").strip()
+
+    if not body:
+        print(f"[SYSTEM_WARNING]: Comment {cid} has empty body. Skipping.")
+        mark_comment_processed(tracker, cid)
+        return True
+
+    print(f"\n[SYSTEM_LOG]: ─── Comment {idx} (ID: {cid}, Author: {author}) ───")
+    print(f"  Body: {body[:120]}{'...' if len(body) > 120 else ''}")
+
+    # 1. Generate specimen name from this specific comment
+    print(f"[SYSTEM_LOG]: Generating specimen name via {backend}...")
+    specimen_name = generate_specimen_name_for_comment(model, body, generate_fn)
+    print(f"[SYSTEM_LOG]: Specimen Name → {specimen_name}")
+
+    # 2. Generate lore content faithful to this comment
+    prompt = generate_lore_prompt(body, specimen_name)
+    print(f"[SYSTEM_LOG]: Synthesizing lore via {backend}...")
+    lore_content = generate_fn(model, prompt)
+
+    if lore_content.startswith("[SYSTEM_FAILURE]") or lore_content.startswith("[ACCESS_DENIED]"):
+        print(f"[SYSTEM_WARNING]: LLM failed for comment {cid}: {lore_content[:100]}")
+        return False
+
+    # 3. Write or preview
+    if args.dry_run:
+        print("\n" + "=" * 60)
+        print(f"[DRY_RUN]: {specimen_name} (from comment {cid})")
+        print("=" * 60)
+        print(lore_content)
+        print("=" * 60)
+    else:
+        filepath = write_lore_file(specimen_name, lore_content)
+        if filepath:
+            generated.append((specimen_name, filepath, cid))
+            record_mapping(comment, filepath.name)
+
+    # 4. Mark processed
+    mark_comment_processed(tracker, cid)
+    return True
+
+
 def _init_llm_backend(args) -> Tuple:
     """
     Initialize the LLM backend (Ollama or Gemini). Returns (model, generate_fn, backend_name).
@@ -0,0 +1,188 @@
+"""
+[FILE_ID]: prefill_asset_pool.py // VERSION: 1.0 // STATUS: STABLE
+Speculative tile/texture synthesis for the asset pool (agents/skills/nanobanana_skill/asset_pool.py).
+- Predicts the next picks from the lore usage tracker: the least-used remix pairs
+  (base first, as select_remix_pair orders them) and the least-used single themes
+- Builds each prompt with build_role_prompt, so pooled images carry the same
+  lore and recommendation modifiers a live run would use
+- Synthesizes only while no fabrication process is running (busy.lock), one
+  image at a time, into artifacts/.asset_pool/ready/
+- Evicts expired and stale entries, and entries for themes that fell off the
+  plan when the pool is full (ASSET_POOL_MAX, default 16)
+- --batch (or ASSET_POOL_BATCH=1) submits the whole top-up as one Nanobanana
+  batch job (agents/skills/nanobanana_skill/batch.py) instead of one call per image
+
+Usage:
+    python scripts/prefill_asset_pool.py --fill              # top up the pool once, then exit
+    python scripts/prefill_asset_pool.py --watch             # keep topping up as usage moves
+    python scripts/prefill_asset_pool.py --status            # show ready entries and the plan
+    python scripts/prefill_asset_pool.py --fill --pairs 4 --singles 0
+    python scripts/prefill_asset_pool.py --fill --batch      # one batch job, collected when it finishes
+"""
+import argparse
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+from dotenv import load_dotenv
+load_dotenv(dotenv_path=Path(__file__).parent.parent / '.env')
+
+sys.path.append(str(Path(__file__).parent.parent))
+from agents.skills.nanobanana_skill import asset_pool
+from agents.skills.nanobanana_skill.batch import ImageBatch
+from scripts.fabricate_specimen_v2 import (
+    build_role_prompt,
+    generate_nano_banana_image,
+    get_recommendation_prompt_modifiers,
+    list_available_themes,
+    load_recommendations,
+    load_theme,
+    pool_signature,
+    _load_usage,
+)
+
+DEFAULT_PAIRS = int(os.getenv("ASSET_POOL_PAIRS", "3"))
+DEFAULT_SINGLES = int(os.getenv("ASSET_POOL_SINGLES", "2"))
+WATCH_INTERVAL = 300
+MAX_FAILURES = 3
+
+
+def plan_targets(pairs=DEFAULT_PAIRS, singles=DEFAULT_SINGLES):
+    """
+    Theme tuples most likely to be fabricated next, most likely first: remix
+    pairs ranked by (base usage, breach usage), then single themes by usage.
+    """
+    available = list_available_themes()
+    usage = _load_usage()
+    ranked = sorted(available, key=lambda t: (usage.get(t, 0), t))
+    top = ranked[:pairs + 1]
+    candidates = sorted(
+        ((b, r) for b in top for r in top if b != r),
+        key=lambda p: (usage.get(p[0], 0), usage.get(p[1], 0), p),
+    )
+    return candidates[:pairs] + [(t,) for t in ranked[:singles]]
+
+
+def _theme_context(themes):
+    """(display_theme, theme_data, base_data, breach_data) as fabricate_specimen derives them."""
+    if len(themes) == 2:
+        return f"{themes[0]} x {themes[1]}", None, load_theme(themes[0]), load_theme(themes[1])
+    theme_data = load_theme(themes[0])
+    return theme_data.get("name", themes[0]), theme_data, None, None
+
+
+def _fill_batch(wanted, build, current_sig):
+    """Submit every wanted image as one batch, wait for it, and pool the results."""
+    batch = ImageBatch("asset-pool")
+    jobs = {}
+    for i, (themes, role) in enumerate(wanted):
+        prompt = build(themes, role)
+        key = batch.add(prompt, graphic_type_override=role, output_root=asset_pool.STAGING_DIR, key=str(i))
+        jobs[key] = (themes, role, prompt)
+    batch.submit()
+    made = 0
+    for key, result in batch.collect(wait=True).items():
+        if not result:
+            continue
+        themes, role, prompt = jobs[key]
+        asset_pool.add(result, themes, role, current_sig(themes, role), prompt)
+        made += 1
+    print(f"[SYSTEM_LOG]: Pooled {made}/{len(wanted)} image(s) from batch {batch.id}")
+    return made
+
+
+def fill(pairs=DEFAULT_PAIRS, singles=DEFAULT_SINGLES, batch=False):
+    """One top-up pass. Returns the number of images synthesized."""
+    add_mods, avoid_mods = get_recommendation_prompt_modifiers(load_recommendations())
+    plan = plan_targets(pairs, singles)
+    current_sig = lambda themes, role: pool_signature(themes, role, add_mods, avoid_mods)
+
+    have = {(e.themes, e.role) for e in asset_pool.entries()}
+    wanted = [(t, r) for t in plan for r in asset_pool.ROLES if (t, r) not in have]
+    left = asset_pool.prune(keep=plan, current_sig=current_sig, room_for=len(wanted))
+    have = {(e.themes, e.role) for e in asset_pool.entries()}
+    wanted = [(t, r) for t in plan for r in asset_pool.ROLES if (t, r) not in have]
+    wanted = wanted[:max(0, asset_pool.MAX_ENTRIES - left)]
+    if not wanted:
+        print(f"[SYSTEM_LOG]: Asset pool full ({left} ready). Nothing to synthesize.")
+        return 0
+
+    def build(themes, role):
+        display_theme, theme_data, base_data, breach_data = _theme_context(themes)
+        return build_role_prompt(display_theme, role, add_mods, avoid_mods,
+                                 theme_data=theme_data, base_data=base_data, breach_data=breach_data)
+
+    print(f"[SYSTEM_LOG]: Asset pool: {left} ready, synthesizing {len(wanted)}.")
+    if batch:
+        asset_pool.wait_idle()
+        return _fill_batch(wanted, build, current_sig)
+
+    made = failures = 0
+    for themes, role in wanted:
+        asset_pool.wait_idle()
+        prompt = build(themes, role)
+        result = generate_nano_banana_image(prompt, graphic_type_override=role,
+                                            output_root=asset_pool.STAGING_DIR)
+        if not result:
+            failures += 1
+            if failures >= MAX_FAILURES:
+                print("[SYSTEM_WARNING]: Repeated synthesis failures; stopping this pass.")
+                break
+            continue
+        asset_pool.add(result, themes, role, current_sig(themes, role), prompt)
+        print(f"[SYSTEM_LOG]: Pooled {role} for {' x '.join(themes)}")
+        made += 1
+    return made
+
+
+def print_status(pairs=DEFAULT_PAIRS, singles=DEFAULT_SINGLES):
+    ready = asset_pool.entries()
+    print(f"[SYSTEM_LOG]: {len(ready)}/{asset_pool.MAX_ENTRIES} ready in {asset_pool.READY_DIR}")
+    for e in ready:
+        hours = e.age().total_seconds() / 3600
+        print(f"  {e.role:<9} {' x '.join(e.themes):<50} {hours:5.1f}h  {e.path.name}")
+    print("[SYSTEM_LOG]: Plan (most likely next first):")
+    for themes in plan_targets(pairs, singles):
+        print(f"  - {' x '.join(themes)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill the speculative tile/texture pool")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--fill", action="store_true", help="Top up the pool once (default)")
+    mode.add_argument("--watch", action="store_true", help="Keep topping up as lore usage moves")
+    mode.add_argument("--status", action="store_true", help="List ready entries and the plan, then exit")
+    parser.add_argument("--pairs", type=int, default=DEFAULT_PAIRS, help="Remix pairs to keep pooled")
+    parser.add_argument("--singles", type=int, default=DEFAULT_SINGLES, help="Single themes to keep pooled")
+    parser.add_argument("--poll", type=int, default=WATCH_INTERVAL, help="Seconds between --watch passes")
+    parser.add_argument("--batch", action="store_true", default=os.getenv("ASSET_POOL_BATCH") == "1",
+                        help="Submit each top-up as one Nanobanana batch job")
+    args = parser.parse_args()
+
+    if args.status:
+        print_status(args.pairs, args.singles)
+        return
+    if not asset_pool.ENABLED:
+        print("[SYSTEM_LOG]: Asset pool disabled (ASSET_POOL=0).")
+        return
+
+    lock = asset_pool.acquire_worker_lock()
+    if lock is None:
+        print("[SYSTEM_LOG]: Another pool worker holds the lock. Exiting.")
+        return
+    try:
+        # Leftovers from an interrupted worker never reached ready/
+        shutil.rmtree(asset_pool.STAGING_DIR, ignore_errors=True)
+        while True:
+            fill(args.pairs, args.singles, batch=args.batch)
+            if not args.watch:
+                return
+            time.sleep(args.poll)
+    finally:
+        lock.close()
+
+
+if __name__ == "__main__":
+    main()
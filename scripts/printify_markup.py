@@ -1,6 +1,8 @@
+import argparse
 import os
 import requests
 import sys
+from pathlib import Path
 
 
 BASE_URL = "https://api.printify.com/v1"
@@ -72,21 +74,41 @@ def process_single_product(product_id, markup=0.3):
     print_markup_table(product, markup)
 
 def process_all_products(markup=0.3):
+    # Listing rows already carry full variants; no per-product GET needed.
     shop_id = get_shop_id()
-    products = get_all_products(shop_id)
-    for prod in products:
-        product = get_product(shop_id, prod["id"])
+    for product in get_all_products(shop_id):
         print_markup_table(product, markup)
 
+def reprice_all_products(margin=0.3, publish=False):
+    """
+    Shop-wide margin pass through the bulk pricing engine: listing pages plus
+    one PUT per product whose prices are off target (and a publish, if asked).
+    """
+    sys.path.append(str(Path(__file__).parent.parent))
+    from agents.skills.fabricator.pricing_engine import PricingEngine
+    shop_id = os.getenv("PRINTIFY_SHOP_ID") or os.getenv("printify_shop_id") or get_shop_id()
+    results = PricingEngine.shared(shop_id).reprice_shop(margin=margin, publish=publish)
+    return [pid for pid, r in results.items() if "error" in r]
+
 def main():
-    if not PRINTIFY_API_KEY:
+    parser = argparse.ArgumentParser(description="Preview or apply Printify variant markups")
+    parser.add_argument("product_id", nargs="?", help="Preview a single product (default: whole shop)")
+    parser.add_argument("--markup", type=float, default=0.3, help="Preview markup over price (default 0.3)")
+    parser.add_argument("--apply", action="store_true", help="Set every product to --margin over cost")
+    parser.add_argument("--margin", type=float, default=0.3, help="Profit margin for --apply (default 0.3)")
+    parser.add_argument("--publish", action="store_true", help="With --apply, also publish each product to Shopify")
+    args = parser.parse_args()
+
+    if not get_printify_api_key():
         print("[ERROR] PRINTIFY_API_KEY environment variable not set.")
         sys.exit(1)
-    if len(sys.argv) > 1:
-        product_id = sys.argv[1]
-        process_single_product(product_id)
+    if args.apply:
+        failed = reprice_all_products(args.margin, publish=args.publish)
+        sys.exit(1 if failed else 0)
+    if args.product_id:
+        process_single_product(args.product_id, args.markup)
     else:
-        process_all_products()
+        process_all_products(args.markup)
 
 if __name__ == "__main__":
     main()
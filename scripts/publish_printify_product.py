@@ -2,10 +2,10 @@
 [FILE_ID]: publish_printify_product.py // VERSION: 0.2 // STATUS: UNSTABLE
 Publication flow for Printify → Shopify:
 - Takes Printify Product ID as argument
-- Sets 30% margin for all variants
+- Sets 30% margin for all variants (PUT skipped when prices already match)
 - Publishes product (Printify → Shopify)
 - Waits for Shopify listing
-- Uploads lifestyle image to Shopify and sets as primary
+- Uploads lifestyle image to Shopify (staged upload) and sets as primary
 """
 import os
 import sys
@@ -19,10 +19,11 @@ load_dotenv(dotenv_path=Path(__file__).parent.parent / '.env')
 
 # Import Printify helpers from scripts/printify_markup.py
 sys.path.append(str(Path(__file__).parent))
-from printify_markup import get_shop_id, get_product, get_printify_api_key
+from printify_markup import get_shop_id, get_printify_api_key
 # Import ShopifyConduit from agents.skills.shopify_skill
 sys.path.append(str(Path(__file__).parent.parent))
 from agents.skills.shopify_skill import ShopifyConduit
+from agents.skills.fabricator.pricing_engine import PricingEngine
 
 def get_env(*keys):
     for k in keys:
@@ -41,80 +42,25 @@ def get_printify_shop_id():
     return os.getenv("PRINTIFY_SHOP_ID") or os.getenv("printify_shop_id")
 
 def set_margin_and_publish(product_id, margin=0.3):
+    """
+    Price every variant at `margin` over cost and publish to Shopify.
+    The PUT is skipped when prices already match (e.g. a republish after the
+    QR swap), so an unchanged product costs one publish POST.
+    """
     shop_id = get_printify_shop_id()
     if not shop_id:
         shop_id = get_shop_id()
     print(f"[DEBUG] Using Printify shop_id: {shop_id}")
-    print(f"[DEBUG] Getting product: shop_id={shop_id}, product_id={product_id}")
-    import requests
-    try:
-        product = get_product(shop_id, product_id)
-    except requests.HTTPError as e:
-        print(f"[PRINTIFY ERROR] Failed to fetch product {product_id} from shop {shop_id}.")
-        print(f"[PRINTIFY ERROR] Status: {e.response.status_code}")
-        print(f"[PRINTIFY ERROR] URL: {e.response.url}")
-        print(f"[PRINTIFY ERROR] Response: {e.response.text}")
-        raise
-    # Update all variants with new price
-    updates = []
-    for variant in product.get("variants", []):
-        # Use production cost as base for profit margin
-        if "cost" in variant and variant["cost"] is not None:
-            base_price = float(variant["cost"])
-        else:
-            print(f"[WARN] Variant {variant['id']} missing 'cost', using 'price' as fallback.")
-            base_price = float(variant["price"])
-        # Profit margin: price = cost / (1 - margin)
-        marked_up_price = int(round(base_price / (1 - margin)))
-        updates.append({"id": variant["id"], "price": marked_up_price})
-    # Update product variants
-    url = f"https://api.printify.com/v1/shops/{shop_id}/products/{product_id}.json"
-    headers = {"Authorization": f"Bearer {get_printify_api_key()}", "Content-Type": "application/json"}
-    try:
-        resp = requests.put(url, headers=headers, json={"variants": updates})
-        resp.raise_for_status()
-    except requests.HTTPError as e:
-        print(f"[PRINTIFY ERROR] Failed to update product {product_id}.")
-        print(f"[PRINTIFY ERROR] Status: {e.response.status_code}")
-        print(f"[PRINTIFY ERROR] URL: {e.response.url}")
-        print(f"[PRINTIFY ERROR] Response: {e.response.text}")
-        raise
-    # Fetch product details for publish payload
-    product_url = f"https://api.printify.com/v1/shops/{shop_id}/products/{product_id}.json"
     try:
-        prod_resp = requests.get(product_url, headers=headers)
-        prod_resp.raise_for_status()
-        product_data = prod_resp.json()
+        result = PricingEngine.shared(shop_id).set_margin_and_publish(product_id, margin=margin)
     except requests.HTTPError as e:
-        print(f"[PRINTIFY ERROR] Failed to fetch product details for publish.")
+        print(f"[PRINTIFY ERROR] Margin/publish failed for product {product_id} in shop {shop_id}.")
         print(f"[PRINTIFY ERROR] Status: {e.response.status_code}")
         print(f"[PRINTIFY ERROR] URL: {e.response.url}")
         print(f"[PRINTIFY ERROR] Response: {e.response.text}")
         raise
-
-    # Build publish payload
-    # Printify publish expects booleans for which fields to publish
-    publish_payload = {
-        "title": True,
-        "description": True,
-        "images": True,
-        "variants": True,
-        "tags": True,
-        "publish": {"shop": "shopify"}
-    }
-
-    # Publish product
-    pub_url = f"https://api.printify.com/v1/shops/{shop_id}/products/{product_id}/publish.json"
-    try:
-        pub_resp = requests.post(pub_url, headers=headers, json=publish_payload)
-        pub_resp.raise_for_status()
-    except requests.HTTPError as e:
-        print(f"[PRINTIFY ERROR] Failed to publish product {product_id}.")
-        print(f"[PRINTIFY ERROR] Status: {e.response.status_code}")
-        print(f"[PRINTIFY ERROR] URL: {e.response.url}")
-        print(f"[PRINTIFY ERROR] Response: {e.response.text}")
-        raise
-
+    if not result["repriced"]:
+        print(f"[SYSTEM_LOG] Prices for {product_id} already at {int(margin * 100)}% margin; update skipped.")
     return True
 
 def wait_for_printify_publish(shop_id, product_id, timeout=300, poll_interval=10):
@@ -164,18 +110,28 @@ def wait_for_printify_publish(shop_id, product_id, timeout=300, poll_interval=10
         time.sleep(poll_interval)
         elapsed += poll_interval
     raise TimeoutError(f"Printify product {product_id} not published after {timeout} seconds (sync not complete).")
-def wait_for_shopify_product(printify_product_id, timeout=300, poll_interval=10):
+def wait_for_shopify_product(printify_product_id, shopify_product_id=None, timeout=300, poll_interval=10):
+    # With the external id wait_for_printify_publish returned, each poll is one
+    # product GET. Without it, match recent products on the Printify id in
+    # body_html, title or id.
     conduit = ShopifyConduit()
     elapsed = 0
     while elapsed < timeout:
-        products = conduit.list_products(limit=250)
-        for p in products:
-            if (
-                str(printify_product_id) in str(p.get("body_html", ""))
-                or str(printify_product_id) in str(p.get("title", ""))
-                or str(printify_product_id) == str(p.get("id"))
-            ):
-                return p["id"]
+        if shopify_product_id:
+            try:
+                product = conduit.get_product(int(shopify_product_id))
+            except requests.HTTPError:
+                product = None
+            if product:
+                return product["id"]
+        else:
+            for p in conduit.list_products(limit=250):
+                if (
+                    str(printify_product_id) in str(p.get("body_html", ""))
+                    or str(printify_product_id) in str(p.get("title", ""))
+                    or str(printify_product_id) == str(p.get("id"))
+                ):
+                    return p["id"]
         time.sleep(poll_interval)
         elapsed += poll_interval
     raise TimeoutError("Shopify product not found after publish.")
@@ -202,18 +158,14 @@ def find_lifestyle_image(product_id):
     return None
 
 def upload_lifestyle_image(shopify_product_id, image_path):
-    # conduit = ShopifyConduit()  # Not needed for direct REST call
-    with open(image_path, "rb") as f:
-        image_data = f.read()
-    # Shopify API expects base64 or URL, so upload via REST
-    url = f"https://{SHOPIFY_STORE_URL}/admin/api/2024-01/products/{shopify_product_id}/images.json"
-    headers = {"X-Shopify-Access-Token": SHOPIFY_ACCESS_TOKEN, "Content-Type": "application/json"}
-    import base64
-    encoded = base64.b64encode(image_data).decode()
-    payload = {"image": {"attachment": encoded, "position": 1}}
-    resp = requests.post(url, headers=headers, json=payload)
-    resp.raise_for_status()
-    return resp.json()
+    """
+    Attach a lifestyle image to a Shopify product as its primary image. The file
+    is streamed to a staged upload target and attached with productCreateMedia,
+    so large renders are never base64-inflated or held in memory.
+    """
+    conduit = ShopifyConduit()
+    created = conduit.upload_product_images({shopify_product_id: [image_path]}, primary=True)
+    return created.get(conduit._product_gid(shopify_product_id), [])
 
 def list_printify_products():
     shop_id = get_printify_shop_id()
@@ -245,9 +197,9 @@ def main():
     print(f"[SYSTEM_LOG] Setting margin and publishing Printify product {product_id}...")
     set_margin_and_publish(product_id)
     shop_id = get_printify_shop_id() or get_shop_id()
-    wait_for_printify_publish(shop_id, product_id)
+    external_id = wait_for_printify_publish(shop_id, product_id)
     print(f"[SYSTEM_LOG] Waiting for Shopify product to appear...")
-    shopify_product_id = wait_for_shopify_product(product_id)
+    shopify_product_id = wait_for_shopify_product(product_id, external_id)
     print(f"[SYSTEM_LOG] Shopify product ID: {shopify_product_id}")
     image_path = find_lifestyle_image(product_id)
     if not image_path:
@@ -14,6 +14,9 @@ Usage:
     # Create multiple random drafts (pulls products once, creates N drafts)
     python3 scripts/random_draft.py --count 5
 
+    # Seed many blueprints at once (8 concurrent creations)
+    python3 scripts/random_draft.py --count 30 --workers 8
+
     # Dry run (show what would be created)
     python3 scripts/random_draft.py --dry-run
 
@@ -25,6 +28,7 @@ import sys
 import os
 import random
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -33,6 +37,9 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from scripts.blueprint_explorer import BlueprintExplorer
+from agents.skills.fabricator.upload_pool import UploadPool
+
+DEFAULT_WORKERS = 4
 
 
 def find_graphics(base_dir: Path) -> list:
@@ -40,21 +47,102 @@ def find_graphics(base_dir: Path) -> list:
     return list(base_dir.rglob("*.png"))
 
 
-def pick_random_graphic(graphics_dir: str, category: str) -> str:
-    """Picks a random PNG from a graphics directory."""
-    base = Path(graphics_dir)
-    if not base.exists():
-        print(f"!! [SYSTEM_WARNING]: {category} directory not found: {graphics_dir}")
-        return None
-    
-    pngs = find_graphics(base)
-    if not pngs:
-        print(f"!! [SYSTEM_WARNING]: No PNGs found in {category} directory")
-        return None
-    
-    selected = random.choice(pngs)
-    print(f"// SELECTED_{category.upper()}: {selected.name}")
-    return str(selected)
+class DraftFactory:
+    """
+    Batch [DRAFT] creation. Graphics folders are walked once, every distinct
+    tile/texture/logo the batch needs is uploaded once up front (deduped by
+    content hash, reused across runs via UploadPool), and the drafts are then
+    created concurrently. All Printify traffic shares the process-wide
+    rate limiter, so the worker count only bounds concurrency.
+    """
+
+    def __init__(self, explorer: BlueprintExplorer, tiles_dir: Path, textures_dir: Path,
+                 workers: int = DEFAULT_WORKERS):
+        self.explorer = explorer
+        self.workers = workers
+        self.tiles = find_graphics(tiles_dir) if tiles_dir.exists() else []
+        self.textures = find_graphics(textures_dir) if textures_dir.exists() else []
+        self.pool = UploadPool(explorer.upload_image)
+        print(f"// GRAPHICS_INDEXED: {len(self.tiles)} tile(s), {len(self.textures)} texture(s)")
+
+    def plan(self, blueprints: list, tile: str = None, texture: str = None, logo: str = None) -> list:
+        """One job per blueprint, each with its own random tile/texture unless overridden."""
+        jobs = []
+        for bp in blueprints:
+            jobs.append({
+                "blueprint": bp,
+                "tile_path": tile or (str(random.choice(self.tiles)) if self.tiles else None),
+                "texture_path": texture or (str(random.choice(self.textures)) if self.textures else None),
+                "logo_path": logo,
+            })
+        return jobs
+
+    def upload_assets(self, jobs: list) -> tuple:
+        """
+        Pre-upload every distinct asset in the plan, one path at a time per
+        worker so a failed upload only affects the drafts using it.
+        Returns ({path: image_id}, {path: error}).
+        """
+        paths = list(dict.fromkeys(
+            job[key] for job in jobs
+            for key in ("tile_path", "texture_path", "logo_path")
+            if job[key] and Path(job[key]).exists()
+        ))
+        ids, errors = {}, {}
+        if paths:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                futures = {pool.submit(self.pool.ensure, path): path for path in paths}
+                for future in as_completed(futures):
+                    path = futures[future]
+                    try:
+                        ids[path] = future.result()
+                    except Exception as e:
+                        print(f"!! [SYSTEM_FAILURE]: Upload failed for {Path(path).name}: {e}")
+                        errors[path] = e
+        print(f"// ASSET_POOL_READY: {len(ids)} distinct image(s) for {len(jobs)} draft(s)"
+              + (f", {len(errors)} upload(s) failed" if errors else ""))
+        return ids, errors
+
+    def _create(self, job: dict, ids: dict, price_cents: int) -> dict:
+        bp = job["blueprint"]
+        return self.explorer.create_template(
+            blueprint_id=bp["id"],
+            tile_path=job["tile_path"],
+            texture_path=job["texture_path"],
+            logo_path=job["logo_path"],
+            provider_id=None,  # Auto-detect
+            price_cents=price_cents,
+            tile_id=ids.get(job["tile_path"]),
+            texture_id=ids.get(job["texture_path"]),
+            logo_id=ids.get(job["logo_path"]),
+        )
+
+    def run(self, jobs: list, price_cents: int) -> tuple:
+        """Create all drafts concurrently. Returns (created, failed) lists of (job, product|error)."""
+        ids, errors = self.upload_assets(jobs)
+        created, failed, ready = [], [], []
+        for job in jobs:
+            error = next((errors[job[k]] for k in ("tile_path", "texture_path", "logo_path") if job[k] in errors), None)
+            if error is None:
+                ready.append(job)
+            else:
+                bp = job["blueprint"]
+                print(f"!! [SYSTEM_FAILURE]: [{bp['id']}] {bp['title']}: asset upload failed: {error}")
+                failed.append((job, error))
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self._create, job, ids, price_cents): job for job in ready}
+            for future in as_completed(futures):
+                job = futures[future]
+                bp = job["blueprint"]
+                try:
+                    product = future.result()
+                    print(f"[SIGNAL_STABLE]: [{bp['id']}] {bp['title']} → "
+                          f"https://printify.com/app/store/{self.explorer.shop_id}/products/{product['id']}")
+                    created.append((job, product))
+                except Exception as e:
+                    print(f"!! [SYSTEM_FAILURE]: [{bp['id']}] {bp['title']}: {e}")
+                    failed.append((job, e))
+        return created, failed
 
 
 def main():
@@ -65,6 +153,8 @@ def main():
     parser.add_argument("--texture", type=str, help="Override texture selection with specific path")
     parser.add_argument("--logo", type=str, help="Override logo selection with specific path")
     parser.add_argument("--price", type=int, default=4500, help="Price in cents (default: 4500)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Concurrent uploads/creations (default: {DEFAULT_WORKERS})")
     
     args = parser.parse_args()
     
@@ -98,80 +188,33 @@ def main():
     if count < args.count:
         print(f"// [SYSTEM_WARNING]: Requested {args.count}, but only {len(unused)} unused blueprints available.")
     
+    # Always use QR code for logo
+    logo_path = args.logo or str(logos_dir / "repo_portal_qr.png")
+    
+    factory = DraftFactory(explorer, tiles_dir, textures_dir, workers=args.workers)
+    jobs = factory.plan(random.sample(unused, count), tile=args.tile, texture=args.texture, logo=logo_path)
+    
     print(f"// CREATING: {count} draft(s)")
+    for i, job in enumerate(jobs, 1):
+        bp = job["blueprint"]
+        print(f"\n[DRAFT {i}/{count}] [{bp['id']}] {bp['title']}")
+        print(f"    Tile: {Path(job['tile_path']).name if job['tile_path'] else None}")
+        print(f"    Texture: {Path(job['texture_path']).name if job['texture_path'] else None}")
+        print(f"    Logo: {Path(job['logo_path']).name}")
     
-    created = 0
-    failed = 0
+    if args.dry_run:
+        print(f"\n[DRY_RUN]: Would create {count} template(s) at ${args.price / 100:.2f}")
+        return 0
     
-    for i in range(count):
-        print(f"\n{'=' * 60}")
-        print(f"[DRAFT {i + 1}/{count}]")
-        print("=" * 60)
-        
-        # Pick random blueprint from remaining unused
-        selected_bp = random.choice(unused)
-        unused.remove(selected_bp)  # Remove so we don't pick it again
-        
-        print(f"\n--- SELECTED_BLUEPRINT ---")
-        print(f"    ID: {selected_bp['id']}")
-        print(f"    Title: {selected_bp['title']}")
-        
-        # Inspect for more details
-        info = explorer.inspect_blueprint(selected_bp['id'])
-        if info['providers']:
-            provider = info['providers'][0]
-            print(f"    Provider: [{provider['id']}] {provider['title']}")
-            print(f"    Variants: {provider['variant_count']}")
-        
-        positions = explorer.get_known_positions(selected_bp['id'])
-        print(f"    Positions: {positions}")
-        
-        # Select graphics (random each time unless overridden)
-        print(f"\n--- SELECTING_GRAPHICS ---")
-        tile_path = args.tile or pick_random_graphic(str(tiles_dir), "tile")
-        texture_path = args.texture or pick_random_graphic(str(textures_dir), "texture")
-        
-        # Always use QR code for logo
-        qr_path = logos_dir / "repo_portal_qr.png"
-        logo_path = args.logo or str(qr_path)
-        print(f"// SELECTED_LOGO: {Path(logo_path).name}")
-        
-        if args.dry_run:
-            print(f"\n[DRY_RUN]: Would create template with:")
-            print(f"    Blueprint: [{selected_bp['id']}] {selected_bp['title']}")
-            print(f"    Tile: {tile_path}")
-            print(f"    Texture: {texture_path}")
-            print(f"    Logo: {logo_path}")
-            print(f"    Price: ${args.price / 100:.2f}")
-            created += 1
-            continue
-        
-        # Create the template
-        print(f"\n--- CREATING_TEMPLATE ---")
-        try:
-            product = explorer.create_template(
-                blueprint_id=selected_bp['id'],
-                tile_path=tile_path,
-                texture_path=texture_path,
-                logo_path=logo_path,
-                provider_id=None,  # Auto-detect
-                price_cents=args.price
-            )
-            
-            print(f"\n[SIGNAL_STABLE]: Draft template created successfully!")
-            print(f"// CONDUIT: https://printify.com/app/store/{explorer.shop_id}/products/{product['id']}")
-            created += 1
-            
-        except Exception as e:
-            print(f"\n!! [SYSTEM_FAILURE]: {e}")
-            failed += 1
+    print(f"\n--- CREATING_TEMPLATES ({args.workers} workers) ---")
+    created, failed = factory.run(jobs, price_cents=args.price)
     
     # Summary
     print(f"\n{'=' * 60}")
-    print(f"[SUMMARY] Created: {created} | Failed: {failed}")
+    print(f"[SUMMARY] Created: {len(created)} | Failed: {len(failed)}")
     print("=" * 60)
     
-    return 0 if failed == 0 else 1
+    return 0 if not failed else 1
 
 
 if __name__ == "__main__":
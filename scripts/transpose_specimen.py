@@ -31,15 +31,16 @@ import time
 import json
 import re
 import requests
-import io
 from pathlib import Path
-from PIL import Image
 from dotenv import load_dotenv
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from agents.skills.fabricator.fabricator import Fabricator
+from agents.skills.fabricator import mockup_cache
+from agents.skills.gemini_skill.image_context import prepare_reference
+from agents.skills.fabricator.stamp_compositor import composite_stamp
 
 # Lazy import to avoid heavy deps on --help
 def get_shopify_conduit():
@@ -52,7 +53,6 @@ def get_shopify_conduit():
 
 STAMP_PATH = Path("artifacts/graphics/logos/repo_portal_qr.png")
 TEMPLATE_HISTORY_PATH = Path("artifacts/.last_template_id")
-TRANSPOSE_CACHE_DIR = Path("artifacts/graphics/.transpose_cache")
 UNVERIFIED_BLOG_TITLE = "[STATUS: UNVERIFIED]"
 
 
@@ -119,22 +119,17 @@ def extract_product_images(fab: Fabricator, product_id: str) -> dict:
 
 def download_image_to_cache(image_id: str, src_url: str) -> str:
     """
-    Download an image from Printify CDN to local cache.
+    Resolve a Printify CDN image through the shared content-addressed mockup cache.
     Returns local path.
     """
-    TRANSPOSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    local_path = TRANSPOSE_CACHE_DIR / f"{image_id}.png"
-    
-    if local_path.exists():
-        print(f"// CACHE_HIT: {local_path}")
-        return str(local_path)
+    hit = mockup_cache.cached_path(src_url)
+    if hit:
+        print(f"// CACHE_HIT: {hit}")
+        return str(hit)
     
     print(f"// DOWNLOADING: {image_id}...")
     try:
-        resp = requests.get(src_url, timeout=30)
-        resp.raise_for_status()
-        with open(local_path, 'wb') as f:
-            f.write(resp.content)
+        local_path = mockup_cache.fetch_path(src_url)
         print(f"// CACHED: {local_path}")
         return str(local_path)
     except Exception as e:
@@ -149,13 +144,8 @@ def find_blog_article_for_product(product_id: str) -> dict:
     """
     try:
         conduit = get_shopify_conduit()
-        blogs = conduit.list_blogs()
-        
-        blog_id = None
-        for b in blogs:
-            if b.get('title', '').strip() == UNVERIFIED_BLOG_TITLE:
-                blog_id = b['id']
-                break
+        blog = conduit.find_blog(UNVERIFIED_BLOG_TITLE)
+        blog_id = blog['id'] if blog else None
         
         if not blog_id:
             print(f"// BLOG_NOT_FOUND: {UNVERIFIED_BLOG_TITLE}")
@@ -207,18 +197,7 @@ def apply_unverified_stamp(image_path: str) -> str:
         return image_path
     
     try:
-        base_img = Image.open(image_path).convert("RGBA")
-        stamp = Image.open(str(STAMP_PATH)).convert("RGBA")
-        
-        stamp_size = max(int(base_img.width * 0.12), 48)
-        stamp = stamp.resize((stamp_size, stamp_size), Image.LANCZOS)
-        
-        padding = int(base_img.width * 0.03)
-        x = base_img.width - stamp_size - padding
-        y = base_img.height - stamp_size - padding
-        
-        base_img.paste(stamp, (x, y), stamp)
-        base_img.save(image_path)
+        x, y, _ = composite_stamp(image_path, STAMP_PATH)
         print(f"// STAMP_APPLIED: ({x}, {y})")
         return image_path
     except Exception as e:
@@ -234,9 +213,7 @@ def synthesize_lifestyle_mockup(theme_desc: str, product_title: str, mockup_url:
     
     image_context = None
     try:
-        resp = requests.get(mockup_url)
-        resp.raise_for_status()
-        image_context = Image.open(io.BytesIO(resp.content))
+        image_context = prepare_reference(mockup_url)
         print(f"✅ [SYSTEM_LOG]: Mockup context secured.")
     except Exception as e:
         print(f"⚠️ [SYSTEM_WARNING]: Failed to fetch mockup: {e}")
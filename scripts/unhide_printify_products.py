@@ -1,76 +1,61 @@
 """
-[FILE_ID]: unhide_printify_products.py // VERSION: 1.2 // STATUS: STABLE
+[FILE_ID]: unhide_printify_products.py // VERSION: 2.0 // STATUS: STABLE
 Publish and unhide Printify products on Shopify.
-- Paginates through all products in the Printify store
+- Reads the shop from the local ProductIndex (one concurrent listing pass when stale)
 - Identifies products with visible=False (hidden from Shopify)
 - Identifies unpublished products (no external link to Shopify)
-- Publishes/republishes them to make them live on Shopify
-- Automatically resumes: re-fetches product state each run, skips already-done
-- Retries on 429 rate-limits with exponential backoff
+- Publishes/republishes them from a worker pool throttled by the shared
+  Printify buckets (printify_limiter), so the sweep runs at the API budget
+- Checkpoints every settled product to artifacts/.printify_sweep.json; an
+  interrupted sweep resumes past them, and the checkpoint is cleared after a clean run
+- --confirm re-lists the shop until every swept product shows as live, and
+  un-settles anything still hidden/unpublished so the next run retries it
 
 Usage:
     python scripts/unhide_printify_products.py                      # publish all hidden + unpublished
     python scripts/unhide_printify_products.py --dry-run             # preview without changes
     python scripts/unhide_printify_products.py --hidden-only         # only unhide hidden products
     python scripts/unhide_printify_products.py --unpublished-only    # only publish unpublished products
+    python scripts/unhide_printify_products.py --workers 6 --confirm
+    python scripts/unhide_printify_products.py --restart             # ignore an existing checkpoint
 """
+import argparse
+import json
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import requests
 
 from dotenv import load_dotenv
 load_dotenv(dotenv_path=Path(__file__).parent.parent / '.env')
 
-sys.path.append(str(Path(__file__).parent))
-from printify_markup import get_headers, get_shop_id, get_printify_api_key
+sys.path.append(str(Path(__file__).parent.parent))
+from agents.skills.fabricator.fabricator import Fabricator
+from agents.skills.fabricator.product_index import ProductIndex
+from agents.skills.fabricator.printify_limiter import budget_per_minute
 
-BASE_URL = "https://api.printify.com/v1"
+CHECKPOINT_PATH = Path(__file__).resolve().parent.parent / "artifacts" / ".printify_sweep.json"
+INDEX_MAX_AGE = timedelta(minutes=5)
+DEFAULT_WORKERS = 4
+CONFIRM_POLL = 30
 
-
-def get_printify_shop_id():
-    return os.getenv("PRINTIFY_SHOP_ID") or os.getenv("printify_shop_id")
-
-
-def get_all_products_paginated(shop_id):
-    """Fetch all products across all pages. Retries on 429."""
-    all_products = []
-    page = 1
-    while True:
-        for attempt in range(5):
-            resp = requests.get(
-                f"{BASE_URL}/shops/{shop_id}/products.json",
-                headers=get_headers(),
-                params={"page": page},
-            )
-            if resp.status_code == 429:
-                retry_after = int(resp.headers.get("Retry-After", 0))
-                wait = max(retry_after, 2 ** (attempt + 1) * 5)
-                print(f"[RATE_LIMIT] 429 fetching page {page} — waiting {wait}s")
-                time.sleep(wait)
-                continue
-            break
-        if not resp.ok:
-            print(f"[ERROR] {resp.status_code}: {resp.text}")
-            resp.raise_for_status()
-        body = resp.json()
-        data = body.get("data", [])
-        if not data:
-            break
-        all_products.extend(data)
-        current_page = body.get("current_page", page)
-        last_page = body.get("last_page", page)
-        print(f"[SYSTEM_LOG] Fetched page {current_page}/{last_page} — {len(data)} products")
-        if current_page >= last_page:
-            break
-        page += 1
-        time.sleep(1)  # small delay between page fetches
-    return all_products
+PUBLISH_PAYLOAD = {
+    "title": True,
+    "description": True,
+    "images": True,
+    "variants": True,
+    "tags": True,
+}
 
 
 def is_unpublished(product):
-    """Product exists in Printify but was never published to Shopify."""
+    """Product exists in Printify but was never published to Shopify (index row or raw payload)."""
+    if "external_id" in product:
+        return not product.get("external_id")
     external = product.get("external")
     # No external link at all, or external is empty/has no id
     if not external:
@@ -82,129 +67,188 @@ def is_unpublished(product):
 
 def is_hidden(product):
     """Product is published to Shopify but marked as not visible."""
-    return not product.get("visible", True) and not is_unpublished(product)
-
-
-def publish_product(shop_id, product_id, max_retries=5):
-    """Publish a product to Shopify (makes it visible). Retries on 429."""
-    url = f"{BASE_URL}/shops/{shop_id}/products/{product_id}/publish.json"
-    headers = {
-        "Authorization": f"Bearer {get_printify_api_key()}",
-        "Content-Type": "application/json",
-    }
-    payload = {
-        "title": True,
-        "description": True,
-        "images": True,
-        "variants": True,
-        "tags": True,
-    }
-    for attempt in range(max_retries):
-        resp = requests.post(url, headers=headers, json=payload)
-        if resp.status_code == 429:
-            # Respect Retry-After header if present, else exponential backoff
-            retry_after = int(resp.headers.get("Retry-After", 0))
-            wait = max(retry_after, 2 ** (attempt + 1) * 5)  # 10s, 20s, 40s, 80s, 160s
-            print(f"[RATE_LIMIT] 429 on {product_id} — waiting {wait}s (attempt {attempt + 1}/{max_retries})")
-            time.sleep(wait)
-            continue
-        resp.raise_for_status()
-        return resp
-    # Final attempt after all retries exhausted
-    resp = requests.post(url, headers=headers, json=payload)
+    return product.get("visible") is False and not is_unpublished(product)
+
+
+class SweepCheckpoint:
+    """Settled product ids for one sweep mode, persisted after every result."""
+
+    def __init__(self, mode, path=CHECKPOINT_PATH, restart=False):
+        self.path = path
+        self.mode = mode
+        self.lock = threading.Lock()
+        self.done, self.failed = {}, {}
+        if not restart:
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                if data.get("mode") == mode:
+                    self.done, self.failed = data.get("done", {}), data.get("failed", {})
+            except (FileNotFoundError, json.JSONDecodeError, OSError):
+                pass
+
+    def record(self, product_id, action=None, error=None):
+        with self.lock:
+            if error is None:
+                self.done[product_id] = action
+                self.failed.pop(product_id, None)
+            else:
+                self.failed[product_id] = error
+                self.done.pop(product_id, None)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({
+                "mode": self.mode,
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+                "done": self.done,
+                "failed": self.failed,
+            }), encoding="utf-8")
+            tmp.replace(self.path)
+
+    def clear(self):
+        self.path.unlink(missing_ok=True)
+
+
+def publish_product(fab, product_id):
+    """Publish a product to Shopify (makes it visible). 429s are retried by the shared session."""
+    resp = fab.session.post(
+        f"{fab.BASE_URL}/shops/{fab.shop_id}/products/{product_id}/publish.json",
+        json=PUBLISH_PAYLOAD,
+    )
     resp.raise_for_status()
     return resp
 
 
-def process_products(products, label, action_label, shop_id, dry_run):
-    """Publish a list of products and print results."""
-    if not products:
-        print(f"[SYSTEM_LOG] No {label} products found.")
-        return 0, 0
-
-    print(f"\n// {label.upper()} PRODUCTS ({len(products)})")
+def sweep(fab, targets, checkpoint, workers):
+    """
+    Publish every (product, action) target concurrently. The pool only keeps
+    requests in flight; pacing comes from the process-wide buckets.
+    Returns (success, failed, elapsed seconds).
+    """
     print("| # | Product ID | Title | Status |")
     print("|---|------------|-------|--------|")
-
-    success = 0
-    failed = 0
-
-    for i, product in enumerate(products, 1):
-        pid = product["id"]
-        title = product.get("title", "Unknown")
-
-        if dry_run:
-            print(f"| {i} | {pid} | {title} | WOULD {action_label} |")
-            continue
-
-        try:
-            publish_product(shop_id, pid)
-            print(f"| {i} | {pid} | {title} | {action_label}D |")
+    started = time.monotonic()
+
+    def _publish(product, action):
+        publish_product(fab, product["id"])
+        return product, action
+
+    success = failed = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_publish, p, a): (p, a) for p, a in targets}
+        for n, f in enumerate(as_completed(futures), 1):
+            product, action = futures[f]
+            title = product.get("title", "Unknown")
+            try:
+                f.result()
+            except requests.HTTPError as e:
+                status = e.response.status_code
+                checkpoint.record(product["id"], error=f"{status} {e.response.text[:200]}")
+                print(f"| {n} | {product['id']} | {title} | FAILED ({status}) |")
+                failed += 1
+                continue
+            except requests.RequestException as e:
+                checkpoint.record(product["id"], error=str(e))
+                print(f"| {n} | {product['id']} | {title} | FAILED ({e.__class__.__name__}) |")
+                failed += 1
+                continue
+            checkpoint.record(product["id"], action)
+            print(f"| {n} | {product['id']} | {title} | {action}D |")
             success += 1
-            # Rate-limit: 3s between calls to stay under Printify limits
-            time.sleep(3)
-        except requests.HTTPError as e:
-            print(f"| {i} | {pid} | {title} | FAILED ({e.response.status_code}) |")
-            print(f"[ERROR] {e.response.text}")
-            failed += 1
-            # If still rate-limited after retries, pause longer before continuing
-            if e.response.status_code == 429:
-                print(f"[RATE_LIMIT] Pausing 60s before continuing...")
-                time.sleep(60)
+    return success, failed, time.monotonic() - started
 
-    return success, failed
 
+def confirm(fab, index, product_ids, timeout, poll_interval=CONFIRM_POLL):
+    """
+    Re-list the shop (one concurrent listing pass per poll, never a GET per
+    product) until every swept product is visible and linked, or `timeout`
+    passes. Returns the ids still hidden or unpublished.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        index.rebuild(fab)
+        leftovers = [pid for pid in product_ids
+                     if index.get(pid) and (is_hidden(index.get(pid)) or is_unpublished(index.get(pid)))]
+        if not leftovers or time.monotonic() + poll_interval > deadline:
+            return leftovers
+        print(f"[SYSTEM_LOG] Waiting on Shopify sync for {len(leftovers)} product(s)...")
+        time.sleep(poll_interval)
 
-def main():
-    dry_run = "--dry-run" in sys.argv
-    hidden_only = "--hidden-only" in sys.argv
-    unpublished_only = "--unpublished-only" in sys.argv
-
-    shop_id = get_printify_shop_id()
-    if not shop_id:
-        shop_id = get_shop_id()
-
-    print(f"[SYSTEM_LOG] Shop ID: {shop_id}")
-    print(f"[SYSTEM_LOG] Mode: {'DRY RUN' if dry_run else 'LIVE'}")
-    print(f"[SYSTEM_LOG] Fetching all products...")
 
-    products = get_all_products_paginated(shop_id)
+def main():
+    parser = argparse.ArgumentParser(description="Publish hidden and unpublished Printify products to Shopify")
+    parser.add_argument("--dry-run", action="store_true", help="Preview without changes")
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument("--hidden-only", action="store_true", help="Only unhide hidden products")
+    scope.add_argument("--unpublished-only", action="store_true", help="Only publish unpublished products")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Publishes in flight (default 4)")
+    parser.add_argument("--confirm", action="store_true", help="Re-list the shop after the sweep until every product shows as live")
+    parser.add_argument("--confirm-timeout", type=int, default=300, help="Seconds --confirm waits for the sync (default 300)")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint")
+    args = parser.parse_args()
+
+    fab = Fabricator(shop_id=os.getenv("PRINTIFY_SHOP_ID") or os.getenv("printify_shop_id"))
+    mode = "hidden" if args.hidden_only else "unpublished" if args.unpublished_only else "all"
+
+    print(f"[SYSTEM_LOG] Shop ID: {fab.shop_id}")
+    print(f"[SYSTEM_LOG] Mode: {'DRY RUN' if args.dry_run else 'LIVE'} ({mode})")
+
+    index = ProductIndex()
+    index.refresh(fab, max_age=INDEX_MAX_AGE)
+    products = index.where(lambda p: not p.get("is_deleted"))
     print(f"[SYSTEM_LOG] Total products found: {len(products)}")
 
     hidden = [p for p in products if is_hidden(p)]
     unpublished = [p for p in products if is_unpublished(p)]
-
     print(f"[SYSTEM_LOG] Hidden products (visible=false): {len(hidden)}")
     print(f"[SYSTEM_LOG] Unpublished products (no Shopify link): {len(unpublished)}")
 
-    total_success = 0
-    total_failed = 0
+    targets = []
+    if not args.unpublished_only:
+        targets += [(p, "UNHIDE") for p in hidden]
+    if not args.hidden_only:
+        targets += [(p, "PUBLISH") for p in unpublished]
 
-    if not unpublished_only:
-        s, f = process_products(hidden, "hidden", "UNHIDE", shop_id, dry_run)
-        total_success += s
-        total_failed += f
+    if not targets:
+        print("\n[SYSTEM_LOG] No actionable products found. Nothing to do.")
+        return
 
-    if not hidden_only:
-        s, f = process_products(unpublished, "unpublished", "PUBLISH", shop_id, dry_run)
-        total_success += s
-        total_failed += f
+    if args.dry_run:
+        print("| # | Product ID | Title | Status |")
+        print("|---|------------|-------|--------|")
+        for i, (p, action) in enumerate(targets, 1):
+            print(f"| {i} | {p['id']} | {p.get('title', 'Unknown')} | WOULD {action} |")
+        print(f"\n[SYSTEM_LOG] Dry run complete. {len(targets)} products would be processed.")
+        return
 
-    target_count = 0
-    if not unpublished_only:
-        target_count += len(hidden)
-    if not hidden_only:
-        target_count += len(unpublished)
+    checkpoint = SweepCheckpoint(mode, restart=args.restart)
+    pending = [(p, a) for p, a in targets if p["id"] not in checkpoint.done]
+    if len(pending) < len(targets):
+        print(f"[SYSTEM_LOG] Resuming sweep: {len(targets) - len(pending)} already published, {len(pending)} left.")
 
-    if target_count == 0:
-        print("\n[SYSTEM_LOG] No actionable products found. Nothing to do.")
-        return
+    budget = budget_per_minute("/publish.json")
+    eta = len(pending) / budget if budget else 0
+    print(f"[SYSTEM_LOG] Publish budget: {budget:.1f}/min — {len(pending)} publish(es), ~{eta:.1f} min at the limit.")
 
+    success, failed, elapsed = sweep(fab, pending, checkpoint, max(1, args.workers))
+    rate = success / (elapsed / 60) if elapsed > 0 else 0
     print()
-    if dry_run:
-        print(f"[SYSTEM_LOG] Dry run complete. {target_count} products would be processed.")
-    else:
-        print(f"[SYSTEM_LOG] Complete. Success: {total_success} | Failed: {total_failed}")
+    print(f"[SYSTEM_LOG] Complete. Success: {success} | Failed: {failed} | "
+          f"{elapsed:.0f}s ({rate:.1f}/min of {budget:.1f}/min budget)")
+
+    if failed:
+        print(f"[SYSTEM_LOG] Checkpoint kept at {checkpoint.path}; re-run to retry the failures.")
+    if args.confirm:
+        leftovers = confirm(fab, index, [p["id"] for p, _ in targets], args.confirm_timeout)
+        if leftovers:
+            # Un-settle them so the next run publishes them again.
+            for pid in leftovers:
+                checkpoint.record(pid, error="not live after publish")
+            print(f"[SYSTEM_WARNING] {len(leftovers)} product(s) still hidden/unpublished: {', '.join(leftovers)}")
+            print(f"[SYSTEM_LOG] Checkpoint kept at {checkpoint.path}.")
+            return
+        print("[SYSTEM_LOG] Confirmed: every swept product is published and visible.")
+    if not failed:
+        checkpoint.clear()
 
 
 if __name__ == "__main__":
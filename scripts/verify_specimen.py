@@ -20,6 +20,12 @@ What it does:
 Usage:
     python3 scripts/verify_specimen.py <PRINTIFY_PRODUCT_ID>
     python3 scripts/verify_specimen.py <PRINTIFY_PRODUCT_ID> --dry-run
+    python3 scripts/verify_specimen.py --from-file ids.txt --workers 4
+    python3 scripts/verify_specimen.py --all-unverified --workers 4 --manifest out.json
+
+Batch mode (--from-file / --all-unverified) is always non-interactive: any step
+that would prompt the Specialist fails that specimen instead, and a JSON result
+manifest is written to artifacts/verification/.
 """
 
 import argparse
@@ -29,7 +35,9 @@ import json
 import os
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
@@ -42,8 +50,11 @@ sys.path.insert(0, str(ROOT))
 load_dotenv(dotenv_path=ROOT / ".env")
 
 from agents.skills.fabricator.fabricator import Fabricator, parse_blueprint_metadata
+from agents.skills.fabricator.product_index import ProductIndex
+from agents.skills.fabricator.catalog_mirror import CatalogMirror
+from agents.skills.fabricator.stamp_compositor import composite_stamp
 from agents.skills.nanobanana_skill.nanobanana_skill import generate_nano_banana_image
-from agents.skills.shopify_skill import ShopifyConduit
+from agents.skills.shopify_skill import ShopifyConduit, StoreIndex
 from scripts.fabricate_specimen_v2 import synthesize_lifestyle_mockup
 from scripts.publish_printify_product import (
     get_printify_shop_id,
@@ -56,6 +67,8 @@ from scripts.printify_markup import get_product, get_printify_api_key, get_shop_
 GOOSE_LOGO_PATH = ROOT / "artifacts/graphics/logos/green_goose.png"
 MAX_TITLE_LENGTH = 255
 PRINTIFY_API_BASE = "https://api.printify.com/v1"
+MANIFEST_DIR = ROOT / "artifacts/verification"
+DEFAULT_WORKERS = 3
 
 # Standard Printify EU/GPSR compliance block — same for all Printify-fulfilled products.
 # EU representative: HONSON VENTURES LIMITED (Printify's designated EU rep).
@@ -74,8 +87,20 @@ def _ts() -> str:
     return time.strftime("%Y-%m-%d %H:%M:%S")
 
 
+_log_ctx = threading.local()
+
+
 def _log(msg: str) -> None:
-    print(f"[{_ts()}] {msg}")
+    tag = getattr(_log_ctx, "tag", None)
+    print(f"[{_ts()}] {f'<{tag}> ' if tag else ''}{msg}")
+
+
+def _ask(question: str, batch: bool) -> str:
+    """input() for interactive runs; batch runs never block and get an empty answer."""
+    if batch:
+        _log(f"[BATCH]: Non-interactive — declining prompt: {question.strip()}")
+        return ""
+    return input(question)
 
 
 # ── Printify helpers ──────────────────────────────────────────────────────────
@@ -115,11 +140,10 @@ def get_shopify_product(conduit: ShopifyConduit, shopify_id: int) -> dict:
 
 
 def find_shopify_product_by_title_fragment(conduit: ShopifyConduit, fragment: str) -> dict | None:
-    """Scan Shopify products for one whose title contains `fragment`."""
-    products = conduit.list_products(limit=250)
-    for p in products:
-        if fragment in p.get("title", ""):
-            return conduit.get_product(p["id"])
+    """Look up a Shopify product whose title contains `fragment` in the local store index."""
+    hit = StoreIndex.shared(conduit).find_product_by_title_fragment(fragment)
+    if hit:
+        return conduit.get_product(hit["id"])
     return None
 
 
@@ -163,8 +187,8 @@ def ensure_lore_collections(conduit: ShopifyConduit, title: str, dry_run: bool =
 
     _log(f"[SYSTEM_LOG]: Lore names for collection check: {lore_names}")
 
-    existing = conduit.get_all_smart_collections()
-    existing_titles = {c["title"].upper() for c in existing}
+    index = StoreIndex.shared(conduit)
+    existing_titles = index.collection_titles(smart_only=True)
 
     for name in lore_names:
         col_title = f"[{name.upper()}]"
@@ -179,19 +203,25 @@ def ensure_lore_collections(conduit: ShopifyConduit, title: str, dry_run: bool =
 
         _log(f"[SYSTEM_LOG]: Creating smart collection {col_title!r} (title contains {filter_str!r})...")
         try:
-            conduit.create_smart_collection(
-                title=col_title,
+            col = index.ensure_smart_collection(
+                col_title,
                 rules=[{"column": "title", "relation": "contains", "condition": filter_str}],
             )
-            _log(f"[SYSTEM_LOG]: Smart collection created: {col_title!r}")
+            if col:
+                _log(f"[SYSTEM_LOG]: Smart collection created: {col_title!r}")
+            else:
+                _log(f"[SYSTEM_LOG]: Collection created concurrently by another worker: {col_title!r}")
         except Exception as e:
             _log(f"[SYSTEM_WARNING]: Failed to create collection {col_title!r}: {e}")
 
 
 def create_shopify_redirect(conduit: ShopifyConduit, from_path: str, to_path: str) -> dict:
-    """Create a URL redirect in Shopify (from_path → to_path)."""
-    redirect = conduit.create_redirect(from_path, to_path)
-    _log(f"[SYSTEM_LOG]: Redirect created: {from_path} → {to_path} (id={redirect.get('id')})")
+    """Ensure a URL redirect in Shopify (from_path → to_path) via the cached registry."""
+    redirect = StoreIndex.shared(conduit).ensure_redirect(from_path, to_path)
+    if redirect is None:
+        _log(f"[SYSTEM_LOG]: Redirect already present: {from_path} → {to_path}")
+        return {}
+    _log(f"[SYSTEM_LOG]: Redirect set: {from_path} → {to_path} (id={redirect.get('id')})")
     return redirect
 
 
@@ -214,14 +244,7 @@ def apply_goose_stamp(image_path: str, goose_path: Path = GOOSE_LOGO_PATH) -> st
         return image_path
 
     try:
-        base_img = Image.open(image_path).convert("RGBA")
-        stamp_size = max(int(base_img.width * 0.12), 48)
-        goose = _resize_goose_to_match(goose_path, (stamp_size, stamp_size))
-        padding = int(base_img.width * 0.03)
-        x = base_img.width - stamp_size - padding
-        y = base_img.height - stamp_size - padding
-        base_img.paste(goose, (x, y), goose)
-        base_img.save(image_path)
+        x, y, stamp_size = composite_stamp(image_path, goose_path)
         _log(f"// GOOSE_STAMP_APPLIED @ ({x}, {y}) size={stamp_size}px")
         return image_path
     except Exception as e:
@@ -257,7 +280,7 @@ def build_new_title(prefix: str, product_type: str, printify_id: str) -> str:
 
 def fetch_blueprint_meta(product: dict) -> dict:
     """
-    Fetch the Printify catalog blueprint title and parse it into a metadata dict
+    Look up the blueprint title in the local catalog mirror and parse it into a metadata dict
     (gender, garment, model, tags, product_type) using parse_blueprint_metadata.
     Returns {} on failure.
     """
@@ -265,10 +288,7 @@ def fetch_blueprint_meta(product: dict) -> dict:
     if not blueprint_id:
         return {}
     try:
-        url = f"{PRINTIFY_API_BASE}/catalog/blueprints/{blueprint_id}.json"
-        resp = requests.get(url, headers=_printify_headers())
-        resp.raise_for_status()
-        bp_title = resp.json().get("title", "")
+        bp_title = CatalogMirror.shared(token=get_printify_api_key()).blueprint(blueprint_id).get("title", "")
         return parse_blueprint_metadata(bp_title)
     except Exception as e:
         _log(f"[SYSTEM_WARNING]: Failed to fetch blueprint metadata: {e}")
@@ -510,17 +530,30 @@ def prompt_model_overrides(blueprint_meta: dict, product_title: str, printify_pr
 
 # ── Main verification flow ────────────────────────────────────────────────────
 
-def verify_specimen(printify_id: str, dry_run: bool = False, batch: bool = False) -> bool:
+def verify_specimen(
+    printify_id: str,
+    dry_run: bool = False,
+    batch: bool = False,
+    fab: Fabricator | None = None,
+    conduit: ShopifyConduit | None = None,
+    report: dict | None = None,
+) -> bool:
     """
     Full verification ritual for a single UNVERIFIED SPECIMEN.
     Returns True on success, False on unrecoverable failure.
+
+    Pass `fab` / `conduit` to share sessions across calls (batch workers do).
+    When `report` is given it is filled with the outcome (new_title,
+    shopify_id, handle, lifestyle_path) for the batch manifest.
     """
     _log(f"[SYSTEM_LOG]: ═══ VERIFICATION RITUAL INITIATED ═══")
     _log(f"[SYSTEM_LOG]: Target Specimen: {printify_id}")
 
-    shop_id = get_printify_shop_id() or get_shop_id()
-    fab = Fabricator(shop_id=shop_id)
-    conduit = ShopifyConduit()
+    if report is None:
+        report = {}
+    shop_id = fab.shop_id if fab else (get_printify_shop_id() or get_shop_id())
+    fab = fab or Fabricator(shop_id=shop_id)
+    conduit = conduit or ShopifyConduit()
 
     # ── 1. Fetch Printify product ─────────────────────────────────────────────
     _log("[SYSTEM_LOG]: Fetching Printify product data...")
@@ -536,7 +569,7 @@ def verify_specimen(printify_id: str, dry_run: bool = False, batch: bool = False
     if not current_title.upper().startswith("UNVERIFIED SPECIMEN"):
         _log(f"[SYSTEM_WARNING]: Product title does not start with 'UNVERIFIED SPECIMEN'.")
         _log(f"  Current title: {current_title!r}")
-        answer = input("  This product may already be verified or have an unexpected title. Continue anyway? [y/N] ").strip().lower()
+        answer = _ask("  This product may already be verified or have an unexpected title. Continue anyway? [y/N] ", batch).strip().lower()
         if answer != "y":
             _log("[SYSTEM_LOG]: Verification aborted by operator.")
             return False
@@ -565,7 +598,7 @@ def verify_specimen(printify_id: str, dry_run: bool = False, batch: bool = False
         else:
             _log(f"[SYSTEM_ERROR]: Shopify product not found for {printify_id}.")
             _log("  The product may not have been published to Shopify yet.")
-            answer = input("  Continue verification without Shopify sync? [y/N] ").strip().lower()
+            answer = _ask("  Continue verification without Shopify sync? [y/N] ", batch).strip().lower()
             if answer != "y":
                 return False
 
@@ -631,7 +664,7 @@ def verify_specimen(printify_id: str, dry_run: bool = False, batch: bool = False
                     _log(f"[SYSTEM_WARNING]: Failed to update Shopify product_type: {e}")
         else:
             _log("[SYSTEM_WARNING]: Could not infer product_type from blueprint.")
-            product_type = input("  Enter product_type manually (e.g. 'Beach Shorts'): ").strip()
+            product_type = _ask("  Enter product_type manually (e.g. 'Beach Shorts'): ", batch).strip()
             if not product_type:
                 _log("[SYSTEM_ERROR]: product_type is required. Aborting.")
                 return False
@@ -659,7 +692,7 @@ def verify_specimen(printify_id: str, dry_run: bool = False, batch: bool = False
         _log("[SYSTEM_WARNING]: Could not parse a prefix from the description.")
         _log(f"  Description: {description[:120]!r}")
         _log("  Expected format: 'CBG Studio | ... [theme]:...'")
-        answer = input("  Enter the title prefix manually (e.g. 'CBG Studio | REMIX [A x B]'), or leave blank to abort: ").strip()
+        answer = _ask("  Enter the title prefix manually (e.g. 'CBG Studio | REMIX [A x B]'), or leave blank to abort: ", batch).strip()
         if not answer:
             _log("[SYSTEM_ERROR]: No title prefix available. Aborting.")
             return False
@@ -667,6 +700,7 @@ def verify_specimen(printify_id: str, dry_run: bool = False, batch: bool = False
 
     # ── 5. Build and validate new title ──────────────────────────────────────
     new_title = build_new_title(prefix, product_type, printify_id)
+    report["new_title"] = new_title
     _log(f"[SYSTEM_LOG]: New title: {new_title!r}")
     _log(f"[SYSTEM_LOG]: Title length: {len(new_title)} / {MAX_TITLE_LENGTH} chars")
 
@@ -709,7 +743,7 @@ def verify_specimen(printify_id: str, dry_run: bool = False, batch: bool = False
 
         # Resize goose to match and save to a temp file
         resized_goose = _resize_goose_to_match(GOOSE_LOGO_PATH, ref_size)
-        tmp_goose_path = ROOT / "artifacts/graphics/logos/_goose_resized_tmp.png"
+        tmp_goose_path = ROOT / f"artifacts/graphics/logos/_goose_resized_tmp_{printify_id}.png"
         resized_goose.save(str(tmp_goose_path))
         _log(f"[SYSTEM_LOG]: Goose resized to {ref_size[0]}×{ref_size[1]}px → {tmp_goose_path.name}")
 
@@ -903,6 +937,11 @@ def verify_specimen(printify_id: str, dry_run: bool = False, batch: bool = False
         except Exception as e:
             _log(f"[SYSTEM_WARNING]: Collection check/create failed: {e}")
 
+    report.update({
+        "shopify_id": shopify_id,
+        "handle": new_handle if shopify_id else None,
+        "lifestyle_path": lifestyle_path,
+    })
     _log(f"[SYSTEM_SUCCESS]: ═══ SPECIMEN VERIFIED ═══")
     _log(f"  Printify ID  : {printify_id}")
     _log(f"  New title    : {new_title}")
@@ -911,6 +950,81 @@ def verify_specimen(printify_id: str, dry_run: bool = False, batch: bool = False
     return True
 
 
+# ── Batch verification ────────────────────────────────────────────────────────
+
+def load_ids_from_file(path: str) -> list[str]:
+    """One Printify ID per line; blank lines and '#' comments are ignored."""
+    ids = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            ids.append(line)
+    return ids
+
+
+def collect_unverified_ids(fab: Fabricator) -> list[str]:
+    """Candidates from the local product index (refreshed if stale)."""
+    index = ProductIndex()
+    index.refresh(fab)
+    rows = sorted(index.unverified(), key=lambda p: p.get("created_at") or "")
+    return [p["id"] for p in rows if not p.get("is_deleted")]
+
+
+def verify_batch(printify_ids: list[str], workers: int = DEFAULT_WORKERS, dry_run: bool = False) -> list[dict]:
+    """
+    Verify many specimens non-interactively in a bounded worker pool.
+    All workers share one Fabricator and one ShopifyConduit (and therefore their
+    pooled HTTP sessions and the Shopify leaky bucket).
+    Returns one result dict per ID, in input order.
+    """
+    shop_id = get_printify_shop_id() or get_shop_id()
+    fab = Fabricator(shop_id=shop_id)
+    conduit = ShopifyConduit()
+    # Blogs / publications / shop info once up front, not per collection or article
+    conduit.warm_metadata()
+
+    def _run(printify_id: str) -> dict:
+        _log_ctx.tag = printify_id[-6:]
+        result = {"printify_id": printify_id, "started_at": _ts()}
+        t0 = time.monotonic()
+        try:
+            result["ok"] = verify_specimen(
+                printify_id, dry_run=dry_run, batch=True, fab=fab, conduit=conduit, report=result
+            )
+        except Exception as e:
+            _log(f"[SYSTEM_ERROR]: Verification crashed: {e}")
+            result["ok"] = False
+            result["error"] = str(e)
+        finally:
+            _log_ctx.tag = None
+        result["elapsed_s"] = round(time.monotonic() - t0, 1)
+        return result
+
+    _log(f"[SYSTEM_LOG]: Batch verification — {len(printify_ids)} specimen(s), {workers} worker(s).")
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return list(pool.map(_run, printify_ids))
+
+
+def write_manifest(results: list[dict], path: str | None = None, dry_run: bool = False) -> Path:
+    """Write the machine-readable batch result manifest."""
+    if path:
+        manifest_path = Path(path)
+    else:
+        manifest_path = MANIFEST_DIR / f"verify_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "generated_at": _ts(),
+        "dry_run": dry_run,
+        "total": len(results),
+        "verified": sum(1 for r in results if r.get("ok")),
+        "failed": sum(1 for r in results if not r.get("ok")),
+        "results": results,
+    }
+    manifest_path.write_text(json.dumps(manifest, indent=2, default=str), encoding="utf-8")
+    _log(f"[SYSTEM_LOG]: Manifest written → {manifest_path}")
+    return manifest_path
+
+
 # ── CLI entrypoint ────────────────────────────────────────────────────────────
 
 def main():
@@ -918,7 +1032,7 @@ def main():
         description="VERIFY SPECIMEN — transition an UNVERIFIED SPECIMEN to a branded product.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
-    parser.add_argument("printify_id", help="Printify product ID to verify.")
+    parser.add_argument("printify_id", nargs="?", help="Printify product ID to verify.")
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -929,8 +1043,39 @@ def main():
         action="store_true",
         help="Skip interactive prompts and use auto-detected defaults for all model overrides.",
     )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--from-file", metavar="PATH", help="Verify every Printify ID listed in PATH (one per line).")
+    source.add_argument(
+        "--all-unverified",
+        action="store_true",
+        help="Verify every UNVERIFIED SPECIMEN in the local product index.",
+    )
+    parser.add_argument("--workers", "-w", type=int, default=DEFAULT_WORKERS, help="Parallel verifications in batch mode.")
+    parser.add_argument("--limit", type=int, default=None, help="Cap the number of specimens taken in batch mode.")
+    parser.add_argument("--manifest", metavar="PATH", help="Result manifest path (default: artifacts/verification/).")
     args = parser.parse_args()
 
+    if args.from_file or args.all_unverified:
+        if args.from_file:
+            ids = load_ids_from_file(args.from_file)
+        else:
+            ids = collect_unverified_ids(Fabricator(shop_id=get_printify_shop_id() or get_shop_id()))
+        if args.limit:
+            ids = ids[:args.limit]
+        if not ids:
+            _log("[SYSTEM_LOG]: No specimens to verify.")
+            sys.exit(0)
+        results = verify_batch(ids, workers=args.workers, dry_run=args.dry_run)
+        write_manifest(results, args.manifest, dry_run=args.dry_run)
+        failed = [r["printify_id"] for r in results if not r.get("ok")]
+        _log(f"[SYSTEM_LOG]: Batch complete — {len(results) - len(failed)}/{len(results)} verified.")
+        if failed:
+            _log(f"[SYSTEM_WARNING]: Failed: {', '.join(failed)}")
+        sys.exit(0 if not failed else 1)
+
+    if not args.printify_id:
+        parser.error("printify_id is required unless --from-file or --all-unverified is given.")
+
     success = verify_specimen(args.printify_id, dry_run=args.dry_run, batch=args.batch)
     sys.exit(0 if success else 1)
 
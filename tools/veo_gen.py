@@ -31,6 +31,7 @@ import random
 import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests as _requests
@@ -44,6 +45,9 @@ load_dotenv(dotenv_path=ROOT / ".env")
 
 from scripts.printify_markup import get_printify_api_key, get_product, get_shop_id
 from agents.skills.fabricator.fabricator import parse_blueprint_metadata
+from agents.skills.fabricator import mockup_cache
+from agents.skills.gemini_skill.image_context import prepare_reference, VEO_EDGE
+from agents.skills.fabricator.catalog_mirror import CatalogMirror
 
 # ── Constants ──────────────────────────────────────────────────────────────────
 DEFAULT_MODEL       = "veo-3.1-generate-preview"
@@ -76,7 +80,7 @@ def extract_sizes(product: dict) -> list[str]:
 
 def get_blueprint_meta(product: dict) -> dict:
     """
-    Fetch the Printify catalog blueprint title and parse gender/garment/model
+    Look up the blueprint title in the local catalog mirror and parse gender/garment/model
     using the same parse_blueprint_metadata logic as verify_specimen.
     Falls back to empty dict on failure.
     """
@@ -84,11 +88,7 @@ def get_blueprint_meta(product: dict) -> dict:
     if not blueprint_id:
         return {}
     try:
-        api_key = get_printify_api_key()
-        url = f"https://api.printify.com/v1/catalog/blueprints/{blueprint_id}.json"
-        resp = _requests.get(url, headers={"Authorization": f"Bearer {api_key}"}, timeout=15)
-        resp.raise_for_status()
-        bp_title = resp.json().get("title", "")
+        bp_title = CatalogMirror.shared(token=get_printify_api_key()).blueprint(blueprint_id).get("title", "")
         return parse_blueprint_metadata(bp_title)
     except Exception as exc:
         print(f"[SYSTEM_WARNING]: Could not fetch blueprint metadata — {exc}")
@@ -152,10 +152,8 @@ def select_reference_images(
     return flat_front, person_front, flat_back, person_back
 
 def fetch_image_bytes(url: str) -> bytes:
-    """Download an image from a URL and return raw bytes."""
-    resp = _requests.get(url, timeout=30)
-    resp.raise_for_status()
-    return resp.content
+    """Return an image's raw bytes via the shared mockup cache (downloads only on a miss)."""
+    return mockup_cache.fetch_bytes(url)
 
 
 def _mime(url: str) -> str:
@@ -725,6 +723,12 @@ def main() -> None:
     else:
         print("[SYSTEM_LOG]: No person-back image found.")
 
+    # ── Reference images: fetch concurrently in the background ────────────────
+    # Runs during dry runs too, so the real run that follows is a pure cache hit.
+    ref_urls = [flat_url, person_url, flat_back_url, person_back_url]
+    prefetch_pool = ThreadPoolExecutor(max_workers=1)
+    prefetch = prefetch_pool.submit(mockup_cache.fetch_many, ref_urls)
+
     # ── Goose detection ────────────────────────────────────────────────────────
     goose = has_goose_logo(product)
     if goose:
@@ -788,35 +792,47 @@ def main() -> None:
     ts = time.strftime("%Y%m%d_%H%M%S")
     out_path = args.out_dir / f"{safe_id}_{ts}.mp4"
 
-    # ── Fetch image bytes (skip in dry-run to avoid latency) ───────────────────
-    if not args.dry_run:
-        print("[SYSTEM_LOG]: Downloading reference images …")
-        try:
-            flat_bytes = fetch_image_bytes(flat_url)
-            person_bytes = fetch_image_bytes(person_url) if person_url else None
-            flat_back_bytes = fetch_image_bytes(flat_back_url) if flat_back_url else None
-            person_back_bytes = fetch_image_bytes(person_back_url) if person_back_url else None
-        except Exception as exc:
+    # ── Collect image bytes (prefetched concurrently above) ────────────────────
+    try:
+        ref_paths = prefetch.result()
+    except Exception as exc:
+        ref_paths = None
+        if not args.dry_run:
             print(f"[SIGNAL_LOSS]: Could not download image — {exc}")
             sys.exit(1)
+        print(f"[SYSTEM_WARNING]: Reference prefetch failed — {exc}")
+    finally:
+        prefetch_pool.shutdown()
+
+    def _read(url: str | None):
+        # Downscaled + encoded once per image (cached across runs), sent as-is.
+        return prepare_reference(ref_paths[url], max_edge=VEO_EDGE) if url and ref_paths else None
+
+    def _bytes(ref):
+        return ref.data if ref is not None else None
+
+    def _mime_of(ref, url):
+        return ref.mime_type if ref is not None else (_mime(url) if url else None)
+
+    if not args.dry_run:
+        print(f"[SYSTEM_LOG]: Reference images ready ({len(ref_paths)} cached).")
+        flat, person = _read(flat_url), _read(person_url)
+        flat_back, person_back = _read(flat_back_url), _read(person_back_url)
     else:
-        flat_bytes = b""
-        person_bytes = None
-        flat_back_bytes = None
-        person_back_bytes = None
+        flat = person = flat_back = person_back = None
 
     # ── Generate ───────────────────────────────────────────────────────────────
     generate_video(
         model=args.model,
         prompt=prompt,
-        flat_bytes=flat_bytes,
-        flat_mime=_mime(flat_url),
-        person_bytes=person_bytes,
-        person_mime=_mime(person_url) if person_url else None,
-        flat_back_bytes=flat_back_bytes,
-        flat_back_mime=_mime(flat_back_url) if flat_back_url else None,
-        person_back_bytes=person_back_bytes,
-        person_back_mime=_mime(person_back_url) if person_back_url else None,
+        flat_bytes=_bytes(flat) or b"",
+        flat_mime=_mime_of(flat, flat_url),
+        person_bytes=_bytes(person),
+        person_mime=_mime_of(person, person_url),
+        flat_back_bytes=_bytes(flat_back),
+        flat_back_mime=_mime_of(flat_back, flat_back_url),
+        person_back_bytes=_bytes(person_back),
+        person_back_mime=_mime_of(person_back, person_back_url),
         duration=args.duration,
         dry_run=args.dry_run,
         out_path=out_path,